@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""
+Microbenchmark for response header parsing.
+
+Runs ResponseHeaderParser over a corpus of recorded header blocks and
+reports throughput. The corpus is a file of raw response headers (as
+they'd appear on the wire, without the status line), with a blank line
+between responses; if none is given, a small built-in one is used.
+
+  bench/header_parse.py [-n iterations] [corpus_file]
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import sys
+import time
+from optparse import OptionParser
+
+from redbot.response_analyse import ResponseHeaderParser
+
+default_corpus = """\
+Date: Tue, 08 Jun 2010 05:49:01 GMT
+Server: Apache/2.2.14 (Unix) mod_ssl/2.2.14 OpenSSL/0.9.8l
+Last-Modified: Mon, 07 Jun 2010 22:13:34 GMT
+ETag: "1c1a2e-3c5d-48878b9e8e380"
+Accept-Ranges: bytes
+Content-Length: 15453
+Cache-Control: max-age=3600, public
+Expires: Tue, 08 Jun 2010 06:49:01 GMT
+Vary: Accept-Encoding
+Content-Encoding: gzip
+Content-Type: text/html; charset=utf-8
+
+Date: Tue, 08 Jun 2010 05:49:02 GMT
+Server: nginx/0.7.65
+Content-Type: text/javascript; charset="iso-8859-1"
+Transfer-Encoding: chunked
+Connection: keep-alive
+Keep-Alive: timeout=20, max=100
+Cache-Control: private, no-cache="Set-Cookie", max-age=0
+Pragma: no-cache
+Set-Cookie: session=abc123; path=/; expires=Wed, 09 Jun 2010 05:49:02 GMT
+Via: 1.1 cache.example.com (squid/3.0.STABLE19), 1.0 proxy (Apache (Unix))
+X-Cache: MISS from cache.example.com
+
+Date: Tue, 08 Jun 2010 05:49:03 GMT
+Location: /elsewhere/
+Content-Length: 0
+Age: 12
+Allow: GET, HEAD, OPTIONS
+X-Frame-Options: SAMEORIGIN
+X-Content-Type-Options: nosniff
+X-XSS-Protection: 0
+X-UA-Compatible: IE=Edge, chrome=1
+Retry-After: 120
+"""
+
+
+class BenchRed(object):
+    "Just enough of a RedFetcher for the header parser."
+    def __init__(self, hdrs):
+        self.uri = "http://www.example.com/"
+        self.res_status = "200"
+        self.res_phrase = "OK"
+        self.res_ts = time.time()
+        self.res_hdrs = hdrs
+        self.parsed_hdrs = {}
+        self.messages = []
+
+    def setMessage(self, subject, msg, subreq=None, **vars):
+        self.messages.append((subject, msg))
+
+
+def load_corpus(text):
+    "Parse a corpus into a list of header lists."
+    blocks = []
+    hdrs = []
+    for line in text.splitlines() + [""]:
+        line = line.rstrip("\r")
+        if not line:
+            if hdrs:
+                blocks.append(hdrs)
+            hdrs = []
+            continue
+        if line[0] in " \t" and hdrs: # obs-fold
+            name, value = hdrs[-1]
+            hdrs[-1] = (name, value + " " + line.strip())
+            continue
+        try:
+            name, value = line.split(":", 1)
+        except ValueError:
+            continue
+        hdrs.append((name, value.strip()))
+    return blocks
+
+
+def main():
+    option_parser = OptionParser(usage="Usage: %prog [options] [corpus_file]")
+    option_parser.set_defaults(iterations=2000)
+    option_parser.add_option("-n", "--iterations", type="int",
+                             action="store", dest="iterations",
+                             help="times to parse the whole corpus")
+    (options, args) = option_parser.parse_args()
+
+    if args:
+        corpus = load_corpus(open(args[0]).read())
+    else:
+        corpus = load_corpus(default_corpus)
+    if not corpus:
+        option_parser.error("No header blocks found in corpus.")
+
+    ResponseHeaderParser(BenchRed(corpus[0])) # warm up
+    start = time.time()
+    for i in xrange(options.iterations):
+        for hdrs in corpus:
+            ResponseHeaderParser(BenchRed(hdrs))
+    elapsed = time.time() - start
+
+    responses = options.iterations * len(corpus)
+    fields = options.iterations * sum([len(h) for h in corpus])
+    print "%i responses (%i header fields) in %.3f seconds" % (
+        responses, fields, elapsed)
+    print "%.1f responses/sec, %.1f usec/response" % (
+        responses / elapsed, 1000000 * elapsed / responses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+"""
+Benchmark for highlighting links in the HTML body sample.
+
+Builds a large page with many links (or reads one from a file), then times
+highlighting them all in one scan, as the HTML formatter does, against
+running a substitution for each link in turn, checking that both give the
+same result.
+
+  bench/link_highlight.py [-n iterations] [-l links] [page_file]
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import re
+import time
+from cgi import escape as e
+from optparse import OptionParser
+
+from redbot.formatter.html import highlight_links
+
+link_re = re.compile(r"""(?:href|src)=['"]([^'"]*)['"]""")
+
+
+def make_page(links):
+    "Return a page (as unicode) with links links, of various kinds."
+    out = [u"<!DOCTYPE html>\n<html><head><title>Fixture</title>\n"]
+    for i in xrange(links):
+        if i % 10 == 0:
+            out.append(u"<link rel='stylesheet' href='/style/%i.css'>\n" % i)
+        elif i % 10 == 1:
+            out.append(u'<script src="/js/lib-%i.js"></script>\n' % i)
+        elif i % 10 == 2:
+            out.append(u'<img src="/img/%i.png" alt="Picture %i">\n' % (i, i))
+        else:
+            out.append(
+                u"<p class=\"entry\">It's entry %i; don't miss "
+                u"<a href=\"/archive/%i/%i/entry-%i.html\" "
+                u"title='Entry %i'>this one</a>.</p>\n" % (
+                    i, 2000 + i % 10, i % 12 + 1, i, i))
+    out.append(u"</html>\n")
+    return u"".join(out)
+
+
+def link_to(link):
+    return u"<a href='?uri=%s' class='nocode'>%s</a>" % (link, e(link))
+
+
+def highlight_each(text, links):
+    "Highlight links in text with a substitution for each link."
+    for link in links:
+        def sub(matchobj):
+            return u"%s%s%s" % (
+                matchobj.group(1), link_to(link), matchobj.group(1))
+        text = re.sub(r"(['\"])%s\1" % re.escape(link), sub, text)
+    return text
+
+
+def time_it(iterations, func, *args):
+    "Call func with args iterations times; return (seconds, last result)."
+    start = time.time()
+    for i in xrange(iterations):
+        result = func(*args)
+    return time.time() - start, result
+
+
+def main():
+    option_parser = OptionParser(
+        usage="Usage: %prog [options] [page_file]")
+    option_parser.set_defaults(iterations=5, links=1000)
+    option_parser.add_option("-n", "--iterations", type="int",
+                             action="store", dest="iterations",
+                             help="times to highlight the page")
+    option_parser.add_option("-l", "--links", type="int",
+                             action="store", dest="links",
+                             help="links in the generated page")
+    (options, args) = option_parser.parse_args()
+
+    if args:
+        page = unicode(open(args[0]).read(), 'utf-8', 'ignore')
+    else:
+        page = make_page(options.links)
+    links = set(link_re.findall(page))
+    if not links:
+        option_parser.error("No links found in page.")
+    sample = e(page)
+
+    print "%i links in %i characters" % (len(links), len(sample))
+    single, single_out = time_it(
+        options.iterations, highlight_links, sample, links, link_to)
+    each, each_out = time_it(
+        options.iterations, highlight_each, sample, links)
+    print "one scan:     %.1f ms/page" % (1000 * single / options.iterations)
+    print "one per link: %.1f ms/page" % (1000 * each / options.iterations)
+    if single_out != each_out:
+        print "WARNING: results differ"
+
+
+if __name__ == "__main__":
+    main()
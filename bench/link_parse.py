@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""
+Benchmark for the link parsers.
+
+Feeds pages to each kind of link parser (see redbot.link_parse.parsers) a
+chunk at a time, as they would arrive from the network, and reports how
+fast each finds links. Give it some large real-world pages to get an idea
+of how they'll do in practice; otherwise, it generates one.
+
+  bench/link_parse.py [-n iterations] [-c chunk_size] [page_file ...]
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import time
+from optparse import OptionParser
+
+from redbot.link_parse import parsers
+
+
+class BenchResponse(object):
+    "Just enough of a RedFetcher for the link parsers."
+    parsed_hdrs = {'content-type': ('text/html', {'charset': 'utf-8'})}
+
+
+def make_page(links):
+    "Return a page with links links, and the sort of things around them."
+    out = ["<!DOCTYPE html>\n<html><head><title>Fixture</title>\n",
+           "<meta http-equiv='Content-Type' content='text/html; "
+           "charset=utf-8'>\n<style>p > a { color: red; }</style>\n"]
+    for i in xrange(links):
+        if i % 20 == 0:
+            out.append("<script>var s = '<a href=\"/no\">'; // %i</script>\n"
+                       "<!-- <a href='/commented/%i'> -->\n" % (i, i))
+        out.append(
+            "<div class=\"entry\" id=\"e%i\"><h2>Entry %i</h2><p>It's "
+            "<em>entry</em> %i; see <a href=\"/archive/%i.html?a=1&amp;b=2\" "
+            "title='Entry %i'>this one</a> and <img src=\"/img/%i.png\" "
+            "alt=\"Picture %i\" width=100 height=100>.</p></div>\n" % (
+                i, i, i, i, i, i, i))
+    out.append("</body></html>\n")
+    return "".join(out)
+
+
+def parse(kind, page, chunk_size):
+    "Parse page with a kind parser; return the number of links found."
+    found = []
+    parser = parsers[kind](
+        "http://www.example.com/", lambda *args: found.append(args), None)
+    response = BenchResponse()
+    for i in xrange(0, len(page), chunk_size):
+        parser.feed(response, page[i:i + chunk_size])
+    return len(found)
+
+
+def main():
+    option_parser = OptionParser(
+        usage="Usage: %prog [options] [page_file ...]")
+    option_parser.set_defaults(iterations=10, chunk_size=4096)
+    option_parser.add_option("-n", "--iterations", type="int",
+                             action="store", dest="iterations",
+                             help="times to parse each page")
+    option_parser.add_option("-c", "--chunk-size", type="int",
+                             action="store", dest="chunk_size",
+                             help="bytes to feed the parser at a time")
+    (options, args) = option_parser.parse_args()
+
+    if args:
+        pages = [open(filename).read() for filename in args]
+    else:
+        pages = [make_page(2000)]
+    size = sum([len(page) for page in pages])
+
+    print "%i page(s), %i bytes, in %i byte chunks" % (
+        len(pages), size, options.chunk_size)
+    kinds = parsers.keys()
+    kinds.sort()
+    for kind in kinds:
+        links = sum([parse(kind, page, options.chunk_size) for page in pages])
+        start = time.time()
+        for i in xrange(options.iterations):
+            for page in pages:
+                parse(kind, page, options.chunk_size)
+        elapsed = time.time() - start
+        print "%-10s %6i links  %9.1f links/sec  %6.2f MB/sec" % (
+            kind, links, links * options.iterations / elapsed,
+            size * options.iterations / elapsed / (1024 * 1024))
+
+
+if __name__ == "__main__":
+    main()
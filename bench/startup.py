@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""
+Benchmark for start-up time.
+
+Imports the modules that bin/redbot needs in a fresh interpreter, several
+times over, and reports how long it takes, along with which of RED's
+modules ended up being loaded.
+
+  bench/startup.py [-n runs] [module ...]
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import subprocess
+import sys
+from optparse import OptionParser
+
+# what bin/redbot imports
+default_modules = ['redbot.droid', 'redbot.store', 'redbot.formatter']
+
+# run in a fresh interpreter; prints the time taken, then the modules loaded
+import_script = """\
+import sys, time
+start = time.time()
+for name in %r:
+    __import__(name)
+print time.time() - start
+print " ".join(sorted([n for n in sys.modules.keys()
+                       if n.startswith('redbot.') and sys.modules[n]]))
+"""
+
+
+def time_imports(modules):
+    "Import modules in a fresh interpreter; return (seconds, modules loaded)."
+    proc = subprocess.Popen([sys.executable, "-c", import_script % modules],
+                            stdout=subprocess.PIPE)
+    out = proc.communicate()[0]
+    if proc.returncode != 0:
+        raise RuntimeError, "Couldn't import %s." % ", ".join(modules)
+    elapsed, loaded = out.split("\n", 1)
+    return float(elapsed), loaded.split()
+
+
+def main():
+    option_parser = OptionParser(usage="Usage: %prog [options] [module ...]")
+    option_parser.set_defaults(runs=20)
+    option_parser.add_option("-n", "--runs", type="int",
+                             action="store", dest="runs",
+                             help="number of interpreters to start")
+    (options, args) = option_parser.parse_args()
+    modules = args or default_modules
+
+    time_imports(modules) # make sure they're compiled
+    times = []
+    for i in xrange(options.runs):
+        elapsed, loaded = time_imports(modules)
+        times.append(elapsed)
+    times.sort()
+
+    print "importing %s (%i runs)" % (", ".join(modules), options.runs)
+    print "min %.1f ms, median %.1f ms, max %.1f ms" % (
+        times[0] * 1000, times[len(times) / 2] * 1000, times[-1] * 1000)
+    print "loaded: %s" % " ".join(loaded)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,24 +27,27 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import asyncore
 import cgi
-import cPickle as pickle
-import gzip
+import errno
 import locale
+import mimetypes
 import os
 import pprint
 import shutil
+import signal
+import socket
 import sys
 import tempfile
 import time
 from urlparse import urlsplit
-import zlib
 
 assert sys.version_info[0] == 2 and sys.version_info[1] >= 5, \
     "Please use Python 2.5 or greater"
 
 import nbhttp
-from redbot import droid, fetch
+from nbhttp import get_hdr, push_tcp
+from redbot import droid, fetch, instrument, link_parse, store
 from redbot.formatter import find_formatter, html
 
 ### Configuration ##########################################################
@@ -66,12 +69,46 @@ save_dir = '/var/state/redbot/'
 # how long to store things when users save them, in days.
 save_days = 30
 
+# how many results can be waiting to be written to save_dir at once.
+save_backlog = 10
+
+# Where to cache results, so that repeated checks of the same URI (and
+# request headers) within cache_ttl seconds don't make any requests. None
+# to disable caching.
+cache_dir = None
+
+# how long to cache results for, in seconds.
+cache_ttl = 300
+
+# how many results to cache.
+cache_max = 1000
+
+# how many worker processes to use when running as a standalone server.
+server_workers = 4
+
+# how many checks a standalone server worker does before it's replaced;
+# None for no limit.
+max_worker_checks = 1000
+
+# Whether to profile RED's analysis stages; the results are included in HAR
+# output (as '_red_profile').
+instrument.enable(False)
+
+# How to find links in HTML responses; 'htmlparser' uses Python's HTMLParser
+# on the whole document, while 'scan' only looks at the tags RED is
+# interested in, which is much faster (but see link_parse.LinkScanner for
+# how it differs).
+link_parse.parser = 'htmlparser'
+
 # URI root for static assets (absolute or relative, but no trailing '/')
 html.static_root = 'static'
 
 # directory containing files to append to the front page; None to disable
 html.extra_dir = "extra"
 
+# how much of the response body to show, in bytes
+html.body_sample_size = 1024 * 128
+
 ### End configuration ######################################################
 
 
@@ -88,22 +125,36 @@ try:
 except:
     locale.setlocale(locale.LC_ALL, '')
 
+# writes results to save_dir without holding up responses
+result_writer = store.ResultWriter(save_backlog)
+
 class RedWebUi(object):
     """
     A Web UI for RED.
 
     Given a URI, run RED on it and present the results to output as HTML.
-    If descend is true, spider the links and present a summary.
+    If descend is true, spider the links and present a summary. If caching
+    is configured, a recent result may be shown instead, unless nocache
+    is true.
+
+    If done_cb is given, the caller is running the event loop (e.g., in a
+    server), and done_cb is called when the response is complete; otherwise,
+    the loop is run until the check is done (e.g., for CGI).
     """
     def __init__(self, test_id, test_uri, req_hdrs, base_uri, 
-        format, output_hdrs, output_body, descend=False, save=False):
+        format, output_hdrs, output_body, descend=False, save=False,
+        nocache=False, done_cb=None):
         self.output_body = output_body
+        self.done_cb = done_cb
         self.start = time.time()
-        timeout = nbhttp.schedule(max_runtime, self.timeoutError)
+        self.finished = False
+        self.session = None
+        self.running = False # whether we're running the event loop
+        self.timeout = nbhttp.schedule(max_runtime, self.timeoutError)
         if save and save_dir and test_id:
             try:
-                os.utime(
-                    os.path.join(save_dir, test_id), 
+                store.touch(
+                    os.path.join(save_dir, os.path.basename(test_id)), 
                     (
                         nbhttp.now(), 
                         nbhttp.now() + (save_days * 24 * 60 * 60)
@@ -123,62 +174,44 @@ class RedWebUi(object):
                 # TODO: better error message (through formatter?)
                 output_body(error_template % "Sorry, I couldn't save that.")
         elif test_id:
-            try:
-                test_id = os.path.basename(test_id)
-                fd = gzip.open(os.path.join(save_dir, test_id))
-                mtime = os.fstat(fd.fileno()).st_mtime
-            except (OSError, IOError, zlib.error):
-                output_hdrs("404 Not Found", [
-                    ("Content-Type", "text/html; charset=%s" % charset), 
-                    ("Cache-Control", "max-age=600, must-revalidate")
-                ])
-                # TODO: better error page (through formatter?)
-                self.output_body(error_template % 
-                    "I'm sorry, I can't find that saved response."
-                )
-                timeout.delete()
-                return
-            is_saved = mtime > nbhttp.now()
-            try:
-                ired = pickle.load(fd)
-            except (pickle.PickleError, EOFError):
-                output_hdrs("500 Internal Server Error", [
-                    ("Content-Type", "text/html; charset=%s" % charset), 
-                    ("Cache-Control", "max-age=600, must-revalidate")
-                ])
-                # TODO: better error page (through formatter?)
-                self.output_body(error_template % 
-                    "I'm sorry, I had a problem reading that response."
-                )
-                timeout.delete()
-                return
-            finally:
-                fd.close()
-            formatter = find_formatter(format, 'html', descend)(
-                base_uri, ired.uri, ired.orig_req_hdrs, lang, self.output,
-                allow_save=(not is_saved), is_saved=True, test_id=test_id
-            )
-            output_hdrs("200 OK", [
-                ("Content-Type", "%s; charset=%s" % (
-                    formatter.media_type, charset)), 
-                ("Cache-Control", "max-age=3600, must-revalidate")
-            ])
-            formatter.start_output()
-            formatter.finish_output(ired)
+            test_id = os.path.basename(test_id)
+            path = os.path.join(save_dir, test_id)
+            def show(written):
+                self.show_saved(
+                    test_id, path, format, descend, base_uri, output_hdrs)
+            store.wait_pending(path, 5, show)
+            self.wait()
+            return
         elif test_uri:
             if save_dir and os.path.exists(save_dir):
                 try:
                     fd, path = tempfile.mkstemp(prefix='', dir=save_dir)
+                    os.close(fd)
                     test_id = os.path.split(path)[1]
                 except (OSError, IOError):
                     # Don't try to store it. 
                     test_id = None
+                    path = None
             else:
                 test_id = None
+                path = None
+            if cache_dir and os.path.isdir(cache_dir):
+                result_cache = store.ResultCache(
+                    cache_dir, cache_ttl, cache_max)
+            else:
+                result_cache = None
+            if result_cache and not nocache:
+                ired = result_cache.get(test_uri, "GET", req_hdrs, descend)
+            else:
+                ired = None
+            if ired:
+                checked = ired.req_ts
+            else:
+                checked = None
             formatter = find_formatter(format, 'html', descend)(
                 base_uri, test_uri, req_hdrs, lang, self.output,
                 allow_save=test_id, is_saved=False, test_id=test_id,
-                descend=descend
+                descend=descend, checked=checked
             )
             output_hdrs("200 OK", [
                 ("Content-Type", "%s; charset=%s" % (
@@ -186,21 +219,38 @@ class RedWebUi(object):
                 ("Cache-Control", "max-age=60, must-revalidate")
             ])
             formatter.start_output()
-            ired = droid.InspectingResourceExpertDroid(
-                test_uri,
-                req_hdrs=req_hdrs,
-                status_cb=formatter.status,
-                body_procs=[formatter.feed],
-                descend=descend
-            )
-            formatter.finish_output(ired)
-            if test_id:
-                try:
-                    tmp_file = gzip.open(path, 'w')
-                    pickle.dump(ired, tmp_file)
-                    tmp_file.close()
-                except (IOError, zlib.error, pickle.PickleError):
-                    pass # we don't cry if we can't store it.
+            if ired is None:
+                def finish_check(red):
+                    if result_cache:
+                        try:
+                            result_cache.put(
+                                red, test_uri, "GET", req_hdrs, descend)
+                        except (OSError, IOError, ValueError, TypeError):
+                            pass # caching is best-effort.
+                    self.check_done(red, formatter, path)
+                def done(session):
+                    # this can happen inside the RED's constructor (e.g.,
+                    # if the request fails straight away), before it's
+                    # complete, so finish from the loop.
+                    nbhttp.schedule(0, finish_check, session.red)
+                self.session = fetch.RedSession(done_cb=done)
+                ired = droid.InspectingResourceExpertDroid(
+                    test_uri,
+                    req_hdrs=req_hdrs,
+                    status_cb=formatter.status,
+                    body_procs=[formatter.feed],
+                    descend=descend,
+                    done_cb=formatter.droid_done,
+                    link_done_cb=formatter.droid_done,
+                    session=self.session
+                )
+                if not self.session.total_requests:
+                    # the request was never made, so done won't be called.
+                    self.check_done(ired, formatter, path)
+                self.wait()
+                return
+            self.check_done(ired, formatter, path) # from the cache
+            return
         else:  # no test_uri
             formatter = html.BaseHtmlFormatter(
                 base_uri, test_uri, req_hdrs, lang, self.output)
@@ -212,17 +262,94 @@ class RedWebUi(object):
             ])
             formatter.start_output()
             formatter.finish_output(None)
-        timeout.delete()
+        self.finish()
+
+    def show_saved(self, test_id, path, format, descend, base_uri,
+                   output_hdrs):
+        "Show the saved result test_id, which is at path."
+        try:
+            mtime = os.stat(path).st_mtime
+        except (OSError, IOError):
+            output_hdrs("404 Not Found", [
+                ("Content-Type", "text/html; charset=%s" % charset), 
+                ("Cache-Control", "max-age=600, must-revalidate")
+            ])
+            # TODO: better error page (through formatter?)
+            self.output_body(error_template % 
+                "I'm sorry, I can't find that saved response."
+            )
+            self.finish()
+            return
+        is_saved = mtime > nbhttp.now()
+        try:
+            ired = store.load(path)
+        except (OSError, IOError, ValueError, KeyError):
+            output_hdrs("500 Internal Server Error", [
+                ("Content-Type", "text/html; charset=%s" % charset), 
+                ("Cache-Control", "max-age=600, must-revalidate")
+            ])
+            # TODO: better error page (through formatter?)
+            self.output_body(error_template % 
+                "I'm sorry, I had a problem reading that response."
+            )
+            self.finish()
+            return
+        formatter = find_formatter(format, 'html', descend)(
+            base_uri, ired.uri, ired.orig_req_hdrs, lang, self.output,
+            allow_save=(not is_saved), is_saved=True, test_id=test_id
+        )
+        output_hdrs("200 OK", [
+            ("Content-Type", "%s; charset=%s" % (
+                formatter.media_type, charset)), 
+            ("Cache-Control", "max-age=3600, must-revalidate")
+        ])
+        formatter.start_output()
+        formatter.finish_output(ired)
+        self.finish()
+
+    def check_done(self, ired, formatter, path):
+        "The check is complete; show (and save) the results."
+        formatter.finish_output(ired)
+        if path:
+            try:
+                result_writer.save(ired, path)
+            except (OSError, IOError, ValueError, TypeError):
+                pass # we don't cry if we can't store it.
+        self.finish()
+
+    def finish(self):
+        "The response is complete."
+        if self.finished:
+            return
+        self.finished = True
+        self.timeout.delete()
+        if self.done_cb:
+            self.done_cb()
+        elif self.running:
+            self.running = False
+            nbhttp.stop()
+
+    def wait(self):
+        """
+        If the caller isn't running the event loop (e.g., for CGI), run it
+        until the response is complete.
+        """
+        if self.finished or self.done_cb is not None:
+            return
+        self.running = True
+        nbhttp.run()
 
     def output(self, chunk):
+        if self.finished:
+            return # e.g., a cancelled check
         self.output_body(chunk.encode(charset, 'replace'))
-        
+
     def timeoutError(self):
-        """ Max runtime reached."""
+        """ Max runtime reached; abandon this check (only)."""
         self.output(error_template % ("RED timeout."))
-        nbhttp.stop() # FIXME: not appropriate for standalone server
-
-
+        if self.session:
+            self.session.cancel()
+        self.finish()
 
 
 # adapted from cgitb.Hook
@@ -259,13 +386,14 @@ A problem has occurred, but it probably isn't your fault.
             fh = os.fdopen(fd, 'w')
             fh.write(doc)
             fh.write("<h2>Outstanding Connections</h2>\n<pre>")
-            for conn in fetch.outstanding_requests:
-                fh.write("*** %s - %s\n" % (conn.uri, hex(id(conn))))
-                pprint.pprint(conn.__dict__, fh)
-                if conn.client:
-                    pprint.pprint(conn.client.__dict__, fh)
-                if conn.client._tcp_conn:
-                    pprint.pprint(conn.client._tcp_conn.__dict__, fh)
+            for session in fetch.active_sessions:
+                for conn in session.outstanding_requests:
+                    fh.write("*** %s - %s\n" % (conn.uri, hex(id(conn))))
+                    pprint.pprint(conn.__dict__, fh)
+                    if conn.client:
+                        pprint.pprint(conn.client.__dict__, fh)
+                    if conn.client._tcp_conn:
+                        pprint.pprint(conn.client._tcp_conn.__dict__, fh)
             fh.write("</pre>\n")
             fh.close()
             os.chmod(path, stat.S_IROTH)
@@ -303,6 +431,7 @@ def cgi_main():
     format = form.getfirst('format', 'html')
     file_id = form.getfirst("id", None)
     descend = form.getfirst('descend', False)
+    nocache = form.getfirst('nocache', False)
     if os.environ.get("REQUEST_METHOD") == "POST":
         save = form.getfirst('save', False)
     else:
@@ -320,72 +449,282 @@ def cgi_main():
     def output_body(o):
         sys.stdout.write(o)
     RedWebUi(file_id, test_uri, req_hdrs, base_uri, format, 
-        output_hdrs, output_body, descend, save)
+        output_hdrs, output_body, descend, save, nocache)
+    # finish the response before writing any results.
+    sys.stdout.close()
+    result_writer.close()
 
-# FIXME: standalone server needs to be updated.
-def standalone_main(port, static_dir):
-    """Run RED as a standalone Web server."""
+def load_static(static_dir):
+    """
+    Load the files in static_dir (and its subdirectories) for the standalone
+    server. Returns a dictionary of path: (content-type, body).
+    """
     static_files = {}
-    for file in os.listdir(static_dir):
-        sys.stderr.write("Loading %s...\n" % file)
-        try:
-            # FIXME: need to load icons
-            static_files["/static/%s" % file] = open(
-                os.path.join(static_dir, file)
-            ).read()
-        except IOError:
-            sys.stderr.write("failed.\n")
-    def red_handler(method, uri, req_hdrs, res_start, req_pause):
+    for root, dirs, files in os.walk(static_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            rel_path = path[len(static_dir):].strip(os.sep)
+            try:
+                body = open(path, 'rb').read()
+            except IOError:
+                sys.stderr.write("* Failed to load %s.\n" % path)
+                continue
+            content_type = mimetypes.guess_type(name)[0] or \
+                "application/octet-stream"
+            static_files["/static/%s" % rel_path.replace(os.sep, "/")] = \
+                (content_type, body)
+    return static_files
+
+
+class StandaloneWorker(object):
+    """
+    Serves RED in one of the standalone server's worker processes.
+
+    Each worker runs its own event loop and accepts connections on the
+    listening socket it shares with the other workers; many checks can be
+    in progress in a worker at once.
+
+    On SIGHUP or SIGTERM, a worker stops once the checks it's doing are
+    done. It also stops after max_checks checks (if set), so that it can be
+    replaced with a fresh one.
+    """
+    def __init__(self, static_files, max_checks=None):
+        self.static_files = static_files
+        self.max_checks = max_checks
+        self.checks = 0
+        self.active = 0
+        self.stopping = False
+
+    def run(self):
+        "Run the worker until it's stopped."
+        signal.signal(signal.SIGHUP, self.stop)
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, signal.SIG_IGN) # the parent handles it
+        nbhttp.run()
+        result_writer.close()
+
+    def stop(self, *args):
+        "Stop when the checks in progress are done."
+        self.stopping = True
+        if not self.active:
+            nbhttp.stop()
+
+    def handle(self, method, uri, req_hdrs, res_start, req_pause):
+        "Handle a request from nbhttp, once its body is read."
+        req_body = []
+        def req_done(err):
+            if err:
+                return # the client has gone away
+            self.respond(method, uri, req_hdrs, "".join(req_body), res_start)
+        return req_body.append, req_done
+
+    def respond(self, method, uri, req_hdrs, req_body, res_start):
+        "Send the response to a request."
         p_uri = urlsplit(uri)
-        if static_files.has_key(p_uri.path):
-            res_body, res_done = res_start("200", "OK", [], nbhttp.dummy)
-            res_body(static_files[p_uri.path])
+        if self.static_files.has_key(p_uri.path):
+            content_type, body = self.static_files[p_uri.path]
+            res_body, res_done = res_start("200", "OK", [
+                ("Content-Type", content_type),
+                ("Cache-Control", "max-age=86400")
+            ], nbhttp.dummy)
+            res_body(body)
             res_done(None)
         elif p_uri.path == "/":
-            query = cgi.parse_qs(p_uri.query)
-            test_uri = query.get('uri', [""])[0]
-            test_hdrs = [] #FIXME
-            base_uri = "/"
-            descend = query.has_key('descend')
-            res_hdrs = [('Content-Type', 'text/html; charset=utf-8')] 
-            #FIXME: need to send proper content-type back, caching headers
-            res_body, res_done = res_start(
-                "200", "OK", res_hdrs, nbhttp.dummy
-            )
-            sys.stderr.write("%s %s %s\n" % (
-                str(descend), test_uri, test_hdrs
-            ))
-            RedWebUi(test_uri, test_hdrs, base_uri, 
-                res_body, output_hdr, descend
-            )
+            self.check(method, p_uri, req_hdrs, req_body, res_start)
+        else:
+            res_body, res_done = res_start("404", "Not Found", [
+                ("Content-Type", "text/html; charset=%s" % charset)
+            ], nbhttp.dummy)
+            res_body(error_template % "Not found.")
             res_done(None)
+
+    def check(self, method, p_uri, req_hdrs, req_body, res_start):
+        "Run a RedWebUi for the request."
+        query = cgi.parse_qs(p_uri.query)
+        if method == "POST":
+            for name, values in cgi.parse_qs(req_body).items():
+                query.setdefault(name, []).extend(values)
+        def getfirst(name, default=None):
+            return query.get(name, [default])[0]
+        test_uri = getfirst("uri", "").decode(charset, 'replace')
+        test_hdrs = [tuple(rh.split(":", 1))
+                     for rh in query.get("req_hdr", [])
+                     if rh.find(":") > 0
+                    ]
+        if method == "POST":
+            save = getfirst('save', False)
+        else:
+            save = False
+        host = get_hdr(req_hdrs, 'host')
+        if host:
+            base_uri = "http://%s/" % host[0] # FIXME: only supports HTTP
         else:
-            res_body, res_done = res_start(
-                "404", "Not Found", [], nbhttp.dummy
+            base_uri = "/"
+        response = []
+        def output_hdrs(status, res_hdrs):
+            code, phrase = status.split(" ", 1)
+            response.extend(res_start(code, phrase, res_hdrs, nbhttp.dummy))
+        def output_body(chunk):
+            response[0](chunk)
+        def done():
+            response[1](None)
+            self.check_done()
+        self.checks += 1
+        self.active += 1
+        sys.stderr.write("%s %s %s\n" % (method, p_uri.path, test_uri))
+        try:
+            RedWebUi(getfirst("id"), test_uri, test_hdrs, base_uri, 
+                getfirst('format', 'html'), output_hdrs, output_body,
+                getfirst('descend', False), save, getfirst('nocache', False),
+                done_cb=done
             )
-            res_done(None)
-        return nbhttp.dummy, nbhttp.dummy
-    nbhttp.Server("", port, red_handler)
-    nbhttp.run() # FIXME: catch errors
-    # FIXME: catch interrupts
-    # FIXME: run/stop in red_fetcher
-    # FIXME: logging
-
-def standalone_monitor(port, static_dir):
-    """Fork a process as a standalone Web server and watch it."""
-    from multiprocessing import Process
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            if not response:
+                output_hdrs("500 Internal Server Error", [
+                    ("Content-Type", "text/html; charset=%s" % charset)
+                ])
+                output_body(error_template % """
+A problem has occurred, but it probably isn't your fault.
+""")
+            done()
+
+    def check_done(self):
+        "Note that a check is done, and stop if it's time to."
+        self.active -= 1
+        if self.max_checks and self.checks >= self.max_checks:
+            self.stopping = True
+        if self.stopping and not self.active:
+            nbhttp.stop()
+
+
+class InheritedServer(nbhttp.Server):
+    """
+    An nbhttp server that accepts connections on sock, a socket that's
+    already listening, rather than binding its own.
+    """
+    def __init__(self, sock, request_handler):
+        self.request_handler = request_handler
+        self.server = InheritedListener(sock, self.handle_connection)
+
+
+class InheritedListener(push_tcp.create_server):
+    "push_tcp's TCP server, on a socket that's already listening."
+    def __init__(self, sock, connect_handler):
+        self.host, self.port = sock.getsockname()[:2]
+        self.connect_handler = connect_handler
+        self.sock = sock
+        self.sock.setblocking(0)
+        if push_tcp.event:
+            push_tcp.event.event(self.handle_accept, handle=self.sock,
+                evtype=push_tcp.event.EV_READ | push_tcp.event.EV_PERSIST
+            ).add()
+        else:
+            asyncore.dispatcher.__init__(self, sock=self.sock)
+            self.accepting = True
+
+
+def standalone_main(port, static_dir, workers):
+    """
+    Run RED as a standalone Web server.
+
+    This process listens on port and starts workers to serve requests on
+    that socket, replacing any that exit. Each worker is a fresh copy of
+    this script, so it has its own event loop, and loads RED's code and
+    settings (and static_dir) when it starts. On SIGHUP, the workers are
+    replaced gracefully (i.e., without interrupting checks in progress),
+    picking up any changes; SIGTERM or SIGINT stops them gracefully and
+    exits.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("", port))
+    sock.listen(socket.SOMAXCONN)
+    sys.stderr.write("* Listening on port %s\n" % port)
+    signals = []
+    def note_signal(signum, frame):
+        signals.append(signum)
+    for signum in [signal.SIGHUP, signal.SIGTERM, signal.SIGINT]:
+        signal.signal(signum, note_signal)
+    pids = set()
+    while True:
+        if signals:
+            signum = signals.pop(0)
+            if signum != signal.SIGHUP:
+                break
+            sys.stderr.write("* Reloading...\n")
+            for pid in pids:
+                signal_worker(pid, signal.SIGHUP)
+            pids.clear() # the old workers will exit when they're done
+        while len(pids) < workers:
+            pids.add(fork_worker(sock, static_dir))
+        try:
+            pid, status = os.wait()
+        except OSError, why:
+            if why[0] == errno.EINTR:
+                continue
+            raise
+        if pid in pids:
+            pids.remove(pid)
+            sys.stderr.write("* Worker %s exited (%s)\n" % (pid, status))
+    sys.stderr.write("* Stopping...\n")
+    for pid in pids:
+        signal_worker(pid, signal.SIGTERM)
     while True:
-        p = Process(target=standalone_main, args=(port, static_dir))
-        sys.stderr.write("* Starting RED server...\n")
-        p.start()
-        p.join()
-        # TODO: listen to socket and drop privs
+        try:
+            os.wait()
+        except OSError, why:
+            if why[0] == errno.EINTR:
+                continue
+            break # no more children
+
+def fork_worker(sock, static_dir):
+    "Start a worker process serving on sock, returning its pid."
+    pid = os.fork()
+    if pid == 0:
+        try:
+            for signum in [signal.SIGHUP, signal.SIGTERM, signal.SIGINT]:
+                signal.signal(signum, signal.SIG_DFL)
+            os.execv(sys.executable, [sys.executable, worker_script,
+                "--worker", str(sock.fileno()), static_dir])
+        except:
+            import traceback
+            traceback.print_exc()
+        sys.stderr.flush()
+        os._exit(1)
+    sys.stderr.write("* Started worker %s\n" % pid)
+    return pid
+
+def signal_worker(pid, signum):
+    "Send signum to the worker pid, if it's still around."
+    try:
+        os.kill(pid, signum)
+    except OSError:
+        pass
+
+def worker_main(fd, static_dir):
+    "Run a standalone server worker on the listening socket fd."
+    sock = socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM)
+    os.close(fd) # fromfd() dups it
+    worker = StandaloneWorker(load_static(static_dir), max_worker_checks)
+    InheritedServer(sock, worker.handle)
+    worker.run()
+
+# the standalone server's workers run this script afresh.
+worker_script = os.path.abspath(__file__)
+
 
 if __name__ == "__main__":
-    try:
-        # FIXME: usage
-        port = sys.argv[1]
-        static_dir = sys.argv[2]
-        standalone_monitor(int(port), static_dir)
-    except IndexError:
-        cgi_main()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        # webui.py --worker fd static_dir (see fork_worker)
+        worker_main(int(sys.argv[2]), sys.argv[3])
+    elif len(sys.argv) > 2:
+        # webui.py port static_dir [workers]
+        if len(sys.argv) > 3:
+            num_workers = int(sys.argv[3])
+        else:
+            num_workers = server_workers
+        standalone_main(int(sys.argv[1]), sys.argv[2], num_workers)
+    else:
+        cgi_main()
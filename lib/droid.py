@@ -35,14 +35,16 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import heapq
 import re
 import time
 import random
 from cgi import escape as e
-from urlparse import urljoin
+from collections import defaultdict
+from urlparse import urljoin, urlsplit
 
 import redbot.speak as rs
-from redbot import link_parse
+from redbot import instrument, link_parse
 from redbot.fetch import RedFetcher
 from redbot.response_analyse import relative_time, f_num
 from redbot.uri_validate import absolute_URI
@@ -52,6 +54,10 @@ cacheable_methods = ['GET']
 heuristic_cacheable_status = ['200', '203', '206', '300', '301', '410']
 max_uri = 8 * 1024
 max_clock_skew = 5  # seconds
+# Measure compression savings against the main response's decoded size,
+# only asking for the uncompressed response's headers (with HEAD), rather
+# than downloading the whole thing again.
+conneg_decoded_size = True
 
 
 class ResourceExpertDroid(RedFetcher):
@@ -66,11 +72,16 @@ class ResourceExpertDroid(RedFetcher):
 
     After processing the response-specific attributes of RedFetcher will be
     populated, as well as its messages; see that class for details.
+
+    Subrequests are made in the same session (see RedSession) as the main
+    request. If provided, done_cb is called with the RED once its response
+    and all of its subrequests are finished.
     """
     def __init__(self, uri, method="GET", req_hdrs=None, req_body=None,
-                status_cb=None, body_procs=None):
+                status_cb=None, body_procs=None, session=None, done_cb=None):
         self.orig_req_hdrs = req_hdrs or []
         self.status_cb = status_cb
+        self.done_cb = done_cb
         
         # Extra metadata that the "main" RED will be adorned with 
         self.age = None
@@ -83,9 +94,15 @@ class ResourceExpertDroid(RedFetcher):
         self.ims_support = None
         self.gzip_support = None
         self.gzip_savings = 0
+        self._range_started = False
+        self._analysed = False
+        self._done_waiting = [] # callbacks waiting for analysis to finish
+        self._subreqs = 0 # subrequests in progress
+        self._finished = False
         rh = self.orig_req_hdrs + [('Accept-Encoding', 'gzip, deflate')]
         RedFetcher.__init__(self, uri, method, rh, req_body,
-                            status_cb, body_procs, req_type=method)
+                            status_cb, body_procs, req_type=method,
+                            session=session)
 
         # check the URI
         if not re.match("^\s*%s\s*$" % absolute_URI, self.uri, re.VERBOSE):
@@ -93,18 +110,77 @@ class ResourceExpertDroid(RedFetcher):
         if len(self.uri) > max_uri:
             self.setMessage('uri', rs.URI_TOO_LONG, uri_len=f_num(len(uri)))
 
+    def __getstate__(self):
+        state = RedFetcher.__getstate__(self)
+        state['_done_waiting'] = []
+        state['done_cb'] = None
+        return state
+
+    def _response_start(self, *args):
+        """
+        The response headers are available; start the subrequests that only
+        need them, rather than waiting for the body.
+        """
+        callbacks = RedFetcher._response_start(self, *args)
+        ConnegCheck(self)
+        ETagValidate(self)
+        LmValidate(self)
+        return callbacks
+
+    def _response_body(self, chunk):
+        """
+        Start the range subrequest as soon as the sample of the body to ask
+        for is settled (e.g., with the head strategy); otherwise, it's started
+        when the response is done.
+        """
+        RedFetcher._response_body(self, chunk)
+        if not self._range_started and self.res_body_sample.full:
+            self._range_started = True
+            RangeRequest(self)
+
     def done(self):
         """
         Response is available; perform further processing that's specific to
-        the "main" response.
+        the "main" response, and then let any waiting subrequests check
+        their results against it.
         """
-        if self.res_complete:            
+        self._analysed = True
+        waiting, self._done_waiting = self._done_waiting, []
+        if self.res_complete:
             self.checkCaching()
-            ConnegCheck(self)
-            RangeRequest(self)
-            ETagValidate(self)
-            LmValidate(self)
-        
+            if not self._range_started:
+                self._range_started = True
+                RangeRequest(self)
+            for callback in waiting:
+                callback()
+        self._check_finished()
+
+    def after_done(self, callback):
+        """
+        Call callback once the response has been analysed, but only if it
+        was complete.
+        """
+        if not self._analysed:
+            self._done_waiting.append(callback)
+        elif self.res_complete:
+            callback()
+
+    def subreq_start(self, subreq):
+        "Note that a subrequest has been started."
+        self._subreqs += 1
+
+    def subreq_done(self, subreq):
+        "Note that a subrequest has finished."
+        self._subreqs -= 1
+        self._check_finished()
+
+    def _check_finished(self):
+        if self._analysed and self._subreqs == 0 and not self._finished:
+            self._finished = True
+            if self.done_cb:
+                self.done_cb(self)
+
+    @instrument.timed("checkCaching")
     def checkCaching(self):
         "Examine HTTP caching characteristics."
         # TODO: check URI for query string, message about HTTP/1.0 if so
@@ -344,11 +420,14 @@ class InspectingResourceExpertDroid(ResourceExpertDroid):
     """
     A RED that parses the response body to look for links. If descend
     is True, it will also spider linked resources and populate
-    self.link_droids with their REDs.
+    self.link_droids with their REDs, made in the same session and
+    scheduled by a LinkScheduler. link_done_cb is called with each linked
+    RED and the tag that linked to it when that RED is finished.
     """
     def __init__(self, uri, method="GET", req_hdrs=None, req_body=None,
-                status_cb=None, body_procs=None, descend=False):
-        self.link_parser = link_parse.HTMLLinkParser(
+                status_cb=None, body_procs=None, descend=False,
+                session=None, done_cb=None, link_done_cb=None):
+        self.link_parser = link_parse.make_parser(
             uri, self.process_link, status_cb
         )
         body_procs = ( body_procs or [] ) + [self.link_parser.feed]
@@ -356,8 +435,19 @@ class InspectingResourceExpertDroid(ResourceExpertDroid):
         self.links = {}          # {type: set(link...)}
         self.link_count = 0
         self.link_droids = []    # list of linked REDs (if descend=True)        
+        self.link_done_cb = link_done_cb
+        if descend:
+            self.link_scheduler = LinkScheduler(self)
+        else:
+            self.link_scheduler = None
         ResourceExpertDroid.__init__(self, uri, method, req_hdrs, req_body,
-                status_cb, body_procs)
+                status_cb, body_procs, session, done_cb)
+
+    def __getstate__(self):
+        state = ResourceExpertDroid.__getstate__(self)
+        state['link_scheduler'] = None
+        state['link_done_cb'] = None
+        return state
 
     def process_link(self, link, tag, title):
         "Handle a link from content"
@@ -365,58 +455,163 @@ class InspectingResourceExpertDroid(ResourceExpertDroid):
         if not self.links.has_key(tag):
             self.links[tag] = set()
         if self.descend and tag not in ['a'] and link not in self.links[tag]:
-            self.link_droids.append((
-                ResourceExpertDroid(
-                    urljoin(self.link_parser.base, link),
-                    req_hdrs=self.orig_req_hdrs,
-                    status_cb=self.status_cb
-                ),
-                tag
-            ))
+            self.link_scheduler.add(urljoin(self.link_parser.base, link), tag)
         self.links[tag].add(link)
 
 
+class LinkScheduler(object):
+    """
+    Runs REDs on the resources linked from a RED's response, a limited
+    number at a time.
+
+    No more than max_active linked REDs run at once, and no more than
+    max_per_host of them against any one host. Waiting links are started in
+    order of priority; e.g., head links and scripts before images.
+
+    If more than max_queued links are waiting, the linking RED's response is
+    paused (which stops the links being parsed out of it) until the queue
+    has drained by half.
+    """
+    max_active = 10
+    max_per_host = 4
+    max_queued = 100
+    priority = {
+        'link': 0,
+        'script': 1,
+        'frame': 2,
+        'iframe': 2,
+        'img': 3,
+    }
+
+    def __init__(self, red):
+        self.red = red
+        self.queue = [] # heap of (priority, seq, uri, tag)
+        self.active = 0
+        self.host_active = defaultdict(int)
+        self.paused = False
+        self._seq = 0
+
+    def add(self, uri, tag):
+        "Schedule a RED for uri, which was linked to from tag."
+        self._seq += 1
+        heapq.heappush(self.queue,
+            (self.priority.get(tag, len(self.priority)), self._seq, uri, tag)
+        )
+        self._run()
+        if not self.paused and len(self.queue) > self.max_queued:
+            self.paused = True
+            self.red.pause_response(True)
+
+    def droid_done(self, droid, tag):
+        "Callback for when a linked RED is finished."
+        self.active -= 1
+        self.host_active[self._host(droid.uri)] -= 1
+        self._run()
+        if self.paused and len(self.queue) <= self.max_queued / 2:
+            self.paused = False
+            self.red.pause_response(False)
+        if self.red.link_done_cb:
+            self.red.link_done_cb(droid, tag)
+
+    def _run(self):
+        "Start as many waiting REDs as we're allowed to."
+        skipped = []
+        while self.queue and self.active < self.max_active:
+            item = heapq.heappop(self.queue)
+            host = self._host(item[2])
+            if self.host_active[host] >= self.max_per_host:
+                skipped.append(item)
+                continue
+            self.active += 1
+            self.host_active[host] += 1
+            self._start(item[2], item[3])
+        for item in skipped:
+            heapq.heappush(self.queue, item)
+
+    def _start(self, uri, tag):
+        def done(droid):
+            self.droid_done(droid, tag)
+        droid = ResourceExpertDroid(
+            uri,
+            req_hdrs=self.red.orig_req_hdrs,
+            status_cb=self.red.status_cb,
+            session=self.red.session,
+            done_cb=done
+        )
+        self.red.link_droids.append((droid, tag))
+
+    @staticmethod
+    def _host(uri):
+        return urlsplit(uri)[1].lower()
+
+
+
+class SubRequest(RedFetcher):
+    """
+    A request made to further probe the resource that a RED is examining.
+
+    It can be started as soon as the RED has what it needs (e.g., the
+    response headers), but check() is only called once both it and the RED's
+    response are done, and then only if the RED's response was complete.
+    """
+    def __init__(self, red, req_hdrs, req_type, method=None):
+        self.red = red
+        red.subreq_start(self)
+        RedFetcher.__init__(self, red.uri, method or red.method, req_hdrs,
+                            red.req_body, red.status_cb, [], req_type,
+                            red.session)
+
+    def done(self):
+        self.red.after_done(self.check)
+        self.red.subreq_done(self)
+
+    def _report_conn_reuse(self):
+        # a subrequest's own messages aren't shown, so tell the RED.
+        if not [m for m in self.red.messages
+                if isinstance(m, rs.CONN_REUSED)]:
+            self.red.messages.append(rs.CONN_REUSED(
+                'header-connection', self, {}, self.type))
+
+    def check(self):
+        "Examine the response in light of the RED's."
+        raise NotImplementedError
+
 
-class ConnegCheck(RedFetcher):
+class ConnegCheck(SubRequest):
     """
     See if content negotiation for compression is supported, and how.
 
     Note that this depends on the "main" request being sent with
     Accept-Encoding: gzip
+
+    If conneg_decoded_size is set and the main request is a GET, the
+    uncompressed response is only asked for with HEAD, and the savings are
+    calculated using the size of the main response once decoded.
     """
     def __init__(self, red):
         self.red = red
         if "gzip" in red.parsed_hdrs.get('content-encoding', []):
             req_hdrs = [h for h in red.orig_req_hdrs if
                         h[0].lower() != 'accept-encoding']
-            RedFetcher.__init__(self, red.uri, red.method, req_hdrs,
-                                red.req_body, red.status_cb, [], "conneg")
+            if conneg_decoded_size and red.method == "GET":
+                method = "HEAD"
+            else:
+                method = None
+            SubRequest.__init__(self, red, req_hdrs, "conneg", method)
         else:
             self.red.gzip_support = False
 
-    def done(self):
-        if self.res_body_len > 0:
-            savings = int(100 * ((float(self.res_body_len) - \
-                                  self.red.res_body_len) / self.res_body_len
-                                ))
-        else:
-            savings = 0
+    def check(self):
         self.red.gzip_support = True
-        self.red.gzip_savings = savings
-        if savings >= 0:
-            self.red.setMessage('header-content-encoding',
-                                rs.CONNEG_GZIP_GOOD, self,
-                                savings=savings,
-                                orig_size=f_num(self.res_body_len),
-                                gzip_size=f_num(self.red.res_body_len)
-            )
+        if self.method != self.red.method:
+            if self.red.res_body_decode_ok:
+                orig_len = self.red.res_body_decode_len
+            else:
+                orig_len = None # the problem is reported elsewhere
         else:
-            self.red.setMessage('header-content-encoding',
-                                rs.CONNEG_GZIP_BAD, self,
-                                savings=abs(savings),
-                                orig_size=f_num(self.res_body_len),
-                                gzip_size=f_num(self.red.res_body_len)
-            )
+            orig_len = self.res_body_len
+        if orig_len is not None:
+            self.checkSavings(orig_len)
         vary_headers = self.red.parsed_hdrs.get('vary', [])
         if (not "accept-encoding" in vary_headers) \
         and (not "*" in vary_headers):
@@ -438,19 +633,44 @@ class ConnegCheck(RedFetcher):
             self.red.setMessage('header-etag', rs.ETAG_DOESNT_CHANGE) 
             # TODO: weakness?
 
+    def checkSavings(self, orig_len):
+        "See how much compression saves, given the uncompressed length."
+        if orig_len > 0:
+            savings = int(100 * ((float(orig_len) - \
+                                  self.red.res_body_len) / orig_len
+                                ))
+        else:
+            savings = 0
+        self.red.gzip_savings = savings
+        if savings >= 0:
+            self.red.setMessage('header-content-encoding',
+                                rs.CONNEG_GZIP_GOOD, self,
+                                savings=savings,
+                                orig_size=f_num(orig_len),
+                                gzip_size=f_num(self.red.res_body_len)
+            )
+        else:
+            self.red.setMessage('header-content-encoding',
+                                rs.CONNEG_GZIP_BAD, self,
+                                savings=abs(savings),
+                                orig_size=f_num(orig_len),
+                                gzip_size=f_num(self.red.res_body_len)
+            )
+
 
-class RangeRequest(RedFetcher):
+class RangeRequest(SubRequest):
     "Check for partial content support (if advertised)"
     def __init__(self, red):
         self.red = red
         if 'bytes' in red.parsed_hdrs.get('accept-ranges', []):
-            if len(red.res_body_sample) == 0: return
-            sample_num = random.randint(0, len(red.res_body_sample) - 1)
-            sample_len = min(96, len(red.res_body_sample[sample_num][1]))
-            self.range_start = red.res_body_sample[sample_num][0]
+            samples = red.res_body_sample.samples
+            if len(samples) == 0: return
+            offset, sample = random.choice(samples)
+            sample_len = min(96, len(sample))
+            self.range_start = offset
             self.range_end = self.range_start + sample_len
-            self.range_target = \
-                red.res_body_sample[sample_num][1][:sample_len + 1]
+            self.range_target = sample[:sample_len + 1]
+            self.res_body_expected = self.range_target
             if self.range_start == self.range_end: 
                 # wow, that's a small body.
                 return 
@@ -458,13 +678,11 @@ class RangeRequest(RedFetcher):
             req_hdrs = red.req_hdrs + [
                 ('Range', "bytes=%s-%s" % (self.range_start, self.range_end))
             ]
-            RedFetcher.__init__(self, red.uri, red.method, 
-                req_hdrs, red.req_body, red.status_cb, [], "range"
-            )
+            SubRequest.__init__(self, red, req_hdrs, "range")
         else:
             self.red.partial_support = False
 
-    def done(self):
+    def check(self):
         if self.res_status == '206':
             # TODO: check entity headers
             # TODO: check content-range
@@ -476,7 +694,7 @@ class RangeRequest(RedFetcher):
                     self
                 )
                 return
-            if self.res_body == self.range_target:
+            if self.res_body_matches:
                 self.red.partial_support = True
                 self.red.setMessage('header-accept-ranges', 
                                     rs.RANGE_CORRECT, self
@@ -493,7 +711,10 @@ class RangeRequest(RedFetcher):
                         self.range_target.encode('string_escape')
                     ),
                     range_expected_bytes = f_num(len(self.range_target)),
-                    range_received=e(self.res_body.encode('string_escape')),
+                    range_received=e(
+                        self.res_body.encode('string_escape')
+                    ) + (self.res_body_len > len(self.res_body) and \
+                         u"&hellip;" or u""),
                     range_received_bytes = f_num(self.res_body_len)
                 )
         # TODO: address 416 directly
@@ -506,7 +727,7 @@ class RangeRequest(RedFetcher):
                                 enc_range_status=e(self.res_status))
 
 
-class ETagValidate(RedFetcher):
+class ETagValidate(SubRequest):
     "If an ETag is present, see if it will validate."
     def __init__(self, red):
         self.red = red
@@ -521,13 +742,11 @@ class ETagValidate(RedFetcher):
             req_hdrs = red.req_hdrs + [
                 ('If-None-Match', etag_str),
             ]
-            RedFetcher.__init__(self, red.uri, red.method, req_hdrs,
-                red.req_body, red.status_cb, [], "ETag validation"
-            )
+            SubRequest.__init__(self, red, req_hdrs, "ETag validation")
         else:
             self.red.inm_support = False
 
-    def done(self):
+    def check(self):
         if self.res_status == '304':
             self.red.inm_support = True
             self.red.setMessage('header-etag', rs.INM_304, self)
@@ -545,7 +764,7 @@ class ETagValidate(RedFetcher):
                                 )
         # TODO: check entity headers
 
-class LmValidate(RedFetcher):
+class LmValidate(SubRequest):
     "If Last-Modified is present, see if it will validate."
     def __init__(self, red):
         self.red = red
@@ -557,13 +776,11 @@ class LmValidate(RedFetcher):
             req_hdrs = red.req_hdrs + [
                 ('If-Modified-Since', date_str),
             ]
-            RedFetcher.__init__(self, red.uri, red.method, req_hdrs,
-                red.req_body, red.status_cb, [], "LM validation"
-            )
+            SubRequest.__init__(self, red, req_hdrs, "LM validation")
         else:
             self.red.ims_support = False
 
-    def done(self):
+    def check(self):
         if self.res_status == '304':
             self.red.ims_support = True
             self.red.setMessage('header-last-modified', rs.IMS_304, self)
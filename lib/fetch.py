@@ -36,6 +36,8 @@ THE SOFTWARE.
 
 import base64
 import hashlib
+from collections import defaultdict, deque
+import time
 import urllib
 import urlparse
 import zlib
@@ -43,15 +45,229 @@ from cgi import escape as e
 
 import nbhttp
 import redbot.speak as rs
+from redbot import instrument
 import redbot.response_analyse as ra
 from redbot.response_analyse import f_num
 
-outstanding_requests = [] # requests in process
-total_requests = 0
+active_sessions = [] # sessions with requests in process
+
+# how to sample response bodies (e.g., for range requests); see BodySampler.
+body_sample_strategy = 'spread'
+body_sample_budget = 4096 # bytes
+body_sample_window = 256 # bytes
+
+# how much of a partial (206) response body to keep, for reporting.
+partial_body_excerpt = 1024 # bytes
+
 
 class RedHttpClient(nbhttp.Client):
+    """
+    An HTTP client that notes when its connection is ready, when the request
+    has been written to it and when the response starts arriving; see
+    RedFetcher.timings.
+    """
     connect_timeout = 8
     read_timeout = 8
+    connected_ts = None
+    sent_ts = None
+    first_byte_ts = None
+
+    def _handle_connect(self, tcp_conn):
+        self.connected_ts = time.time()
+        nbhttp.Client._handle_connect(self, tcp_conn)
+        self.sent_ts = time.time()
+
+    def _handle_input(self, instr):
+        if self.first_byte_ts is None:
+            self.first_byte_ts = time.time()
+        return nbhttp.Client._handle_input(self, instr)
+
+
+class ConnectionPool(object):
+    """
+    Keeps track of the connections used by the requests in a session.
+
+    Requests to the same origin (scheme and authority) are limited to
+    max_per_host at a time; the rest wait their turn, so that they can reuse
+    idle persistent connections rather than opening new ones. Connections
+    that aren't reused within idle_timeout seconds are closed.
+
+    reused and opened count how many requests used an existing connection
+    and how many needed a new one, respectively.
+    """
+    max_per_host = 4
+    idle_timeout = 10 # seconds
+
+    def __init__(self, max_per_host=None, idle_timeout=None):
+        if max_per_host is not None:
+            self.max_per_host = max_per_host
+        if idle_timeout is not None:
+            self.idle_timeout = idle_timeout
+        self.reused = 0
+        self.opened = 0
+        self._active = defaultdict(int) # origin: number of requests
+        self._queued = defaultdict(list) # origin: [start_cb, ...]
+        self._conns = {} # tcp_conn: fetcher that first used it
+        self._busy = set() # tcp_conns that are in use
+
+    def acquire(self, origin, start_cb):
+        "Call start_cb when a request to origin can be made."
+        if self._active[origin] < self.max_per_host:
+            self._active[origin] += 1
+            start_cb()
+        else:
+            self._queued[origin].append(start_cb)
+
+    def release(self, origin, tcp_conn):
+        """
+        Note that a request to origin has finished with tcp_conn (which may be
+        None), and let the next queued request to origin, if any, proceed.
+        """
+        self._busy.discard(tcp_conn)
+        self._active[origin] -= 1
+        if self._queued[origin]:
+            # wait for the connection to become idle before going on
+            nbhttp.schedule(0, self._start_next, origin)
+        elif tcp_conn is not None \
+          and getattr(tcp_conn, 'tcp_connected', False):
+            nbhttp.schedule(self.idle_timeout, self._idle_close, tcp_conn)
+
+    def conn_used(self, fetcher, tcp_conn):
+        """
+        Note that fetcher is using tcp_conn. Returns the fetcher that opened
+        it if it's being reused, or None if it's new.
+        """
+        if tcp_conn is None:
+            return None
+        self._busy.add(tcp_conn)
+        if self._conns.has_key(tcp_conn):
+            self.reused += 1
+            return self._conns[tcp_conn]
+        self.opened += 1
+        self._conns[tcp_conn] = fetcher
+        return None
+
+    def close(self):
+        "Forget any queued requests, and close all of the pool's connections."
+        self._queued.clear()
+        for tcp_conn in self._conns.keys():
+            if getattr(tcp_conn, 'tcp_connected', False):
+                tcp_conn.close()
+
+    def _start_next(self, origin):
+        if self._queued[origin] \
+          and self._active[origin] < self.max_per_host:
+            self._active[origin] += 1
+            self._queued[origin].pop(0)()
+
+    def _idle_close(self, tcp_conn):
+        if tcp_conn not in self._busy \
+          and getattr(tcp_conn, 'tcp_connected', False):
+            tcp_conn.close()
+
+
+class RedSession(object):
+    """
+    A check session; tracks a set of related requests (e.g., a RED, its
+    subrequests and any linked REDs) that share the event loop, and calls
+    done_cb with the session when the last of them finishes. That can happen
+    before the first request's constructor has returned (e.g., if the URI
+    can't be fetched), so done_cb should use the session's red (the first
+    request made in it) rather than the object the caller created.
+
+    If run_loop is True, the session will run the event loop when its first
+    request is made, and stop it when it's done; this is what happens when a
+    RedFetcher is created without a session. Otherwise, the caller is
+    responsible for running the loop, so that many sessions can be
+    multiplexed on it (e.g., in a long-running server).
+
+    Requests in a session share a ConnectionPool; one will be created if
+    pool isn't given.
+
+    A session can be cancelled, abandoning its outstanding requests without
+    disturbing any other sessions on the loop.
+
+    If profiling is enabled, profile_start is an instrument.snapshot() taken
+    when the session was created, so that what was profiled during it can
+    be reported.
+    """
+    def __init__(self, done_cb=None, run_loop=False, pool=None):
+        self.done_cb = done_cb
+        self.run_loop = run_loop
+        self.pool = pool or ConnectionPool()
+        self.outstanding_requests = [] # requests in process
+        self.total_requests = 0
+        self.red = None # the first request made
+        self.cancelled = False
+        self.profile_start = None
+        if instrument.enabled:
+            self.profile_start = instrument.snapshot()
+        self._running = False
+
+    def __getstate__(self):
+        return {
+            'red': None,
+            'done_cb': None,
+            'run_loop': False,
+            'pool': None,
+            'outstanding_requests': [],
+            'total_requests': self.total_requests,
+            'cancelled': self.cancelled,
+            'profile_start': None,
+            '_running': False,
+        }
+
+    def request_start(self, fetcher):
+        "Note that fetcher has started a request."
+        if not self.outstanding_requests:
+            active_sessions.append(self)
+        if self.red is None:
+            self.red = fetcher
+        self.outstanding_requests.append(fetcher)
+        self.total_requests += 1
+
+    def request_done(self, fetcher):
+        "Note that fetcher has finished; if nothing else is, we're done."
+        if self.cancelled:
+            return
+        self.outstanding_requests.remove(fetcher)
+        if self.outstanding_requests:
+            return
+        active_sessions.remove(self)
+        if self.done_cb:
+            self.done_cb(self)
+        if self._running:
+            self._running = False
+            nbhttp.stop()
+
+    def cancel(self):
+        """
+        Abandon any outstanding requests and close their connections. done_cb
+        won't be called, and no more requests will be made in the session.
+        """
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.done_cb = None
+        if self.outstanding_requests:
+            active_sessions.remove(self)
+        for fetcher in self.outstanding_requests:
+            tcp_conn = getattr(fetcher.client, '_tcp_conn', None)
+            if getattr(tcp_conn, 'tcp_connected', False):
+                tcp_conn.close()
+        self.outstanding_requests = []
+        self.pool.close()
+        if self._running:
+            self._running = False
+            nbhttp.stop()
+
+    def run(self):
+        "Run the event loop, if this session is responsible for it."
+        if self.run_loop and not self._running \
+          and self.outstanding_requests:
+            self._running = True
+            nbhttp.run()
+
 
 class RedFetcher(object):
     """
@@ -63,6 +279,10 @@ class RedFetcher(object):
     If provided, type indicates the type of the request, and is used to
     help set messages and status_cb appropriately.
 
+    If session (a RedSession) is provided, the request is made as part of
+    it; otherwise, a new session is created that runs the event loop until
+    the request (and any others made in the same session) is done.
+
     Messages is a list of messages, each of which being a tuple that
     follows the following form:
       (
@@ -75,16 +295,39 @@ class RedFetcher(object):
        **variables  # Optionally, key=value pairs intended for interpolation
                     # into the message; e.g., time_left="5d3h"
       )
+
+    timings is a dictionary of how long each phase of the fetch took, in
+    seconds (None if it didn't happen, e.g., connecting when an existing
+    connection was reused):
+      blocked - waiting for the ConnectionPool to allow the request
+      dns     - looking up the host name (done while opening the connection)
+      connect - opening the TCP connection
+      send    - writing the request
+      wait    - waiting for the first byte of the response
+      parse   - parsing and checking the response headers
+      receive - transferring the response body (including process)
+      process - RED's processing of the response body (decoding, etc.)
+      analyse - RED's analysis once the response is complete
+    The first five and receive (less process) are down to the network and
+    the server; parse, process and analyse are RED's own.
     """
+    timing_phases = ['blocked', 'dns', 'connect', 'send', 'wait', 'parse',
+                     'receive', 'process', 'analyse']
+
+    # If set (before the request is made), a partial response's body is
+    # compared to this as it arrives; see res_body_matches.
+    res_body_expected = None
 
     def __init__(self, iri, method="GET", req_hdrs=None, req_body=None,
-                 status_cb=None, body_procs=None, req_type=None):
+                 status_cb=None, body_procs=None, req_type=None,
+                 session=None):
         self.method = method
         self.req_hdrs = req_hdrs or []
         self.req_body = req_body
         self.status_cb = status_cb
         self.body_procs = body_procs or []
         self.type = req_type
+        self.session = session or RedSession(run_loop=True)
         self.req_ts = None # when the request was started
         self.res_ts = None # when the response was started
         self.res_done_ts = None # when the response was finished
@@ -93,22 +336,29 @@ class RedFetcher(object):
         self.res_status = None
         self.res_phrase = ""
         self.res_hdrs = []
+        self.res_hdrs_len = 0 # bytes, including the status line
+        self.res_transfer_len = 0 # bytes of body, including chunking
         self.parsed_hdrs = {}
-        self.res_body = "" # note: only partial responses; bytes, not unicode
+        self.res_body = "" # excerpt of partial responses; bytes, not unicode
+        self.res_body_matches = None # whether it's res_body_expected
+        self._expected_pos = 0 # how much of res_body_expected has matched
         self.res_body_len = 0
         self.res_body_md5 = None
-        self.res_body_sample = [] # [(offset, chunk)]{,4} Bytes, not unicode
+        self.res_body_sample = BodySampler() # bytes, not unicode
         self.res_body_decode_len = 0
+        self.res_body_decode_ok = True # turn False if we can't decode it
         self.res_complete = False
         self.res_error = None # any parse errors encountered; see nbhttp.error
         # interesting things about the response; set by a variety of things
         self.messages = [] # messages (see above)
         self.client = None
+        self.conn_reused = False # whether an existing connection was used
+        self.conn_reuses = 0 # how many later requests reused our connection
+        self.timings = dict([(phase, None) for phase in self.timing_phases])
+        self._marks = {} # event: time.time() when it happened
+        self._res_pause = None
         self._md5_processor = hashlib.md5()
-        self._gzip_processor = zlib.decompressobj(-zlib.MAX_WBITS)
-        self._in_gzip_body = False
-        self._gzip_header_buffer = ""
-        self._gzip_ok = True # turn False if we have a problem
+        self._decoders = None # [(content-coding, decoder)] in decode order
         try:
             self.uri = iri_to_uri(iri)
         except UnicodeError, why:
@@ -120,124 +370,188 @@ class RedFetcher(object):
         state = self.__dict__
         del state['status_cb']
         del state['body_procs']
+        state['_res_pause'] = None
+        state['_marks'] = {}
         return state
 
     def setMessage(self, subject, msg, subreq=None, **kw):
         "Set a message."
-        kw['response'] = rs.response.get(self.type, rs.response['this'])['en']
-        self.messages.append(msg(subject, subreq, kw))
+        self.messages.append(msg(subject, subreq, kw, self.type))
 
     def done(self):
         "Callback for when the response is complete and analysed."
         raise NotImplementedError
 
+    def pause_response(self, paused):
+        "Stop (if paused is True) or resume reading the response body."
+        if self._res_pause and not self.res_done_ts:
+            self._res_pause(paused)
+
     def _makeRequest(self):
         """
         Make an asynchronous HTTP request to uri, calling status_cb as it's
         updated and done_cb when it's done. Reason is used to explain what the
         request is in the status callback.
         """
-        global outstanding_requests
-        global total_requests
-        outstanding_requests.append(self)
-        total_requests += 1
+        if self.session.cancelled:
+            return
+        self._marks['queued'] = time.time()
+        self.session.request_start(self)
         if 'user-agent' not in [i[0].lower() for i in self.req_hdrs]:
             self.req_hdrs.append(
                 ("User-Agent", "RED/%s (http://redbot.org/)" % __version__))    
+        self.session.pool.acquire(self._origin(), self._sendRequest)
+        self.session.run()
+
+    def _sendRequest(self):
+        "Send the request, once the pool allows it."
         self.client = RedHttpClient(self._response_start)
         if self.status_cb and self.type:
             self.status_cb("fetching %s (%s)" % (self.uri, self.type))
+        self._marks['sending'] = time.time()
         req_body, req_done = self.client.req_start(
             self.method, self.uri, self.req_hdrs, nbhttp.dummy)
+        self._marks['started'] = time.time()
         self.req_ts = nbhttp.now()
         if self.req_body != None:
             req_body(self.req_body)
         req_done(None)
-        if len(outstanding_requests) == 1:
-            nbhttp.run()
+
+    def _origin(self):
+        "Return the (scheme, authority) that the request is made to."
+        scheme, authority = urlparse.urlsplit(self.uri)[:2]
+        return scheme.lower(), authority.lower()
 
     def _response_start(self, version, status, phrase, 
         res_headers, res_pause
     ):
         "Process the response start-line and headers."
+        if self.session.cancelled:
+            return nbhttp.dummy, nbhttp.dummy
+        self._marks['headers'] = time.time()
         self.res_ts = nbhttp.now()
+        self._res_pause = res_pause
         self.res_version = version
         self.res_status = status.decode('iso-8859-1', 'replace')
         self.res_phrase = phrase.decode('iso-8859-1', 'replace')
         self.res_hdrs = res_headers
+        self._conn_used(getattr(self.client, '_tcp_conn', None))
         ra.ResponseHeaderParser(self)
         ra.ResponseStatusChecker(self)
+        self._marks['parsed'] = time.time()
+        self.timings['process'] = 0
         return self._response_body, self._response_done
 
+    def _conn_used(self, tcp_conn):
+        "Note that the response is being received on tcp_conn."
+        opener = self.session.pool.conn_used(self, tcp_conn)
+        if opener is not None:
+            self.conn_reused = True
+            opener.conn_reuses += 1
+            self._report_conn_reuse()
+
+    def _report_conn_reuse(self):
+        """
+        Report that the response came over a connection opened by an earlier
+        request (possibly a subrequest, or another RED's); only the first
+        time, though.
+        """
+        if not [m for m in self.messages if isinstance(m, rs.CONN_REUSED)]:
+            self.setMessage('header-connection', rs.CONN_REUSED)
+
     def _response_body(self, chunk):
+        "Process a chunk of the response body, noting how long it takes."
+        start = time.time()
+        self._process_body(chunk)
+        self.timings['process'] += time.time() - start
+
+    def _process_body(self, chunk):
         "Process a chunk of the response body."
         self._md5_processor.update(chunk)
-        self.res_body_sample.append((self.res_body_len, chunk))
-        if len(self.res_body_sample) > 4:
-            self.res_body_sample.pop(0)
+        offset = self.res_body_len
+        self.res_body_sample.feed(chunk)
         self.res_body_len += len(chunk)
         if self.res_status == "206":
-            # Store only partial responses completely, for error reporting
-            self.res_body += chunk
+            # Keep an excerpt of partial responses, for error reporting,
+            # and compare them to what's expected as they arrive.
+            room = partial_body_excerpt - len(self.res_body)
+            if room > 0:
+                self.res_body += chunk[:room]
+            if self.res_body_expected is not None \
+              and self.res_body_matches is None:
+                end = self._expected_pos + len(chunk)
+                if self.res_body_expected[self._expected_pos:end] == chunk:
+                    self._expected_pos = end
+                else:
+                    self.res_body_matches = False
             self.res_body_decode_len += len(chunk)
             # Don't actually try to make sense of a partial body...
             return
-        content_codings = self.parsed_hdrs.get('content-encoding', [])
-        content_codings.reverse()
-        for coding in content_codings:
-            # TODO: deflate support
-            if coding == 'gzip' and self._gzip_ok:
-                if not self._in_gzip_body:
-                    self._gzip_header_buffer += chunk
-                    try:
-                        chunk = self._read_gzip_header(
-                            self._gzip_header_buffer
-                        )
-                        self._in_gzip_body = True
-                    except IndexError:
-                        return # not a full header yet
-                    except IOError, gzip_error:
-                        self.setMessage('header-content-encoding',
-                                        rs.BAD_GZIP,
-                                        gzip_error=e(str(gzip_error))
-                        )
-                        self._gzip_ok = False
-                        return
-                try:
-                    chunk = self._gzip_processor.decompress(chunk)
-                except zlib.error, zlib_error:
-                    self.setMessage(
-                        'header-content-encoding', 
-                        rs.BAD_ZLIB,
-                        zlib_error=e(str(zlib_error)),
-                        ok_zlib_len=f_num(self.res_body_sample[-1][0]),
-                        chunk_sample=e(chunk[:20].encode('string_escape'))
-                    )
-                    self._gzip_ok = False
+        if not self.res_body_decode_ok:
+            return
+        if self._decoders is None:
+            self._decoders = []
+            codings = self.parsed_hdrs.get('content-encoding', [])
+            for coding in reversed(codings):
+                if coding == 'identity':
+                    continue
+                if not decoders.has_key(coding):
+                    # we can't handle other codecs, so punt on body processing.
+                    self.res_body_decode_ok = False
                     return
-            else:
-                # we can't handle other codecs, so punt on body processing.
+                self._decoders.append((coding, decoders[coding]()))
+        for coding, decoder in self._decoders:
+            try:
+                chunk = decoder.decode(chunk)
+            except IOError, gzip_error:
+                self.setMessage('header-content-encoding',
+                                rs.BAD_GZIP,
+                                gzip_error=e(str(gzip_error))
+                )
+                self.res_body_decode_ok = False
                 return
+            except zlib.error, zlib_error:
+                self.setMessage(
+                    'header-content-encoding', 
+                    rs.BAD_ZLIB,
+                    coding=e(coding),
+                    zlib_error=e(str(zlib_error)),
+                    ok_zlib_len=f_num(offset),
+                    chunk_sample=e(chunk[:20].encode('string_escape'))
+                )
+                self.res_body_decode_ok = False
+                return
+            if not chunk:
+                return # e.g., the gzip header isn't complete yet
         self.res_body_decode_len += len(chunk)
-        if self._gzip_ok:
-            for processor in self.body_procs:
-                # TODO: figure out why raising an error in a body_proc
-                # results in a "server dropped the connection" instead of
-                # a hard error.
-                processor(self, chunk)
+        for processor in self.body_procs:
+            # TODO: figure out why raising an error in a body_proc
+            # results in a "server dropped the connection" instead of
+            # a hard error.
+            processor(self, chunk)
 
     def _response_done(self, err):
         "Finish anaylsing the response, handling any parse errors."
-        global outstanding_requests
+        if self.session.cancelled:
+            return
+        self._marks['done'] = time.time()
+        self._note_timings()
+        if self.res_body_expected is not None \
+          and self.res_body_matches is None:
+            self.res_body_matches = \
+                self._expected_pos == len(self.res_body_expected)
         self.res_complete = True
         self.res_done_ts = nbhttp.now()
         self.res_error = err
         if self.status_cb and self.type:
             self.status_cb("fetched %s (%s)" % (self.uri, self.type))
         self.res_body_md5 = self._md5_processor.digest()
+        if self.client:
+            self.res_hdrs_len = self.client.input_header_length
+            self.res_transfer_len = self.client.input_transfer_length
         # clean up so we can be pickled
         del self._md5_processor 
-        del self._gzip_processor
+        del self._decoders
         if err == None:
             pass
         elif err['desc'] == nbhttp.error.ERR_BODY_FORBIDDEN['desc']:
@@ -280,56 +594,256 @@ class RedFetcher(object):
                     self.setMessage('header-content-md5', rs.CMD5_INCORRECT,
                                              calc_md5=c_md5_calc)
         # analyse, check to see if we're done
+        start = time.time()
         self.done()
-        outstanding_requests.remove(self)
+        self.timings['analyse'] = time.time() - start
         if self.status_cb:
             self.status_cb("%s outstanding requests" % \
-                len(outstanding_requests)
+                (len(self.session.outstanding_requests) - 1)
             )
-        if len(outstanding_requests) == 0:
-            nbhttp.stop()
+        self.session.pool.release(
+            self._origin(), getattr(self.client, '_tcp_conn', None)
+        )
+        self.session.request_done(self)
+
+    def _note_timings(self):
+        "Work out how long each phase of the fetch took, from the marks."
+        marks = self._marks
+        timings = self.timings
+        def phase(name, start, end):
+            if start is not None and end is not None:
+                timings[name] = max(end - start, 0)
+        phase('blocked', marks.get('queued'), marks.get('sending'))
+        connected_ts = getattr(self.client, 'connected_ts', None)
+        if connected_ts is not None \
+          and connected_ts > marks.get('started', connected_ts):
+            # a new connection; the host name is looked up in req_start.
+            phase('dns', marks.get('sending'), marks.get('started'))
+            phase('connect', marks.get('started'), connected_ts)
+        sent_ts = getattr(self.client, 'sent_ts', None)
+        phase('send', connected_ts, sent_ts)
+        phase('wait', sent_ts, getattr(self.client, 'first_byte_ts', None))
+        phase('parse', marks.get('headers'), marks.get('parsed'))
+        phase('receive', marks.get('parsed'), marks.get('done'))
+
+
+class BodySampler(object):
+    """
+    Samples a body within a fixed budget of bytes, as windows of
+    window_size bytes at offsets that are multiples of window_size.
 
-    @staticmethod
-    def _read_gzip_header(content):
+    Strategies are:
+      head   - the first windows of the body
+      tail   - the last windows of the body
+      spread - windows evenly spaced throughout the body; when the budget
+               is used up, every other window is dropped, and only windows
+               at the new spacing are sampled from then on.
+
+    It's true (in a boolean context) once it has any samples.
+    """
+    strategies = ['head', 'tail', 'spread']
+
+    def __init__(self, strategy=None, budget=None, window_size=None):
+        self.strategy = strategy or body_sample_strategy
+        if self.strategy not in self.strategies:
+            raise ValueError, "Unknown sample strategy: %s" % self.strategy
+        self.window_size = window_size or body_sample_window
+        self.max_windows = max((budget or body_sample_budget) / \
+                               self.window_size, 1)
+        self.length = 0 # bytes seen so far
+        self.stride = 1 # spacing of sampled windows, in windows
+        self.full = False # whether the sample can't change any more
+        self._windows = {} # window number: [data, ...]
+        self._order = deque() # window numbers, oldest first (for tail)
+
+    def __len__(self):
+        return len(self._windows)
+
+    def feed(self, chunk):
+        "Sample the next chunk of the body."
+        if self.full or not chunk:
+            return
+        size = self.window_size
+        start = self.length
+        end = self.length = start + len(chunk)
+        first = start / size
+        last = (end - 1) / size
+        if self.strategy == 'head':
+            last = min(last, self.max_windows - 1)
+            self.full = end >= self.max_windows * size
+        elif self.strategy == 'tail':
+            # earlier windows would be dropped by the end of this chunk
+            first = max(first, last - self.max_windows)
+        num = first
+        while num <= last:
+            w_start = num * size
+            pieces = self._windows.get(num, None)
+            if pieces is None:
+                if w_start < start or not self._want(num):
+                    num += 1
+                    continue
+                pieces = self._windows[num] = []
+            pieces.append(chunk[max(w_start - start, 0):w_start + size - start])
+            num += 1
+
+    def _want(self, num):
+        "Decide whether to start sampling window number num."
+        if self.strategy == 'tail':
+            if len(self._windows) >= self.max_windows:
+                del self._windows[self._order.popleft()]
+            self._order.append(num)
+            return True
+        if self.strategy == 'spread':
+            if num % self.stride:
+                return False
+            if len(self._windows) >= self.max_windows:
+                self.stride *= 2
+                for old in self._windows.keys():
+                    if old % self.stride:
+                        del self._windows[old]
+                if num % self.stride:
+                    return False
+        return True
+
+    @property
+    def samples(self):
+        "The samples, as a list of (offset, bytes), in offset order."
+        nums = self._windows.keys()
+        nums.sort()
+        return [(num * self.window_size, "".join(self._windows[num]))
+                for num in nums]
+
+
+class GzipDecoder(object):
+    """
+    Incrementally decodes a gzip (RFC1952) stream.
+
+    The header is parsed by a state machine that works on offsets into the
+    data received so far, so it can be resumed when more arrives; data is
+    only buffered while the header is incomplete (which is rare).
+    """
+    FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0 # how far into _buf the header has been parsed
+        self._state = self._fixed_header
+        self._flag = 0
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+
+    def decode(self, chunk):
         """
-        Parse a string for a GZIP header; if present, return remainder of
-        gzipped content.
+        Decode a chunk, returning whatever data is available. Raises IOError
+        if the header is bad and zlib.error if the data is.
         """
-        # adapted from gzip.py
-        FTEXT, FHCRC, FEXTRA, FNAME, FCOMMENT = 1, 2, 4, 8, 16
-        if len(content) < 10:
-            raise IndexError, "Header not complete yet"
-        magic = content[:2]
+        if self._state is None:
+            return self._inflater.decompress(chunk)
+        if self._buf:
+            self._buf += chunk
+        else:
+            self._buf = chunk
+        while self._state is not None:
+            if not self._state():
+                return "" # header not complete yet
+        chunk = self._buf[self._pos:]
+        self._buf = ""
+        return self._inflater.decompress(chunk)
+
+    # Each state returns True if it's complete, and moves to the next.
+    def _fixed_header(self):
+        if len(self._buf) < 10:
+            return False
+        magic = self._buf[:2]
         if magic != '\037\213':
             raise IOError, \
                 u'Not a gzip header (magic is hex %s, should be 1f8b)' % \
                 magic.encode('hex-codec')
-        method = ord( content[2:3] )
-        if method != 8:
+        if ord(self._buf[2]) != 8:
             raise IOError, 'Unknown compression method'
-        flag = ord( content[3:4] )
-        content_l = list(content[10:])
-        if flag & FEXTRA:
-            # Read & discard the extra field, if present
-            xlen = ord(content_l.pop())
-            xlen = xlen + 256*ord(content_l.pop())
-            content_l = content_l[xlen:]
-        if flag & FNAME:
-            # Read and discard a null-terminated string 
-            # containing the filename
-            while True:
-                s = content_l.pop()
-                if not content_l or s == '\000':
-                    break
-        if flag & FCOMMENT:
-            # Read and discard a null-terminated string containing a comment
-            while True:
-                s = content_l.pop()
-                if not content_l or s == '\000':
-                    break
-        if flag & FHCRC:
-            content_l = content_l[2:]   # Read & discard the 16-bit header CRC
-        return "".join(content_l)
+        self._flag = ord(self._buf[3])
+        self._pos = 10
+        self._state = self._extra_len
+        return True
+
+    def _extra_len(self):
+        if not self._flag & self.FEXTRA:
+            self._state = self._name
+            return True
+        if len(self._buf) < self._pos + 2:
+            return False
+        xlen = ord(self._buf[self._pos]) + 256 * ord(self._buf[self._pos + 1])
+        self._pos += 2 + xlen
+        self._state = self._extra
+        return True
+
+    def _extra(self):
+        # the extra field is skipped by _extra_len; wait until we have it
+        if len(self._buf) < self._pos:
+            return False
+        self._state = self._name
+        return True
+
+    def _name(self):
+        if self._flag & self.FNAME and not self._skip_string():
+            return False
+        self._state = self._comment
+        return True
+
+    def _comment(self):
+        if self._flag & self.FCOMMENT and not self._skip_string():
+            return False
+        self._state = self._hcrc
+        return True
+
+    def _hcrc(self):
+        if self._flag & self.FHCRC:
+            if len(self._buf) < self._pos + 2:
+                return False
+            self._pos += 2
+        self._state = None
+        return True
+
+    def _skip_string(self):
+        "Skip past a null-terminated string, if it's all there."
+        end = self._buf.find('\000', self._pos)
+        if end == -1:
+            return False
+        self._pos = end + 1
+        return True
+
+
+class DeflateDecoder(object):
+    """
+    Incrementally decodes a deflate stream. HTTP specifies the zlib format
+    (RFC1950), but some servers send raw deflate (RFC1951) data; both are
+    handled.
+    """
+    def __init__(self):
+        self._buf = ""
+        self._inflater = None
+        self.raw = None # whether the data is raw deflate
+
+    def decode(self, chunk):
+        "Decode a chunk, returning whatever data is available."
+        if self._inflater is None:
+            self._buf += chunk
+            if len(self._buf) < 2:
+                return ""
+            cmf, flg = ord(self._buf[0]), ord(self._buf[1])
+            self.raw = not (cmf & 0x0f == 8 and (cmf * 256 + flg) % 31 == 0)
+            if self.raw:
+                self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+            else:
+                self._inflater = zlib.decompressobj()
+            chunk, self._buf = self._buf, ""
+        return self._inflater.decompress(chunk)
+
+
+decoders = {
+    'gzip': GzipDecoder,
+    'x-gzip': GzipDecoder,
+    'deflate': DeflateDecoder,
+}
 
 
 def iri_to_uri(iri):
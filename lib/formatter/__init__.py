@@ -29,6 +29,8 @@ THE SOFTWARE.
 
 from collections import defaultdict
 
+from redbot import instrument
+
 __all__ = ['html', 'text', 'har']
 
 _formatters = defaultdict(list)
@@ -52,9 +54,14 @@ def available_formatters():
 class FormatterType(type):
     """
     Type for Formatters that populates _formatters, to keep track
-    of names and their mapping to Formatter-derived classes.
+    of names and their mapping to Formatter-derived classes. Their
+    output methods are profiled (see redbot.instrument).
     """
     def __new__(mcs, name, bases, attrs):
+        for method in ['start_output', 'finish_output']:
+            if attrs.has_key(method):
+                attrs[method] = instrument.timed("%s.%s" % (name, method))(
+                    attrs[method])
         cls = super(FormatterType, mcs).__new__(mcs, name, bases, attrs)
         if attrs.get('name', None) != None:
             _formatters[attrs['name']].append(cls)
@@ -104,6 +111,14 @@ class Formatter(object):
         Output a status message.
         """
         raise NotImplementedError        
+
+    def droid_done(self, red, tag=None):
+        """
+        Note that a RED has finished; tag is None if it's the RED being
+        formatted, otherwise the element that linked to it. Formatters that
+        can show results as they arrive can override this.
+        """
+        pass
         
     def finish_output(self, red):
         """
@@ -35,7 +35,7 @@ except ImportError:
 
 import redbot.speak as rs
 from nbhttp import get_hdr
-from redbot import droid
+from redbot import droid, instrument
 from redbot.formatter import Formatter
 
 
@@ -81,6 +81,10 @@ class HarFormatter(Formatter):
         self.add_entry(ired, page_id)
         for linked_red in [d[0] for d in ired.link_droids]:
             self.add_entry(linked_red, page_id)
+        # only what was profiled during this check (if it was just run)
+        profile_start = getattr(ired.session, 'profile_start', None)
+        if instrument.enabled and profile_start is not None:
+            self.har['log']['_red_profile'] = instrument.report(profile_start)
         self.output(json.dumps(self.har, indent=4))
         
     def add_entry(self, red, page_ref=None):
@@ -115,19 +119,12 @@ class HarFormatter(Formatter):
                 'mimeType': (get_hdr(red.res_hdrs, 'content-type') or [""])[0],
             },
             'redirectURL': (get_hdr(red.res_hdrs, 'location') or [""])[0],
-            'headersSize': red.client.input_header_length,
+            'headersSize': red.res_hdrs_len,
             'bodySize': red.res_body_len,
         }
         
         cache = {}
-        timings = {
-            'dns': -1,
-            'connect': -1,
-            'blocked': 0,
-            'send': 0, 
-            'wait': int((red.res_ts - red.req_ts) * 1000),
-            'receive': int((red.res_done_ts - red.res_ts) * 1000),
-        }
+        timings = self.format_timings(red)
 
         entry.update({
             'request': request,
@@ -152,6 +149,39 @@ class HarFormatter(Formatter):
         self.har['log']['pages'].append(page)
         return page_id
 
+    def format_timings(self, red):
+        """
+        Return HAR timings for red, in milliseconds (-1 where they don't
+        apply). RED's own header parsing, body processing and analysis
+        are also given, as _red_parse, _red_process and _red_analyse.
+        """
+        red_timings = getattr(red, 'timings', None)
+        if not red_timings: # e.g., saved before timings were kept
+            return {
+                'dns': -1,
+                'connect': -1,
+                'blocked': 0,
+                'send': 0, 
+                'wait': int((red.res_ts - red.req_ts) * 1000),
+                'receive': int((red.res_done_ts - red.res_ts) * 1000),
+            }
+        def ms(phase, default=-1):
+            value = red_timings.get(phase, None)
+            if value is None:
+                return default
+            return int(value * 1000)
+        return {
+            'blocked': ms('blocked'),
+            'dns': ms('dns'),
+            'connect': ms('connect'),
+            'send': ms('send', 0),
+            'wait': ms('wait', 0),
+            'receive': ms('receive', 0),
+            '_red_parse': ms('parse'),
+            '_red_process': ms('process'),
+            '_red_analyse': ms('analyse'),
+        }
+
     def format_headers(self, hdrs):
         return [ {'name': n, 'value': v} for n, v in hdrs ]
 
@@ -162,7 +192,7 @@ class HarFormatter(Formatter):
                 "subject": m.subject,
                 "category": m.category,
                 "level": m.level,
-                "summary": m.summary[self.lang] % m.vars
+                "summary": m.show_summary(self.lang)
             }
             smsgs = [i for i in getattr(
                 m.subrequest, "messages", []) if i.level in [rs.l.BAD]]
@@ -171,7 +201,7 @@ class HarFormatter(Formatter):
                 "subject": sm.subject,
                 "category": sm.category,
                 "level": sm.level,
-                "summary": sm.summary[self.lang]
+                "summary": sm.show_summary(self.lang)
             } for sm in smsgs]
             out.append(msg)
         return out
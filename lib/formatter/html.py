@@ -28,7 +28,6 @@ THE SOFTWARE.
 """
 
 import codecs
-import operator
 import os
 import re
 import textwrap
@@ -41,7 +40,7 @@ from urlparse import urljoin
 import nbhttp
 import nbhttp.error as nberror
 import redbot.speak as rs
-from redbot import defns, droid, fetch
+from redbot import droid, instrument
 from redbot.formatter import Formatter, html_header
 from redbot.response_analyse import relative_time, f_num
 
@@ -50,6 +49,7 @@ nl = u"\n"
 # Configuration; override to change.
 static_root = 'static' # where status resources are located
 extra_dir = 'extra' # where extra resources are located
+body_sample_size = 1024 * 128 # how much of the body to show, in bytes
 
 class BaseHtmlFormatter(Formatter):
     """
@@ -65,14 +65,20 @@ class BaseHtmlFormatter(Formatter):
         pass
 
     def start_output(self):
-        if self.kw.get('is_saved', None):
-            extra_title = " <span class='save'>saved results for...</span>"
-        else:
-            extra_title = ""
         if self.kw.get('descend', False):
             descend = "&descend=True"
         else:
             descend = ''
+        if self.kw.get('is_saved', None):
+            extra_title = " <span class='save'>saved results for...</span>"
+        elif self.kw.get('checked', None):
+            extra_title = " <span class='save'>checked %s " \
+                "(<a href='?uri=%s%s&nocache=True'>recheck</a>)</span>" % (
+                relative_time(self.kw['checked'], nbhttp.now()),
+                e_query_arg(self.uri), descend
+            )
+        else:
+            extra_title = ""
         self.output(html_header.__doc__ % {
             'static': static_root,
             'version': droid.__version__,
@@ -105,9 +111,15 @@ window.status="%s";
 </script>
         """ % (nbhttp.now() - self.start, e(message)))
 
-    def final_status(self):
-        self.status("RED made %(reqs)s requests in %(elapse)2.3f seconds." % {
-           'reqs': fetch.total_requests,
+    def final_status(self, red):
+        if red.session.pool:
+            reused = " (%s on reused connections)" % red.session.pool.reused
+        else:
+            reused = ""
+        self.status(
+          "RED made %(reqs)s requests%(reused)s in %(elapse)2.3f seconds." % {
+           'reqs': red.session.total_requests,
+           'reused': reused,
            'elapse': nbhttp.now() - self.start
         })
 
@@ -238,15 +250,22 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
 
     def __init__(self, *args, **kw):
         BaseHtmlFormatter.__init__(self, *args, **kw)
-        self.body_sample_size = 1024 * 128 # how big to allow the sample to be
-        self.sample_seen = 0
+        self.body_sample_size = body_sample_size
+        self.sample_chunks = None # captured so far; None if nothing fed
+        self.sample_seen = 0 # bytes captured
+        self.sample_full = False
         self.sample_complete = True
 
     def feed(self, red, chunk):
         self.store_body_sample(red, chunk)
+
+    def droid_done(self, red, tag=None):
+        if tag is None:
+            self.join_body_sample(red)
         
     def finish_output(self, red):
-        self.final_status()
+        self.join_body_sample(red)
+        self.final_status(red)
         self.header_presenter = HeaderPresenter(red.uri)
         if red.res_complete:
             self.output(self.template % {
@@ -287,6 +306,7 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
 
     def format_header(self, name, value):
         "Return an individual HTML header as HTML"
+        from redbot import defns # only needed (and loaded) here
         token_name = "header-%s" % name.lower()
         py_name = "HDR_" + name.upper().replace("-", "_")
         if hasattr(defns, py_name) and token_name not in \
@@ -309,18 +329,15 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
             uni_sample = unicode(red.body_sample, 'utf-8', 'ignore')
         safe_sample = e(uni_sample)
         message = ""
-        for tag, link_set in red.links.items():
-            for link in link_set:
-                def link_to(matchobj):
-                    return r"%s<a href='%s' class='nocode'>%s</a>%s" % (
-                        matchobj.group(1),
-                        u"?uri=%s" % e_query_arg(
-                            urljoin(red.link_parser.base, link)),
-                        e(link),
-                        matchobj.group(1)
-                    )
-                safe_sample = re.sub(r"(['\"])%s\1" % \
-                    re.escape(link), link_to, safe_sample)
+        links = set()
+        for link_set in red.links.values():
+            links.update(link_set)
+        def link_to(link):
+            return u"<a href='%s' class='nocode'>%s</a>" % (
+                u"?uri=%s" % e_query_arg(urljoin(red.link_parser.base, link)),
+                e(link)
+            )
+        safe_sample = highlight_links(safe_sample, links, link_to)
         if not self.sample_complete:
             message = "<p class='note'>RED isn't showing the whole body, because it's so big!</p>"
         return """<pre class="prettyprint">%s</pre>\n%s""" % (
@@ -343,11 +360,11 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
                 m.level, 
                 e(m.subject), 
                 id(m), 
-                e(m.summary[self.lang] % m.vars)
+                e(m.show_summary(self.lang))
              )
             )
             self.hidden_text.append(
-                ("msgid-%s" % id(m), m.text[self.lang] % m.vars)
+                ("msgid-%s" % id(m), m.show_text(self.lang))
             )
             smsgs = [msg for msg in getattr(m.subrequest, "messages", []) if \
                 msg.level in [rs.l.BAD]]
@@ -358,11 +375,11 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
                             sm.level, 
                             e(sm.subject), 
                             id(sm), 
-                            e(sm.summary[self.lang] % sm.vars)
+                            e(sm.show_summary(self.lang))
                         )
                     )
                     self.hidden_text.append(
-                        ("msgid-%s" % id(sm), sm.text[self.lang] % sm.vars)
+                        ("msgid-%s" % id(sm), sm.show_text(self.lang))
                     )
                 out.append(u"</ul>")
         out.append(u"</ul>\n")
@@ -374,14 +391,13 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
         media_type = red.parsed_hdrs.get('content-type', [""])[0]
         options.append(
             (u"response headers: %s bytes" % \
-             f_num(red.client.input_header_length), 
+             f_num(red.res_hdrs_len), 
              "how large the response headers are, including the status line"
             )
         )
         options.append((u"body: %s bytes" % f_num(red.res_body_len),
             "how large the response body is"))
-        transfer_overhead = red.client.input_transfer_length - \
-            red.res_body_len
+        transfer_overhead = red.res_transfer_len - red.res_body_len
         if transfer_overhead > 0:
             options.append(
                 (
@@ -422,19 +438,34 @@ class SingleEntryHtmlFormatter(BaseHtmlFormatter):
         )
 
     def store_body_sample(self, red, chunk):
-        """store the first self.sample_size bytes of the response"""
-        if not hasattr(red, "body_sample"):
-            red.body_sample = ""
-        if self.sample_seen + len(chunk) < self.body_sample_size:
-            red.body_sample += chunk
-            self.sample_seen += len(chunk)
-        elif self.sample_seen < self.body_sample_size:
-            max_chunk = self.body_sample_size - self.sample_seen
-            red.body_sample += chunk[:max_chunk]
-            self.sample_seen += len(chunk)
-            self.sample_complete = False
-        else:
-            self.sample_complete = False
+        """
+        store the first self.body_sample_size bytes of the response; they're
+        joined into red.body_sample by join_body_sample().
+        """
+        if self.sample_full:
+            if chunk:
+                self.sample_complete = False
+            return
+        if self.sample_chunks is None:
+            self.sample_chunks = []
+        room = self.body_sample_size - self.sample_seen
+        if len(chunk) >= room:
+            if len(chunk) > room:
+                self.sample_complete = False
+            chunk = chunk[:room]
+            self.sample_full = True
+        self.sample_chunks.append(chunk)
+        self.sample_seen += len(chunk)
+
+    def join_body_sample(self, red):
+        "Set red.body_sample to the stored body sample, if there is one."
+        if self.sample_chunks is None or hasattr(red, "body_sample"):
+            return
+        red.body_sample = "".join(self.sample_chunks)
+        self.sample_chunks = [red.body_sample]
+        instrument.count("body sample bytes", self.sample_seen)
+        if not self.sample_complete:
+            instrument.count("body samples truncated")
 
 
 
@@ -443,7 +474,7 @@ class HeaderPresenter(object):
     Present a HTTP header in the Web UI. By default, it will:
        - Escape HTML sequences to avoid XSS attacks
        - Wrap long lines
-    However if a method is present that corresponds to the header's
+    However if a method is listed in presenters for the header's
     field-name, that method will be run instead to represent the value.
     """
 
@@ -456,9 +487,9 @@ class HeaderPresenter(object):
         presentation processing.
         """
         name = name.lower()
-        name_token = name.replace('-', '_')
-        if name_token[0] != "_" and hasattr(self, name_token):
-            return getattr(self, name_token)(name, value)
+        presenter = self.presenters.get(name, None)
+        if presenter is not None:
+            return presenter(self, name, value)
         else:
             return self.I(e(value), len(name))
 
@@ -472,10 +503,13 @@ class HeaderPresenter(object):
             e_query_arg(urljoin(self.uri, svalue)), 
             self.I(e(svalue), len(name))
         )
-    content_location = \
-    location = \
-    x_xrds_location = \
-    BARE_URI
+
+    # field-name: presenter method
+    presenters = {
+        'content-location': BARE_URI,
+        'location': BARE_URI,
+        'x-xrds-location': BARE_URI,
+    }
 
     @staticmethod
     def I(value, sub_width):
@@ -492,12 +526,14 @@ class HeaderPresenter(object):
 class TableHtmlFormatter(BaseHtmlFormatter):
     """
     Present a summary of multiple RED responses.
+
+    The table is output (empty) by start_output(), and each RED's row
+    follows as soon as it's finished (see droid_done()), to be put in
+    place by script. Rows for linked REDs are held back until the main
+    RED's row is out.
     """
-    # HTML template for the main response body
+    # HTML template for the rest of the response body
     template = u"""\
-    <table id='summary'>
-    %(table)s
-    </table>
     <p class="options">
         %(options)s
     </p>
@@ -512,6 +548,11 @@ class TableHtmlFormatter(BaseHtmlFormatter):
 
     </body></html>
     """
+    # HTML template for a RED's row, to be moved into its group
+    row_template = u"""
+<table class='hidden' id='droid-%(num)s'>%(row)s</table>
+<script>place_droid(%(num)s, "%(group)s");</script>
+"""
     can_multiple = True
     name = "html"
 
@@ -519,11 +560,34 @@ class TableHtmlFormatter(BaseHtmlFormatter):
     def __init__(self, *args, **kw):
         BaseHtmlFormatter.__init__(self, *args, **kw)
         self.problems = []
+        self.problem_index = {} # message: index in problems
+        self.rows_shown = set() # ids of REDs whose rows have been output
+        self.main_shown = False
+        self.pending = [] # (red, tag) finished before the main RED
+
+    def start_output(self):
+        BaseHtmlFormatter.start_output(self)
+        self.output(self.format_tables())
+
+    def droid_done(self, red, tag=None):
+        if tag is None:
+            self.show_droid(red, None)
+            self.main_shown = True
+            for pending_red, pending_tag in self.pending:
+                self.show_droid(pending_red, pending_tag)
+            self.pending = []
+        elif self.main_shown:
+            self.show_droid(red, tag)
+        else:
+            self.pending.append((red, tag))
 
     def finish_output(self, red):
-        self.final_status()
+        self.final_status(red)
+        # show anything we haven't heard about (e.g., saved results)
+        self.droid_done(red)
+        for droid, tag in red.link_droids:
+            self.show_droid(droid, tag)
         self.output(self.template % {
-            'table': self.format_tables(red),
             'problems': self.format_problems(),
             'options': self.format_options(red),
             'footer': self.format_footer(),
@@ -537,19 +601,34 @@ class TableHtmlFormatter(BaseHtmlFormatter):
           ('iframe', 'IFrame Links'),
           ('img', 'Image Links'),
     ]
-    def format_tables(self, red):
-        out = [self.format_table_header()]
-        out.append(self.format_droid(red))
+    link_groups = set([tag for tag, heading in link_order])
+
+    def format_tables(self):
+        "Return the summary table, with a (hidden) group for each link type."
+        out = [u"<table id='summary'>", u"<tbody id='droids-main'>",
+               self.format_table_header(), u"</tbody>"]
         for hdr_tag, heading in self.link_order:
-            droids = [d[0] for d in red.link_droids if d[1] == hdr_tag]
-            if droids:
-                droids.sort(key=operator.attrgetter('uri'))
-                out.append(
-                    self.format_table_header(heading + " (%s)" % len(droids))
-                )
-                out += [self.format_droid(d) for d in droids]
+            out.append(u"<tbody id='droids-%s' class='hidden'>" % hdr_tag)
+            out.append(self.format_table_header(
+                heading + u" (<span class='count'>0</span>)"
+            ))
+            out.append(u"</tbody>")
+        out.append(u"</table>")
         return nl.join(out)
 
+    def show_droid(self, red, tag):
+        "Output red's row, unless it's already been shown."
+        if id(red) in self.rows_shown:
+            return
+        if tag is not None and tag not in self.link_groups:
+            return
+        self.rows_shown.add(id(red))
+        self.output(self.row_template % {
+            'num': len(self.rows_shown),
+            'row': self.format_droid(red),
+            'group': tag or 'main',
+        })
+
     def format_droid(self, red):
         out = [u'<tr class="droid %s">']
         m = 50
@@ -609,16 +688,17 @@ class TableHtmlFormatter(BaseHtmlFormatter):
             out.append(u"<td>")
             pr_enum = []
             for problem in problems:
-                if problem not in self.problems:
+                if problem not in self.problem_index:
+                    self.problem_index[problem] = len(self.problems)
                     self.problems.append(problem)
-                pr_enum.append(self.problems.index(problem))
+                pr_enum.append(self.problem_index[problem])
             # add the problem number to the <tr> so we can highlight
             out[0] = out[0] % u" ".join(["%d" % p for p in pr_enum])
             # append the actual problem numbers to the final <td>
             for p in pr_enum:
                 m = self.problems[p]
                 out.append("<span class='prob_num'> %s <span class='hidden'>%s</span></span>" % (
-                    p + 1, e(m.summary[self.lang] % m.vars)
+                    p + 1, e(m.show_summary(self.lang))
                     )
                 )
         else:
@@ -694,16 +774,50 @@ class TableHtmlFormatter(BaseHtmlFormatter):
                     m.level, 
                     e(m.subject), 
                     id(m), 
-                    e(m.summary[self.lang] % m.vars)
+                    e(m.show_summary(self.lang))
                 )
             )
             self.hidden_text.append(
-                ("msgid-%s" % id(m), m.text[self.lang] % m.vars)
+                ("msgid-%s" % id(m), m.show_text(self.lang))
             )
         out.append(u"</ol>\n")
         return nl.join(out)
 
 
+def highlight_links(text, links, link_to):
+    """
+    Return text with each quoted (with ' or ") occurrence of a member of
+    links replaced by link_to(link), still in its quotes.
+
+    This is done in one scan of text; at each quote, the quoted string is
+    looked up in links, so the cost doesn't depend on how many links
+    there are.
+    """
+    if not links:
+        return text
+    longest = max([len(link) for link in links])
+    quoted = re.compile("'([^']{0,%i})'|\"([^\"]{0,%i})\"" % (
+        longest, longest))
+    out = []
+    pos = 0
+    match = quoted.search(text)
+    while match:
+        link = match.group(1)
+        if link is None:
+            link = match.group(2)
+        if link in links:
+            quote = text[match.start()]
+            out.append(text[pos:match.start()])
+            out.append(u"%s%s%s" % (quote, link_to(link), quote))
+            pos = match.end()
+            match = quoted.search(text, pos)
+        else:
+            # the closing quote may open a link
+            match = quoted.search(text, match.start() + 1)
+    out.append(text[pos:])
+    return u"".join(out)
+
+
 # Escaping functions. 
 uri_gen_delims = r":/?#[]@"
 uri_sub_delims = r"!$&'()*+,;="
@@ -69,6 +69,25 @@ jQuery.fn.hoverPopup = function(fnText, fnOver, fnOut) {
     return jQuery.fn.hoverIntent.call(this, fnOverPopup, fnOutPopup);
 };
 
+/* multiple result display: move a droid's row into its group as it arrives */
+function place_droid(num, group) {
+    var holder = $("#droid-" + num);
+    var row = holder.find("tr.droid");
+    var tbody = $("#droids-" + group);
+    var uri = row.find("td.uri a").attr("title");
+    var later = tbody.children("tr.droid").filter(function(){
+        return $(this).find("td.uri a").attr("title") > uri;
+    });
+    if (later.length) {
+        later.eq(0).before(row);
+    } else {
+        tbody.append(row);
+    }
+    holder.remove();
+    tbody.removeClass("hidden");
+    tbody.find("span.count").text(tbody.children("tr.droid").length);
+}
+
 
 $(document).ready(function(){
     var hidden_list = $("#hidden_list");
@@ -65,7 +65,7 @@ class RstOutputFormatter(object):
         for m in messages:
             out.append(
                 "- %s" %
-                (self.flagize(m.level, m.summary["en"] % m.vars))
+                (self.flagize(m.level, m.show_summary("en")))
             )
             smsgs = [msg for msg in getattr(m.subrequest, "messages", []) if msg.level in [rs.l.BAD]]
             if smsgs:
@@ -73,7 +73,7 @@ class RstOutputFormatter(object):
                 for sm in smsgs:
                     out.append(
                         "%s" %
-                        (self.flagize(sm.level, sm.summary["en"] % sm.vars))
+                        (self.flagize(sm.level, sm.show_summary("en")))
                     )
                 out.append("")
         out.append("")
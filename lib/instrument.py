@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+"""
+Profiling for RED's analysis stages.
+
+When enabled, each stage (a function decorated with timed(), or one called
+through call()) has its calls, wall-clock time and CPU time counted, so
+that it's possible to see where a check spends its time. Times are
+inclusive (e.g., ResponseHeaderParser includes the time for each header's
+handler), and are kept for the whole process, until reset(); to see what
+happened over a period (e.g., a check in a long-running server), take a
+snapshot() at its start and give it to report() at the end. Stages can
+also add to counters (e.g., of bytes processed) with count().
+
+When it isn't enabled (the default), a timed function only checks a flag
+before calling the real one.
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import time
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+enabled = False
+_stats = {} # stage: [calls, wall seconds, CPU seconds]
+_counts = {} # counter: total
+
+
+def enable(on=True):
+    "Start (or, if on is False, stop) profiling."
+    global enabled
+    enabled = on
+
+def reset():
+    "Forget what's been profiled so far."
+    _stats.clear()
+    _counts.clear()
+
+def timed(stage):
+    """
+    Decorator to profile a function as stage, when profiling is enabled.
+    """
+    def wrap(func):
+        def timed_func(*args, **kw):
+            if not enabled:
+                return func(*args, **kw)
+            return call(stage, func, *args, **kw)
+        timed_func.__name__ = func.__name__
+        timed_func.__doc__ = func.__doc__
+        return timed_func
+    return wrap
+
+def call(stage, func, *args, **kw):
+    "Call func with args and kw, profiling it as stage."
+    wall_start = time.time()
+    cpu_start = time.clock()
+    try:
+        return func(*args, **kw)
+    finally:
+        try:
+            stats = _stats[stage]
+        except KeyError:
+            stats = _stats[stage] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += time.time() - wall_start
+        stats[2] += time.clock() - cpu_start
+
+def count(counter, n=1):
+    "Add n to counter, if profiling is enabled."
+    if enabled:
+        _counts[counter] = _counts.get(counter, 0) + n
+
+def snapshot():
+    "Return a copy of what's been profiled so far, for report()."
+    return (
+        dict([(stage, tuple(stats)) for (stage, stats) in _stats.items()]),
+        _counts.copy()
+    )
+
+def report(since=None):
+    """
+    Return what's been profiled, as a dictionary of
+    stage: {'calls': n, 'wall': ms, 'cpu': ms}, along with
+    counter: {'count': total}. If since (from snapshot()) is given, only
+    what's been profiled after it was taken is included.
+
+    Note that this includes everything done in the process over that time,
+    including (for example) any other checks run at the same time.
+    """
+    stats_since, counts_since = since or ({}, {})
+    result = {}
+    for stage, (calls, wall, cpu) in _stats.items():
+        calls_then, wall_then, cpu_then = \
+            stats_since.get(stage, (0, 0.0, 0.0))
+        if calls == calls_then:
+            continue
+        result[stage] = {
+            'calls': calls - calls_then,
+            'wall': round((wall - wall_then) * 1000, 3),
+            'cpu': round((cpu - cpu_then) * 1000, 3)
+        }
+    for counter, total in _counts.items():
+        total -= counts_since.get(counter, 0)
+        if total:
+            result[counter] = {'count': total}
+    return result
+
+def dump(fh):
+    "Write the report to the file-like object fh, as JSON."
+    fh.write(json.dumps(report(), indent=4, sort_keys=True))
+    fh.write("\n")
@@ -27,25 +27,34 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
-from htmlentitydefs import entitydefs
+import re
+from htmlentitydefs import entitydefs, name2codepoint
 from HTMLParser import HTMLParser
 from urlparse import urljoin
 
-from redbot import response_analyse
+from redbot import instrument, response_analyse
 from redbot.response_analyse import ResponseHeaderParser as RHP
 
-class HTMLLinkParser(HTMLParser):
+# which kind of parser to use; see parsers. 'scan' (LinkScanner) is much
+# faster, but hasn't been used as widely.
+parser = 'htmlparser'
+
+
+class LinkParser(object):
     """
     Parse the links out of an HTML document in a very forgiving way.
 
     feed() accepts a RedFetcher object (which it uses HTTP response headers
     from) and a chunk of the document at a time.
 
-    When links are found, process_link will be called for eac with the
+    When links are found, process_link will be called for each with the
     following arguments;
       - link (absolute URI as a unicode string)
       - tag (name of the element that contained it)
       - title (title attribute as a unicode string, if any)
+
+    Subclasses implement parse(), which is given each chunk as a unicode
+    string, and call handle_starttag() for each start tag.
     """
 
     link_parseable_types = [
@@ -54,24 +63,24 @@ class HTMLLinkParser(HTMLParser):
         'application/atom+xml'
     ]
 
+    link_types = {
+        'link': 'href',
+        'a': 'href',
+        'img': 'src',
+        'script': 'src',
+        'frame': 'src',
+        'iframe': 'src',
+    }
+
     def __init__(self, base_uri, process_link, err):
         self.base = base_uri
         self.process_link = process_link
         self.err = err
         self.http_enc = 'latin-1'
         self.doc_enc = None
-        self.link_types = {
-            'link': 'href',
-            'a': 'href',
-            'img': 'src',
-            'script': 'src',
-            'frame': 'src',
-            'iframe': 'src',
-        }
         self.errors = 0
         self.last_err_pos = None
         self.ok = True
-        HTMLParser.__init__(self)
 
     def __getstate__(self):
         return {
@@ -83,6 +92,7 @@ class HTMLLinkParser(HTMLParser):
             'ok': self.ok,
         }
 
+    @instrument.timed("LinkParser.feed")
     def feed(self, response, chunk):
         "Feed a given chunk of HTML data to the parser"
         if not self.ok:
@@ -95,7 +105,7 @@ class HTMLLinkParser(HTMLParser):
                         chunk = unicode(chunk, self.doc_enc or self.http_enc, 'ignore')
                     except LookupError:
                         pass
-                HTMLParser.feed(self, chunk)
+                self.parse(chunk)
             except BadErrorIReallyMeanIt:
                 pass
             except Exception, why: # oh, well...
@@ -105,9 +115,13 @@ class HTMLLinkParser(HTMLParser):
         else:
             self.ok = False
 
+    def parse(self, chunk):
+        "Parse a chunk of the document."
+        raise NotImplementedError
+
     def handle_starttag(self, tag, attrs):
         attr_d = dict(attrs)
-        title = attr_d.get('title', '').strip()
+        title = (attr_d.get('title', '') or '').strip()
         if tag in self.link_types.keys():
             target = attr_d.get(self.link_types[tag], "")
             if target:
@@ -116,7 +130,7 @@ class HTMLLinkParser(HTMLParser):
                 self.process_link(target, tag, title)
         elif tag == 'base':
             self.base = attr_d.get('href', self.base)
-        elif tag == 'meta' and attr_d.get('http-equiv', '').lower() == 'content-type':
+        elif tag == 'meta' and (attr_d.get('http-equiv', '') or '').lower() == 'content-type':
             ct = attr_d.get('content', None)
             if ct:
                 try:
@@ -133,6 +147,20 @@ class HTMLLinkParser(HTMLParser):
                         param_dict[param.lower()] = None
                 self.doc_enc = param_dict.get('charset', self.doc_enc)
 
+
+class HTMLLinkParser(LinkParser, HTMLParser):
+    """
+    A LinkParser using the standard library's HTMLParser, which looks at
+    the whole document.
+    """
+
+    def __init__(self, base_uri, process_link, err):
+        LinkParser.__init__(self, base_uri, process_link, err)
+        HTMLParser.__init__(self)
+
+    def parse(self, chunk):
+        HTMLParser.feed(self, chunk)
+
     def handle_charref(self, name):
         return entitydefs.get(name, '')
 
@@ -152,6 +180,144 @@ class HTMLLinkParser(HTMLParser):
             if self.err:
                 self.err(message)
 
+
+class LinkScanner(LinkParser):
+    """
+    A LinkParser that only looks for the start tags it's interested in
+    (along with comments, and the ends of scripts and styles, which can
+    hide them), skipping the rest of the document with a regular
+    expression search.
+
+    Anything that might be cut off at the end of a chunk is kept until the
+    next one.
+
+    It finds the same links as HTMLLinkParser, except that:
+      - a "<" in an attribute value of a tag it isn't interested in can
+        look like the start of a tag (e.g., <div title="<a href='/x'>">
+        gives /x), and
+      - tags that don't end within max_tag characters are ignored.
+    """
+
+    _start = re.compile(r"<(?:(!--)|(%s)(?=[\s/>]))" % "|".join(
+        LinkParser.link_types.keys() + ['base', 'meta', 'style']), re.I)
+    _attr = re.compile(r"""([^\s/>="']+)"""
+        r"""(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|(["'])|([^\s>]*)))?""")
+    _comment_end = re.compile("-->")
+    _raw_ends = {
+        'script': re.compile(r"</script", re.I),
+        'style': re.compile(r"</style", re.I),
+    }
+    _charref = re.compile(r"&(#?[xX]?(?:[0-9a-fA-F]+|\w{1,8}));")
+    max_tag = 8 * 1024 # characters to wait for the end of a tag
+
+    def __init__(self, base_uri, process_link, err):
+        LinkParser.__init__(self, base_uri, process_link, err)
+        self._rest = u"" # unparsed end of the last chunk
+        self._until = None # what we're skipping to the end of, if anything
+
+    def parse(self, chunk):
+        text = self._rest + chunk
+        self._rest = u""
+        pos = 0
+        while True:
+            if self._until is not None:
+                end = self._until.search(text, pos)
+                if end is None:
+                    # keep enough to find the end, if it's cut off
+                    self._rest = text[max(pos, len(text) - 8):]
+                    return
+                self._until = None
+                pos = end.end()
+            start = self._start.search(text, pos)
+            if start is None:
+                lt = text.rfind("<", pos)
+                if lt != -1 and len(text) - lt < 10: # might be cut off
+                    self._rest = text[lt:]
+                return
+            if start.group(1): # comment
+                self._until = self._comment_end
+                pos = start.end()
+                continue
+            tag = start.group(2).lower()
+            attrs, end = self._tag_attrs(text, start.end())
+            if attrs is None:
+                if len(text) - start.start() < self.max_tag:
+                    self._rest = text[start.start():]
+                    return
+                pos = start.end() # give up on this one
+                continue
+            pos = end
+            if self._raw_ends.has_key(tag):
+                self._until = self._raw_ends[tag]
+            self.handle_starttag(tag, attrs)
+
+    def _tag_attrs(self, text, pos):
+        """
+        Parse the attributes of the tag whose name ends at pos in text.
+        Returns a list of (name, value) and where the tag ends, or
+        (None, None) if it doesn't end in text.
+
+        Quotes only delimit values directly after "=" (and any
+        whitespace), so an apostrophe in an unquoted value (e.g.,
+        alt=Don't) doesn't hide the rest of the document.
+        """
+        attrs = []
+        end = len(text)
+        while pos < end:
+            if text[pos] == ">":
+                return attrs, pos + 1
+            attr = self._attr.match(text, pos)
+            if attr is None:
+                pos += 1 # whitespace, "/", or a stray "=" or quote
+                continue
+            name, dq, sq, unclosed, uq = attr.groups()
+            if unclosed:
+                return None, None # the value might continue later
+            attrs.append((name.lower(), _attr_value(dq, sq, uq)))
+            pos = attr.end()
+        return None, None
+
+
+def _attr_value(dq, sq, uq):
+    """
+    Return an attribute's value, given its double-quoted, single-quoted and
+    unquoted forms (only one of which can be set; if none are, it didn't
+    have one).
+    """
+    value = dq
+    if value is None:
+        value = sq
+    if value is None:
+        value = uq
+    if value and "&" in value:
+        value = LinkScanner._charref.sub(_unescape, value)
+    return value
+
+def _unescape(match):
+    "Replace a character reference, as HTMLParser does for attributes."
+    ref = match.group(1)
+    try:
+        if ref[0] == "#":
+            if ref[1] in "xX":
+                return unichr(int(ref[2:], 16))
+            return unichr(int(ref[1:]))
+        if ref == "apos":
+            return u"'"
+        return unichr(name2codepoint[ref])
+    except (ValueError, KeyError, OverflowError):
+        return "&%s;" % ref
+
+
+parsers = {
+    'htmlparser': HTMLLinkParser,
+    'scan': LinkScanner,
+}
+
+def make_parser(base_uri, process_link, err):
+    "Return a link parser of the kind set by parser."
+    return parsers[parser](base_uri, process_link, err)
+
+
 class BadErrorIReallyMeanIt(Exception):
     """See http://bugs.python.org/issue8885 for why this is necessary."""
     pass
@@ -173,5 +339,5 @@ if "__main__" == __name__:
             TestFetcher.count += 1
             out = "%.3d) [%s] %s" % (TestFetcher.count, tag, link)
             print out.encode('utf-8', 'strict')
-    p = HTMLLinkParser(uri, TestFetcher.show_link, TestFetcher.err)
+    p = make_parser(uri, TestFetcher.show_link, TestFetcher.err)
     TestFetcher(uri, req_hdrs=req_hdrs, body_procs=[p.feed])
@@ -50,12 +50,14 @@ import calendar
 import locale
 import re
 import time
+import types
 from cgi import escape as e
 from email.utils import parsedate as lib_parsedate
 from urlparse import urljoin
 
 import nbhttp.error
 import redbot.speak as rs
+from redbot import instrument
 from redbot.uri_validate import URI, URI_reference
 
 
@@ -65,6 +67,7 @@ rfc2616 = "http://www.apps.ietf.org/rfc/rfc2616.html#%s"
 ### configuration
 max_hdr_size = 4 * 1024
 max_ttl_hdr = 20 * 1024
+date_cache_size = 1000 # number of parsed HTTP dates to remember
 
 # generic syntax regexen (assume processing with re.VERBOSE)
 TOKEN = r'(?:[!#\$%&\'\*\+\-\.\^_`|~A-Za-z0-9]+?)'
@@ -100,60 +103,234 @@ DATE = r"""(?:\w{3},\ [0-9]{2}\ \w{3}\ [0-9]{4}\ [0-9]{2}:[0-9]{2}:[0-9]{2}\ GMT
          \w{3}\ \w{3}\ [0-9 ][0-9]\ [0-9]{2}:[0-9]{2}:[0-9]{2}\ [0-9]{4})
         """
 
+# compiled regexen, shared by all header methods. The re module's own cache
+# is small, and the big VERBOSE patterns (e.g., COMMENT, URI) push each
+# other out of it when checking lots of responses.
+_compiled = {}
+def compile_re(exp, flags=0):
+    "Compile a regex once, and keep it around."
+    key = (exp, flags)
+    try:
+        return _compiled[key]
+    except KeyError:
+        compiled = _compiled[key] = re.compile(exp, flags)
+        return compiled
+
+class LazyRe(object):
+    """
+    A regex that isn't compiled (with compile_re) until it's used, so that
+    importing this module is quick. Once compiled, the regex's methods are
+    kept on the instance, so there's no overhead for later calls.
+    """
+    def __init__(self, exp, flags=0):
+        self.exp = exp
+        self.flags = flags
+
+    def __getattr__(self, name):
+        value = getattr(compile_re(self.exp, self.flags), name)
+        setattr(self, name, value)
+        return value
+
+FIELD_SPLIT_RE = LazyRe(r'((?:[^",]|%s)+)(?=%s|\s*$)' % (
+    QUOTED_STRING, COMMA))
+FIELD_NAME_RE = LazyRe(r"^\s*%s\s*$" % TOKEN)
+DATE_RE = LazyRe(r"%s$" % DATE, re.VERBOSE)
+ABSOLUTE_URI_RE = LazyRe(r"^\s*%s\s*$" % URI, re.VERBOSE)
+QUOTED_PAIR_RE = LazyRe(r'\\(.)')
+
+
+class LRUCache(object):
+    """
+    A dictionary-like cache that holds at most max_size items, discarding
+    the least recently used when it's full. Counts hits and misses.
+    """
+    _PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._links = {} # key: [prev, next, key, value]
+        self._root = root = [] # most recent is root[_NEXT]
+        root[:] = [root, root, None, None]
+
+    def __len__(self):
+        return len(self._links)
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def get(self, key, default=None):
+        "Return the value for key (making it most recent), or default."
+        link = self._links.get(key, None)
+        if link is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._unlink(link)
+        self._push(link)
+        return link[self._VALUE]
+
+    def __setitem__(self, key, value):
+        link = self._links.get(key, None)
+        if link is not None:
+            link[self._VALUE] = value
+            self._unlink(link)
+        else:
+            if len(self._links) >= self.max_size:
+                oldest = self._root[self._PREV]
+                self._unlink(oldest)
+                del self._links[oldest[self._KEY]]
+            link = [None, None, key, value]
+            self._links[key] = link
+        self._push(link)
+
+    def clear(self):
+        self._links.clear()
+        self._root[:] = [self._root, self._root, None, None]
+
+    def _unlink(self, link):
+        link[self._PREV][self._NEXT] = link[self._NEXT]
+        link[self._NEXT][self._PREV] = link[self._PREV]
+
+    def _push(self, link):
+        root = self._root
+        link[self._PREV] = root
+        link[self._NEXT] = root[self._NEXT]
+        root[self._NEXT][self._PREV] = link
+        root[self._NEXT] = link
+
+
+_months = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def parse_fixdate(value):
+    """
+    Parse an IMF-fixdate (e.g., "Sun, 06 Nov 1994 08:49:37 GMT") into
+    seconds since the epoch, without any regex. Returns None if value isn't
+    in that format.
+    """
+    if len(value) != 29 or value[3:5] != ', ' or value[25:] != ' GMT' \
+      or value[7] != ' ' or value[11] != ' ' or value[16] != ' ' \
+      or value[19] != ':' or value[22] != ':':
+        return None
+    month = _months.get(value[8:11], None)
+    if month is None:
+        return None
+    digits = value[5:7] + value[12:16] + value[17:19] + value[20:22] + \
+             value[23:25]
+    if not digits.isdigit() or not value[:3].isalpha():
+        return None
+    try:
+        return calendar.timegm((
+            int(value[12:16]), month, int(value[5:7]),
+            int(value[17:19]), int(value[20:22]), int(value[23:25]),
+            0, 0, 0
+        ))
+    except ValueError: # e.g., non-ASCII digits
+        return None
+
 
 def GenericHeaderSyntax(meth):
     """
-    Decorator to take a list of header values, split on commas (except where
-    escaped) and return a list of header field-values. This will not work for
-    Set-Cookie (which contains an unescaped comma) and similar headers
-    containing bare dates.
+    Decorator to mark that a header's list of values should be split on
+    commas (except where escaped) into a list of header field-values before
+    it's handled. This will not work for Set-Cookie (which contains an
+    unescaped comma) and similar headers containing bare dates.
 
     E.g.,
       ["foo,bar", "baz, bat"]
     becomes
       ["foo", "bar", "baz", "bat"]
     """
-    def new(self, name, values):
-        values = sum(
-            [[f.strip() for f in re.findall(r'((?:[^",]|%s)+)(?=%s|\s*$)' %
-             (QUOTED_STRING, COMMA), v)] for v in values], []
-        ) or ['']
-        return meth(self, name, values)
-    return new
+    meth.generic_syntax = True
+    return meth
 
 def SingleFieldValue(meth):
     """
-    Decorator to make sure that there's only one value.
+    Decorator to mark that a header should only have one value.
     """
-    def new(self, name, values):
-        if len(values) > 1:
-            self.setMessage(name, rs.SINGLE_HEADER_REPEAT)
-        return meth(self, name, values)
-    return new
+    meth.single_value = True
+    return meth
 
 def CheckFieldSyntax(exp, ref):
     """
     Decorator to check each header field-value to conform to the regex exp,
     and if not to point users to url ref.
     """
+    exp_re = LazyRe(r"^\s*(?:%s)\s*$" % exp, re.VERBOSE)
     def wrap(meth):
-        def new(self, name, values):
-            for value in values:
-                if not re.match(r"^\s*(?:%s)\s*$" % exp, value, re.VERBOSE):
-                    self.setMessage(name, rs.BAD_SYNTAX, ref_uri=ref)
-                    def bad_syntax(self, name, values):
-                        return None
-                    return bad_syntax(self, name, values)
-            return meth(self, name, values)
-        return new
+        meth.syntax = (exp_re, ref)
+        return meth
     return wrap
 
+
+class HeaderHandler(object):
+    """
+    A function that parses a header's values, along with what the
+    decorators above say about them.
+
+    Values are prepared in a fixed order: they're split (if generic syntax),
+    checked for repeats (if single value), and then checked for syntax;
+    if the syntax is bad, the function isn't called.
+    """
+    def __init__(self, func):
+        self.func = func
+        self.generic_syntax = getattr(func, 'generic_syntax', False)
+        self.single_value = getattr(func, 'single_value', False)
+        self.syntax = getattr(func, 'syntax', None) # (regex, ref)
+
+    def __call__(self, parser, name, values):
+        if self.generic_syntax:
+            values = sum(
+                [[f.strip() for f in FIELD_SPLIT_RE.findall(v)]
+                 for v in values], []
+            ) or ['']
+        if self.single_value and len(values) > 1:
+            parser.setMessage(name, rs.SINGLE_HEADER_REPEAT)
+        if self.syntax:
+            exp_re, ref = self.syntax
+            for value in values:
+                if not exp_re.match(value):
+                    parser.setMessage(name, rs.BAD_SYNTAX, ref_uri=ref)
+                    return None
+        return self.func(parser, name, values)
+
+
+class HeaderParserType(type):
+    """
+    Type for header parsers that builds the handlers table, mapping
+    lowercase field-names to HeaderHandlers. Any method whose name is all
+    lowercase and doesn't start with an underscore handles the header
+    with that name (with underscores replaced by dashes).
+    """
+    def __new__(mcs, name, bases, attrs):
+        cls = super(HeaderParserType, mcs).__new__(mcs, name, bases, attrs)
+        handlers = {}
+        for base in reversed(bases):
+            handlers.update(getattr(base, 'handlers', {}))
+        for attr_name, value in attrs.items():
+            if attr_name[0] != '_' and attr_name.islower() \
+              and isinstance(value, types.FunctionType):
+                handlers[attr_name.replace('_', '-')] = HeaderHandler(value)
+        cls.handlers = handlers
+        return cls
+
+
 class ResponseHeaderParser(object):
     """
     Parse and check the response for obvious syntactic errors,
     as well as semantic errors that are self-contained (i.e.,
     it can be determined without examining other headers, etc.).
+
+    Each header is handled by looking up its field-name in handlers;
+    parsers for other headers can be added with register().
     """
+    __metaclass__ = HeaderParserType
+
+    @instrument.timed("ResponseHeaderParser")
     def __init__(self, red):
         self.red = red
         hdr_dict = {}
@@ -178,7 +355,7 @@ class ResponseHeaderParser(object):
                 self.setMessage('%s' % name.lower(), rs.HEADER_VALUE_ENCODING,
                                 header_name=name)
             clean_res_hdrs.append((name, value))
-            if not re.match("^\s*%s\s*$" % TOKEN, name):
+            if not FIELD_NAME_RE.match(name):
                 self.setMessage(name, rs.FIELD_NAME_BAD_SYNTAX)
             norm_name = name.lower()
             value = value.strip()
@@ -194,22 +371,61 @@ class ResponseHeaderParser(object):
                             header_block_size=f_num(header_block_size))
         # build a dictionary of header values
         for nn, (fn, values) in hdr_dict.items():
-            name_token = nn.replace('-', '_')
-            # anything starting with an underscore or with any caps won't match
-            if hasattr(self, name_token):
-                parsed_value = getattr(self, name_token)(fn, values)
+            handler = self.handlers.get(nn, None)
+            if handler is not None:
+                if instrument.enabled:
+                    parsed_value = instrument.call(
+                        "header %s" % nn, handler, self, fn, values)
+                else:
+                    parsed_value = handler(self, fn, values)
                 if parsed_value != None:
                     self.red.parsed_hdrs[nn] = parsed_value
 
+    @classmethod
+    def register(cls, field_name, func):
+        """
+        Use func to parse the header field_name. It's called with the parser,
+        the field-name and a list of values, and can use the decorators above;
+        if it returns anything other than None, that's the parsed value.
+        """
+        cls.handlers[field_name.lower()] = HeaderHandler(func)
+
     def setMessage(self, name, msg, **vars):
         ident = 'header-%s' % name.lower()
         self.red.setMessage(ident, msg, field_name=name, **vars)
 
-    @staticmethod
-    def _parseDate(values):
+    # raw date string: seconds since epoch (or None if bad); made when
+    # it's first used, so that date_cache_size can be set beforehand.
+    date_cache = None
+
+    @classmethod
+    def _parseDate(cls, values):
         """Parse a HTTP date. Raises ValueError if it's bad."""
         value = values[-1]
-        if not re.match(r"%s$" % DATE, value, re.VERBOSE):
+        cache = ResponseHeaderParser.date_cache
+        if cache is None or cache.max_size != date_cache_size:
+            cache = ResponseHeaderParser.date_cache = \
+                LRUCache(date_cache_size)
+        date = cache.get(value, False)
+        if date is False:
+            date = parse_fixdate(value)
+            if date is None:
+                try:
+                    date = cls._parseOldDate(value)
+                except ValueError:
+                    date = None
+            cache[value] = date
+        if date is None:
+            raise ValueError
+        return date
+
+    @staticmethod
+    def _parseOldDate(value):
+        """
+        Parse a HTTP date in any of the allowed formats, including the
+        obsolete ones. Raises ValueError if it's bad.
+        """
+        if not DATE_RE.match(value):
             raise ValueError
         date_tuple = lib_parsedate(value)
         if date_tuple is None:
@@ -238,7 +454,7 @@ class ResponseHeaderParser(object):
             return instr
         if instr[0] == instr[-1] == '"':
             instr = instr[1:-1]
-            instr = re.sub(r'\\(.)', r'\1', instr)
+            instr = QUOTED_PAIR_RE.sub(r'\1', instr)
         return instr
 
     @staticmethod
@@ -253,7 +469,8 @@ class ResponseHeaderParser(object):
         """
         if not instr:
             return []
-        return [h.strip() for h in re.findall(r'%s(?=%s|\s*$)' % (item, split), instr)]
+        split_re = compile_re(r'%s(?=%s|\s*$)' % (item, split))
+        return [h.strip() for h in split_re.findall(instr)]
 
     @GenericHeaderSyntax
     def accept_ranges(self, name, values):
@@ -316,9 +533,9 @@ class ResponseHeaderParser(object):
     def content_encoding(self, name, values):
         values = [v.lower() for v in values]
         for value in values:
-            # check to see if there are any non-gzip encodings, because
-            # that's the only one we ask for.
-            if value != 'gzip':
+            # check to see if there are any encodings other than the ones
+            # we ask for.
+            if value not in ['gzip', 'deflate']:
                 self.setMessage(name, rs.ENCODING_UNWANTED, encoding=e(value))
                 break
         return values
@@ -427,7 +644,7 @@ class ResponseHeaderParser(object):
     def location(self, name, values):
         if self.red.res_status not in ["201", "300", "301", "302", "303", "305", "307"]:
             self.setMessage(name, rs.LOCATION_UNDEFINED)
-        if not re.match(r"^\s*%s\s*$" % URI, values[-1], re.VERBOSE):
+        if not ABSOLUTE_URI_RE.match(values[-1]):
             self.setMessage(name, rs.LOCATION_NOT_ABSOLUTE,
                             full_uri=e(urljoin(self.red.uri, values[-1])))
         return values[-1]
@@ -588,6 +805,7 @@ class ResponseStatusChecker:
     Given a RED, check out the status
     code and perform appropriate tests on it.
     """
+    @instrument.timed("ResponseStatusChecker")
     def __init__(self, red):
         self.red = red
         try:
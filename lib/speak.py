@@ -3,14 +3,22 @@ A collection of messages that the RED can emit.
 
 Each should be in the form:
 
-MESSAGE_ID = (classification, level,
-    {'lang': u'message'}
-    {'lang': u'long message'}
-)
+class MESSAGE_ID(Message):
+    category = classification
+    level = level
+    summary = {
+     'lang': u'message'
+    }
+
+where 'lang' is a language tag, and 'message' is a string (NO HTML) that
+contains the message in that language. Each message also has a longer
+explanation that may contain HTML, kept in the speak_<lang> module (e.g.,
+speak_en) as a string named after the message:
 
-where 'lang' is a language tag, 'message' is a string (NO HTML) that
-contains the message in that language, and 'long message' is a longer
-explanation that may contain HTML.
+MESSAGE_ID = u'long message'
+
+so that it's only loaded when it's shown. A Message subclass may also have
+its own text dictionary, in the same form as summary.
 
 Both message forms may contain %(var)s style variable interpolation.
 
@@ -61,27 +69,111 @@ class _Levels:
     INFO = u'info'
 l = _Levels()
 
-class Message:
+# message class name: Message subclass
+message_classes = {}
+
+# language tag: module with the text of messages in that language
+_text_modules = {}
+
+def message_text(cls, lang):
+    """
+    Return the text of the Message class cls in lang; unless the class has
+    its own, it's loaded from the speak_<lang> module.
+    """
+    if cls.text.has_key(lang):
+        return cls.text[lang]
+    try:
+        module = _text_modules[lang]
+    except KeyError:
+        module = __import__("redbot.speak_%s" % lang, {}, {}, ['__name__'])
+        _text_modules[lang] = module
+    return getattr(module, cls.__name__)
+
+class MessageType(type):
+    """
+    Type for Messages that keeps instances compact (by giving each class
+    empty __slots__, unless it has its own), and populates message_classes.
+    """
+    def __new__(mcs, name, bases, attrs):
+        attrs.setdefault('__slots__', ())
+        cls = super(MessageType, mcs).__new__(mcs, name, bases, attrs)
+        message_classes[name] = cls
+        return cls
+
+class Message(object):
     """
     A message about an HTTP resource, representation, or other component
     related to the URI under test.
+
+    Instances only hold the subject, the subrequest (if any), the variables
+    and the type of response it's about; the summary and text are rendered
+    (once per language) by show_summary() and show_text(). See
+    message_text() for where the text comes from.
     """
+    __metaclass__ = MessageType
+    __slots__ = ('subject', 'subrequest', 'vars', 'response_type',
+                 '_rendered')
     category = None
     level = None
     summary = {}
     text = {}
-    def __init__(self, subject, subrequest=None, vrs=None):
+    def __init__(self, subject, subrequest=None, vrs=None,
+                 response_type='this'):
         self.subject = subject
         self.subrequest = subrequest
         self.vars = vrs or {}
+        self.response_type = response_type
+        self._rendered = None
+
+    def _key(self):
+        "A canonical key for comparing and hashing messages."
+        return (self.__class__, self.subject, tuple(sorted(self.vars.items())))
 
     def __eq__(self, other):
-        if self.__class__ == other.__class__ and \
-            self.vars == other.vars and\
-            self.subject == other.subject:
-                return True
-        else:
-            return False
+        if isinstance(other, Message):
+            return self._key() == other._key()
+        return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        try:
+            return hash(self._key())
+        except TypeError: # a variable that can't be hashed
+            return hash((self.__class__, self.subject))
+
+    def __getstate__(self):
+        return (self.subject, self.subrequest, self.vars, self.response_type)
+
+    def __setstate__(self, state):
+        self.subject, self.subrequest, self.vars, self.response_type = state
+        self._rendered = None
+
+    def show_summary(self, lang):
+        "Return the summary in lang, with variables interpolated."
+        return self._render('summary', lang)
+
+    def show_text(self, lang):
+        "Return the text (which may contain HTML) in lang, interpolated."
+        return self._render('text', lang)
+
+    def _render(self, part, lang):
+        if self._rendered is None:
+            self._rendered = {}
+        try:
+            return self._rendered[(part, lang)]
+        except KeyError:
+            vrs = dict(self.vars)
+            vrs['response'] = response.get(
+                self.response_type, response['this'])[lang]
+            if part == 'text':
+                template = message_text(self.__class__, lang)
+            else:
+                template = self.summary[lang]
+            out = template % vrs
+            self._rendered[(part, lang)] = out
+            return out
 
 
 response = {
@@ -98,10 +190,6 @@ class URI_TOO_LONG(Message):
     summary = {
     'en': u"The URI is very long (%(uri_len)s characters)."
     }
-    text = {
-    'en': u"Long URIs aren't supported by some implementations, including proxies. \
-    A reasonable upper size limit is 8192 characters."
-    }
 
 class URI_BAD_SYNTAX(Message):
     category = c.GENERAL
@@ -109,11 +197,6 @@ class URI_BAD_SYNTAX(Message):
     summary = {
     'en': u"The URI's syntax isn't valid."
     }
-    text = {
-    'en': u"""This isn't a valid URI. Look for illegal characters \
-    and other problems; see <a href='http://www.ietf.org/rfc/rfc3986.txt'>RFC3986</a>
-    for more information."""
-    }
 
 class FIELD_NAME_BAD_SYNTAX(Message):
     category = c.GENERAL
@@ -121,13 +204,6 @@ class FIELD_NAME_BAD_SYNTAX(Message):
     summary = {
      'en': u'"%(field_name)s" is not a valid header field-name.'
     }
-    text = {
-    'en': u"Header names are limited to the TOKEN production in HTTP; i.e., \
-    they can't contain parenthesis, angle brackes (&lt;&gt;), ampersands (@), \
-    commas, semicolons, colons, backslashes (\\), forward slashes (/), quotes, \
-    square brackets ([]), question marks, equals signs (=), curly brackets ({}) \
-    spaces or tabs."
-    }
 
 class HEADER_BLOCK_TOO_LARGE(Message):
     category = c.GENERAL
@@ -135,11 +211,6 @@ class HEADER_BLOCK_TOO_LARGE(Message):
     summary = {
     'en': u"%(response)s's headers are very large (%(header_block_size)s)."
     }
-    text = {
-    'en': u"""Some implementations have limits on the total size of headers
-    that they'll accept. For example, Squid's default configuration limits
-    header blocks to 20k."""
-    }
 
 class HEADER_TOO_LARGE(Message):
     category = c.GENERAL
@@ -147,9 +218,6 @@ class HEADER_TOO_LARGE(Message):
     summary = {
     'en': u"The %(header_name)s header is very large (%(header_size)s)."
     }
-    text = {
-    'en': u"""Some implementations limit the size of any single header line."""
-    }
 
 class HEADER_NAME_ENCODING(Message):
     category = c.GENERAL
@@ -157,11 +225,6 @@ class HEADER_NAME_ENCODING(Message):
     summary = {
      'en': u"The %(header_name)s header's name contains non-ASCII characters."
     }
-    text = {
-     'en': u"""HTTP header field-names can only contain ASCII characters. RED
-     has detected (and possibly removed) non-ASCII characters in this header
-     name."""
-    }
 
 class HEADER_VALUE_ENCODING(Message):
     category = c.GENERAL
@@ -169,13 +232,6 @@ class HEADER_VALUE_ENCODING(Message):
     summary = {
      'en': u"The %(header_name)s header's value contains non-ASCII characters."
     }
-    text = {
-     'en': u"""HTTP headers use the ISO-8859-1 character set, but in most
-     cases are pure ASCII (a subset of this encoding).<p>
-     This header has non-ASCII characters, which RED has interpreted as
-     being encoded in ISO-8859-1. If another encoding is used (e.g., UTF-8),
-     the results may be unpredictable."""
-    }
 
 class HEADER_DEPRECATED(Message):
     category = c.GENERAL
@@ -183,11 +239,6 @@ class HEADER_DEPRECATED(Message):
     summary = {
     'en': u"The %(header_name)s header is deprecated."
     }
-    text = {
-    'en': u"""This header field is no longer recommended for use, because of
-    interoperability problems and/or lack of use. See
-    <a href="%(ref)s">its documentation</a> for more information."""
-    }
 
 class SINGLE_HEADER_REPEAT(Message):
     category = c.GENERAL
@@ -195,14 +246,6 @@ class SINGLE_HEADER_REPEAT(Message):
     summary = {
     'en': u"Only one %(field_name)s header is allowed in a response."
     }
-    text = {
-    'en': u"""This header is designed to only occur once in a message. When it
-    occurs more than once, a receiver needs to choose the one to use, which
-    can lead to interoperability problems, since different implementations may
-    make different choices.<p>
-    For the purposes of its tests, RED uses the last instance of the header that
-    is present; other implementations may behave differently."""
-    }
 
 class BODY_NOT_ALLOWED(Message):
     category = c.CONNECTION
@@ -210,14 +253,6 @@ class BODY_NOT_ALLOWED(Message):
     summary = {
      'en': u"%(response)s is not allowed to have a body."
     }
-    text = {
-     'en': u"""HTTP defines a few special situations where a response does not
-     allow a body. This includes 101, 204 and 304 responses, as well as responses
-     to the <code>HEAD</code> method.<p>
-     %(response)s had a body, despite it being disallowed. Clients receiving
-     it may treat the body as the next response in the connection, leading to
-     interoperability and security issues."""
-    }
 
 class BAD_SYNTAX(Message):
     category = c.GENERAL
@@ -225,11 +260,6 @@ class BAD_SYNTAX(Message):
     summary = {
     'en': u"The %(field_name)s header's syntax isn't valid."
     }
-    text = {
-    'en': u"""The value for this header doesn't conform to its specified syntax; see
-    <a href="%(ref_uri)s">its definition</a> for more information.
-    """
-    }
 
 # Specific headers
 
@@ -239,9 +269,6 @@ class BAD_CC_SYNTAX(Message):
     summary = {
      'en': u"The %(bad_cc_attr)s Cache-Control directive's syntax is incorrect."
     }
-    text = {
-     'en': u"This value must be an integer."
-    }
 
 class AGE_NOT_INT(Message):
     category = c.CACHING
@@ -249,11 +276,6 @@ class AGE_NOT_INT(Message):
     summary = {
     'en': u"The Age header's value should be an integer."
     }
-    text = {
-    'en': u"""The <code>Age</code> header indicates the age of the response; i.e.,
-    how long it has been cached since it was generated. The value given was not
-    an integer, so it is not a valid age."""
-    }
 
 class AGE_NEGATIVE(Message):
     category = c.CACHING
@@ -261,11 +283,6 @@ class AGE_NEGATIVE(Message):
     summary = {
     'en': u"The Age headers' value must be a positive integer."
     }
-    text = {
-    'en': u"""The <code>Age</code> header indicates the age of the response; i.e.,
-    how long it has been cached since it was generated. The value given was
-    negative, so it is not a valid age."""
-    }
 
 class BAD_CHUNK(Message):
     category = c.CONNECTION
@@ -273,20 +290,6 @@ class BAD_CHUNK(Message):
     summary = {
      'en': u"%(response)s had chunked encoding errors."
     }
-    text = {
-     'en': u"""The response indicates it uses HTTP chunked encoding, but there
-     was a problem decoding the chunking.<p>
-     A valid chunk looks something like this:<p>
-     <code>[chunk-size in hex]\\r\\n[chunk-data]\\r\\n</code><p>
-     However, the chunk sent started like this:<p>
-     <code>%(chunk_sample)s</code><p>
-     This is a serious problem, because HTTP uses chunking to delimit one
-     response from the next one; incorrect chunking can lead to interoperability
-     and security problems.<p>
-     This issue is often caused by sending an integer chunk size instead of one
-     in hex, or by sending <code>Transfer-Encoding: chunked</code> without
-     actually chunking the response body."""
-    }
 
 class BAD_GZIP(Message):
     category = c.CONNEG
@@ -294,24 +297,12 @@ class BAD_GZIP(Message):
     summary = {
     'en': u"%(response)s was compressed using GZip, but the header wasn't valid."
     }
-    text = {
-    'en': u"""GZip-compressed responses have a header that contains metadata.
-    %(response)s's header wasn't valid; the error encountered was
-    "<code>%(gzip_error)s</code>"."""
-    }
 
 class BAD_ZLIB(Message):
     category = c.CONNEG
     level = l.BAD
     summary = {
-    'en': u"%(response)s was compressed using GZip, but the data was corrupt."
-    }
-    text = {
-    'en': u"""GZip-compressed responses use zlib compression to reduce the number
-    of bytes transferred on the wire. However, this response could not be decompressed;
-    the error encountered was "<code>%(zlib_error)s</code>".<p>
-    %(ok_zlib_len)s bytes were decompressed successfully before this; the erroneous
-    chunk starts with "<code>%(chunk_sample)s</code>"."""
+    'en': u"%(response)s was compressed using %(coding)s, but the data was corrupt."
     }
 
 class ENCODING_UNWANTED(Message):
@@ -320,14 +311,6 @@ class ENCODING_UNWANTED(Message):
     summary = {
      'en': u"The %(encoding)s content-coding wasn't asked for."
     }
-    text = {
-     'en': u"""%(response)s's <code>Content-Encoding</code> header indicates it
-     has the %(encoding)s content-coding applied, but RED didn't ask for it
-     to be.<p>
-     Normally, clients ask for the encodings they want in the
-     <code>Accept-Encoding</code> request header. Using encodings that the
-     client doesn't explicitly request can lead to interoperability problems."""
-    }
 
 class TRANSFER_CODING_IDENTITY(Message):
     category = c.CONNECTION
@@ -335,12 +318,6 @@ class TRANSFER_CODING_IDENTITY(Message):
     summary = {
     'en': u"The identity transfer-coding isn't necessary."
     }
-    text = {
-    'en': u"""HTTP defines <em>transfer-codings</em> as a hop-by-hop encoding
-    of the message body. The <code>identity</code> tranfer-coding was defined
-    as the absence of encoding; it doesn't do anything, so it's necessary.<p>
-    You can remove this token to save a few bytes."""
-    }
 
 class TRANSFER_CODING_UNWANTED(Message):
     category = c.CONNECTION
@@ -348,13 +325,12 @@ class TRANSFER_CODING_UNWANTED(Message):
     summary = {
      'en': u"The %(encoding)s transfer-coding wasn't asked for."
     }
-    text = {
-     'en': u"""%(response)s's <code>Transfer-Encoding</code> header indicates it
-     has the %(encoding)s transfer-coding applied, but RED didn't ask for it
-     to be.<p>
-     Normally, clients ask for the encodings they want in the
-     <code>TE</code> request header. Using codings that the
-     client doesn't explicitly request can lead to interoperability problems."""
+
+class CONN_REUSED(Message):
+    category = c.CONNECTION
+    level = l.GOOD
+    summary = {
+     'en': u"%(response)s's connection was reused."
     }
 
 class BAD_DATE_SYNTAX(Message):
@@ -363,14 +339,6 @@ class BAD_DATE_SYNTAX(Message):
     summary = {
     'en': u"The %(field_name)s header's value isn't a valid date."
     }
-    text = {
-    'en': u"""HTTP dates have very specific syntax, and sending an invalid date can
-    cause a number of problems, especially around caching. Common problems include
-    sending "1 May" instead of "01 May" (the month is a fixed-width field), and
-    sending a date in a timezone other than GMT. See
-    <a href="http://www.w3.org/Protocols/rfc2616/rfc2616-sec3.html#sec3.3">the
-    HTTP specification</a> for more information."""
-    }
 
 class LM_FUTURE(Message):
     category = c.CACHING
@@ -378,12 +346,6 @@ class LM_FUTURE(Message):
     summary = {
     'en': u"The Last-Modified time is in the future."
     }
-    text = {
-    'en': u"""The <code>Last-Modified</code> header indicates the last point in
-    time that the resource has changed. %(response)s's
-    <code>Last-Modified</code> time is in the future, which doesn't have any
-    defined meaning in HTTP."""
-    }
 
 class LM_PRESENT(Message):
     category = c.CACHING
@@ -391,12 +353,6 @@ class LM_PRESENT(Message):
     summary = {
     'en': u"The resource last changed %(last_modified_string)s."
     }
-    text = {
-    'en': u"""The <code>Last-Modified</code> header indicates the last point in
-    time that the resource has changed. It is used in HTTP for validating cached
-    responses, and for calculating heuristic freshness in caches.<p>
-    This resource last changed %(last_modified_string)s."""
-    }
 
 class MIME_VERSION(Message):
     category = c.GENERAL
@@ -404,11 +360,6 @@ class MIME_VERSION(Message):
     summary = {
     'en': u"The MIME-Version header generally isn't necessary in HTTP."
     }
-    text = {
-    'en': u"""<code>MIME_Version</code> is a MIME header, not a HTTP header; it's
-    only used when HTTP messages are moved over MIME-based protocols
-    (e.g., SMTP), which is uncommon."""
-    }
 
 class PRAGMA_NO_CACHE(Message):
     category = c.CACHING
@@ -416,11 +367,6 @@ class PRAGMA_NO_CACHE(Message):
     summary = {
     'en': u"Pragma: no-cache is a request directive, not a response directive."
     }
-    text = {
-    'en': u"""<code>Pragma</code> is a very old request header that is sometimes
-    used as a response header, even though this is not specified behaviour.
-    <code>Cache-Control: no-cache</code> is more appropriate."""
-    }
 
 class PRAGMA_OTHER(Message):
     category = c.GENERAL
@@ -428,10 +374,6 @@ class PRAGMA_OTHER(Message):
     summary = {
     'en': u"""The Pragma header is being used in an undefined way."""
     }
-    text = {
-    'en': u"""HTTP only defines <code>Pragma: no-cache</code>; other uses of
-    this header are deprecated."""
-    }
 
 class VIA_PRESENT(Message):
     category = c.GENERAL
@@ -439,20 +381,6 @@ class VIA_PRESENT(Message):
     summary = {
     'en': u"One or more intermediaries are present."
     }
-    text = {
-    'en': u"""The <code>Via</code> header indicates that one or more
-    intermediaries are present between RED and the origin server for the
-    resource.<p>
-    This may indicate that a proxy is in between RED and the server, or that
-    the server uses a "reverse proxy" or CDN in front of it.<p>
-    %(via_list)s
-    <p>
-    There field has three space-separated components; first, the HTTP version
-    of the message that the intermediary received, then the identity of the
-    intermediary (usually but not always its hostname), and then optionally a
-    product identifier or comment (usually used to identify the software being
-    used)."""
-    }
 
 class LOCATION_UNDEFINED(Message):
     category = c.GENERAL
@@ -460,15 +388,6 @@ class LOCATION_UNDEFINED(Message):
     summary = {
      'en': u"%(response)s doesn't define any meaning for the Location header."
     }
-    text = {
-     'en': u"""The <code>Location</code> header is used for specific purposes
-     in HTTP; mostly to indicate the URI of another resource (e.g., in
-     redirection, or when a new resource is created).<p>
-     In other status codes (such as this one) it doesn't have a defined meaning,
-     so any use of it won't be interoperable.<p>
-     Sometimes <code>Location</code> is confused with <code>Content-Location</code>,
-     which indicates a URI for the payload of the message that it appears in."""
-    }
 
 class LOCATION_NOT_ABSOLUTE(Message):
     category = c.GENERAL
@@ -476,15 +395,6 @@ class LOCATION_NOT_ABSOLUTE(Message):
     summary = {
      'en': u"The Location header contains a relative URI."
     }
-    text = {
-     'en': u"""<code>Location</code> is specified to contain an absolute,
-     not relative, URI.<p>
-     Most (but not all) clients will work around this, but since this field isn't
-     defined to take a relative URI, they may behave differently (for example,
-     if the body contains a base URI).</p>
-     The correct value for this field is (probably):<br>
-     <code>%(full_uri)s</code>"""
-    }
 
 class CONTENT_TYPE_OPTIONS(Message):
     category = c.GENERAL
@@ -492,16 +402,6 @@ class CONTENT_TYPE_OPTIONS(Message):
     summary = {
      'en': u"%(response)s instructs Internet Explorer not to 'sniff' its media type."
     }
-    text = {
-     'en': u"""Many Web browers "sniff" the media type of responses to figure out
-     whether they're HTML, RSS or another format, no matter what the
-     <code>Content-Type</code> header says.<p>
-     This header instructs Microsoft's Internet Explorer not to do this, but to
-     always respect the Content-Type header. It probably won't have any effect in
-     other clients.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2008/09/02/ie8-security-part-vi-beta-2-update.aspx">this blog entry</a>
-     for more information about this header."""
-    }
 
 class CONTENT_TYPE_OPTIONS_UNKNOWN(Message):
     category = c.GENERAL
@@ -509,12 +409,6 @@ class CONTENT_TYPE_OPTIONS_UNKNOWN(Message):
     summary = {
      'en': u"%(response)s contains an X-Content-Type-Options header with an unknown value."
     }
-    text = {
-     'en': u"""Only one value is currently defined for this header, <code>nosniff</code>.
-     Using other values here won't necessarily cause problems, but they probably
-     won't have any effect either.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2008/09/02/ie8-security-part-vi-beta-2-update.aspx">this blog entry</a> for more information about this header."""
-    }
 
 class DOWNLOAD_OPTIONS(Message):
     category = c.GENERAL
@@ -522,16 +416,6 @@ class DOWNLOAD_OPTIONS(Message):
     summary = {
      'en': u"%(response)s can't be directly opened directly by Internet Explorer when downloaded."
     }
-    text = {
-     'en': u"""When the <code>X-Download-Options</code> header is present
-     with the value <code>noopen</code>, Internet Explorer users are prevented
-     from directly opening a file download; instead, they must first save the
-     file locally. When the locally saved file is later opened, it no longer
-     executes in the security context of your site, helping to prevent script
-     injection.<p>
-     This header probably won't have any effect in other clients.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-v-comprehensive-protection.aspx">this blog article</a> for more details."""
-    }
 
 class DOWNLOAD_OPTIONS_UNKNOWN(Message):
     category = c.GENERAL
@@ -539,12 +423,6 @@ class DOWNLOAD_OPTIONS_UNKNOWN(Message):
     summary = {
      'en': u"%(response)s contains an X-Download-Options header with an unknown value."
     }
-    text = {
-     'en': u"""Only one value is currently defined for this header, <code>noopen</code>.
-     Using other values here won't necessarily cause problems, but they probably
-     won't have any effect either.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-v-comprehensive-protection.aspx">this blog article</a> for more details."""
-    }
 
 class FRAME_OPTIONS_DENY(Message):
     category = c.GENERAL
@@ -552,15 +430,6 @@ class FRAME_OPTIONS_DENY(Message):
     summary = {
      'en': u"%(response)s prevents some browsers from rendering it if it will be contained within a frame."
     }
-    text = {
-     'en': u"""The <code>X-Frame-Options</code> response header controls how
-     IE8 handles HTML frames; the <code>DENY</code> value prevents this content
-     from being rendered within a frame, which defends against certain types of
-     attacks.<p>
-     Currently this is supported by IE8 and Safari 4.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class FRAME_OPTIONS_SAMEORIGIN(Message):
     category = c.GENERAL
@@ -568,15 +437,6 @@ class FRAME_OPTIONS_SAMEORIGIN(Message):
     summary = {
      'en': u"%(response)s prevents some browsers from rendering it if it will be contained within a frame on another site."
     }
-    text = {
-     'en': u"""The <code>X-Frame-Options</code> response header controls how
-     IE8 handles HTML frames; the <code>DENY</code> value prevents this content
-     from being rendered within a frame on another site, which defends against certain types of
-     attacks.<p>
-     Currently this is supported by IE8 and Safari 4.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class FRAME_OPTIONS_UNKNOWN(Message):
     category = c.GENERAL
@@ -584,14 +444,6 @@ class FRAME_OPTIONS_UNKNOWN(Message):
     summary = {
      'en': u"%(response)s contains an X-Frame-Options header with an unknown value."
     }
-    text = {
-     'en': u"""Only two values are currently defined for this header, <code>DENY</code>
-     and <code>SAMEORIGIN</code>.
-     Using other values here won't necessarily cause problems, but they probably
-     won't have any effect either.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class SMART_TAG_NO_WORK(Message):
     category = c.GENERAL
@@ -599,11 +451,6 @@ class SMART_TAG_NO_WORK(Message):
     summary = {
      'en': u"The %(field_name)s header doesn't have any effect on smart tags."
     }
-    text = {
-     'en': u"""This header doesn't have any effect on Microsoft Smart Tags,
-     except in certain beta versions of IE6. To turn them off, you'll need
-     to make changes in the HTML content it"""
-    }
 
 class UA_COMPATIBLE(Message):
     category = c.GENERAL
@@ -611,11 +458,6 @@ class UA_COMPATIBLE(Message):
     summary = {
      'en': u"%(response)s explicitly sets a rendering mode for Internet Explorer 8."
     }
-    text = {
-     'en': u"""Internet Explorer 8 allows responses to explicitly set the rendering
-     mode used for a given page (known a the "compatibility mode").<p>
-     See <a href="http://msdn.microsoft.com/en-us/library/cc288325(VS.85).aspx">Microsoft's documentation</a> for more information."""
-    }
 
 class UA_COMPATIBLE_REPEAT(Message):
     category = c.GENERAL
@@ -623,13 +465,6 @@ class UA_COMPATIBLE_REPEAT(Message):
     summary = {
      'en': u"%(response)s has multiple X-UA-Compatible directives targetted at the same UA."
     }
-    text = {
-     'en': u"""Internet Explorer 8 allows responses to explicitly set the rendering mode
-     used for a page.<p>
-     This response has more than one such directive targetted at one browser;
-     this may cause unpredictable results.<p>
-     See <a href="http://msdn.microsoft.com/en-us/library/cc288325(VS.85).aspx">this blog entry</a> for more information."""
-    }
 
 class XSS_PROTECTION(Message):
     category = c.GENERAL
@@ -637,16 +472,6 @@ class XSS_PROTECTION(Message):
     summary = {
      'en': u"%(response)s disables XSS filtering in IE8."
     }
-    text = {
-     'en': u"""Internet Explorer 8 has built-in Cross-Site Scripting (XSS)
-     attack protection; it tries to automatically filter requests that
-     fit a particular profile.<p>
-     %(response)s has explicitly disabled this protection. In some scenarios,
-     this is useful to do, if the protection interferes with the application.<p>
-     This header probably won't have any effect in other clients.<p>
-     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-iv-the-xss-filter.aspx">this blog entry</a> for more information.
-     """
-    }
 
 ### Ranges
 
@@ -656,14 +481,6 @@ class UNKNOWN_RANGE(Message):
     summary = {
      'en': u"%(response)s advertises support for non-standard range-units."
     }
-    text = {
-     'en': u"""The <code>Accept-Ranges</code> response header tells clients
-     what <code>range-unit</code>s a resource is willing to process in future
-     requests. HTTP only defines two: <code>bytes</code> and <code>none</code>.
-     <p>
-     Clients who don't know about the non-standard range-unit will not be
-     able to use it."""
-    }
 
 class RANGE_CORRECT(Message):
     category = c.RANGE
@@ -671,12 +488,6 @@ class RANGE_CORRECT(Message):
     summary = {
     'en': u"A ranged request returned the correct partial content."
     }
-    text = {
-    'en': u"""This resource advertises support for ranged requests with
-    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
-    part of it should be sent. RED has tested this by requesting part
-    of this response, which was returned correctly."""
-    }
 
 class RANGE_INCORRECT(Message):
     category = c.RANGE
@@ -684,20 +495,6 @@ class RANGE_INCORRECT(Message):
     summary = {
     'en': u'A ranged request returned partial content, but it was incorrect.'
     }
-    text = {
-    'en': u"""This resource advertises support for ranged requests with
-    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
-    part of the response should be sent. RED has tested this by requesting part
-    of this response, but the partial response doesn't correspond with the full
-    response retrieved at the same time. This could indicate that the range
-    implementation isn't working properly.
-    <p>RED sent<br/>
-    <code>Range: %(range)s</code>
-    <p>RED expected %(range_expected_bytes)s bytes:<br/>
-    <code>%(range_expected)s</code>
-    <p>RED received %(range_received_bytes)s bytes:<br/>
-    <code>%(range_received)s</code>"""
-    }
 
 class RANGE_FULL(Message):
     category = c.RANGE
@@ -705,14 +502,6 @@ class RANGE_FULL(Message):
     summary = {
     'en': u"A ranged request returned the full rather than partial content."
     }
-    text = {
-    'en': u"""This resource advertises support for ranged requests with
-    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
-    part of the response should be sent. RED has tested this by requesting part
-    of this response, but the entire response was returned. In other words,
-    although the resource advertises support for partial content, it
-    doesn't appear to actually do so."""
-    }
 
 class RANGE_STATUS(Message):
     category = c.RANGE
@@ -720,12 +509,6 @@ class RANGE_STATUS(Message):
     summary = {
     'en': u"A ranged request returned a %(range_status)s status."
     }
-    text = {
-    'en': u"""This resource advertises support for ranged requests; that is, it allows
-    clients to specify that only part of the response should be sent. RED has tested
-    this by requesting part of this response, but a %(enc_range_status)s
-    response code was returned, which RED was not expecting."""
-    }
 
 class RANGE_NEG_MISMATCH(Message):
     category = c.RANGE
@@ -733,13 +516,6 @@ class RANGE_NEG_MISMATCH(Message):
     summary = {
      'en': u"Partial responses don't have the same support for compression that full ones do."
     }
-    text = {
-     'en': u"""This resource supports ranged requests and also supports negotiation for
-     gzip compression, but doesn't support compression for both full and partial responses.<p>
-     This can cause problems for clients when they compare the partial and full responses,
-     since the partial response is expressed as a byte range, and compression changes the
-     bytes."""
-    }
 
 ### Body
 
@@ -749,12 +525,6 @@ class CL_CORRECT(Message):
     summary = {
     'en': u'The Content-Length header is correct.'
     }
-    text = {
-    'en': u"""<code>Content-Length</code> is used by HTTP to delimit messages;
-    that is, to mark the end of one message and the beginning of the next. RED
-    has checked the length of the body and found the <code>Content-Length</code>
-    to be correct."""
-    }
 
 class CL_INCORRECT(Message):
     category = c.GENERAL
@@ -762,14 +532,6 @@ class CL_INCORRECT(Message):
     summary = {
     'en': u"%(response)s's Content-Length header is incorrect."
     }
-    text = {
-    'en': u"""<code>Content-Length</code> is used by HTTP to delimit messages;
-    that is, to mark the end of one message and the beginning of the next. RED
-    has checked the length of the body and found the <code>Content-Length</code>
-    is not correct. This can cause problems not only with connection handling,
-    but also caching, since an incomplete response is considered uncacheable.<p>
-    The actual body size sent was %(body_length)s bytes."""
-    }
 
 class CMD5_CORRECT(Message):
     category = c.GENERAL
@@ -777,11 +539,6 @@ class CMD5_CORRECT(Message):
     summary = {
     'en': u'The Content-MD5 header is correct.'
     }
-    text = {
-    'en': u"""<code>Content-MD5</code> is a hash of the body, and can be used to
-    ensure integrity of the response. RED has checked its value and found it to
-    be correct."""
-    }
 
 class CMD5_INCORRECT(Message):
     category = c.GENERAL
@@ -789,12 +546,6 @@ class CMD5_INCORRECT(Message):
     summary = {
     'en': u'The Content-MD5 header is incorrect.'
     }
-    text = {
-    'en': u"""<code>Content-MD5</code> is a hash of the body, and can be used to
-    ensure integrity of the response. RED has checked its value and found it to
-    be incorrect; i.e., the given <code>Content-MD5</code> does not match what
-    RED thinks it should be (%(calc_md5)s)."""
-    }
 
 ### Conneg
 
@@ -804,13 +555,6 @@ class CONNEG_GZIP_GOOD(Message):
     summary = {
     'en': u'Content negotiation for gzip compression is supported, saving %(savings)s%%.'
     }
-    text = {
-    'en': u"""HTTP supports compression of responses by negotiating for
-    <code>Content-Encoding</code>. When RED asked for a compressed response,
-    the resource provided one, saving %(savings)s%% of its original size
-    (from %(orig_size)s to %(gzip_size)s bytes).<p>
-    The compressed response's headers are displayed."""
-    }
 
 class CONNEG_GZIP_BAD(Message):
     category = c.CONNEG
@@ -818,17 +562,6 @@ class CONNEG_GZIP_BAD(Message):
     summary = {
     'en': u'Content negotiation for gzip compression makes the response %(savings)s%% larger.'
     }
-    text = {
-    'en': u"""HTTP supports compression of responses by negotiating for
-    <code>Content-Encoding</code>. When RED asked for a compressed response,
-    the resource provided one, but it was %(savings)s%% <em>larger</em> than the original
-    response; from %(orig_size)s to %(gzip_size)s bytes.<p>
-    Often, this happens when the uncompressed response is very small, or can't be compressed
-    more; since gzip compression has some overhead, it can make the response larger. Turning compression
-    <strong>off</strong> for this resource may slightly improve response times and save 
-    bandwidth.<p>
-    The compressed response's headers are displayed."""
-    }
 
 class CONNEG_NO_GZIP(Message):
     category = c.CONNEG
@@ -836,11 +569,6 @@ class CONNEG_NO_GZIP(Message):
     summary = {
     'en': u'Content negotiation for gzip compression isn\'t supported.'
     }
-    text = {
-    'en': u"""HTTP supports compression of responses by negotiating for
-    <code>Content-Encoding</code>. When RED asked for a compressed response,
-    the resource did not provide one."""
-    }
 
 class CONNEG_NO_VARY(Message):
     category = c.CONNEG
@@ -848,14 +576,6 @@ class CONNEG_NO_VARY(Message):
     summary = {
     'en': u"%(response)s is negotiated, but doesn't have an appropriate Vary header."
     }
-    text = {
-    'en': u"""All content negotiated responses need to have a
-    <code>Vary</code> header that reflects the header(s) used to select the
-    response.<p>
-    %(response)s was negotiated for <code>gzip</code> content encoding, so
-    the <code>Vary</code> header needs to contain <code>Accept-Encoding</code>,
-    the request header used."""
-    }
 
 class CONNEG_GZIP_WITHOUT_ASKING(Message):
     category = c.CONNEG
@@ -863,12 +583,6 @@ class CONNEG_GZIP_WITHOUT_ASKING(Message):
     summary = {
     'en': u"A gzip-compressed response was sent when it wasn't asked for."
     }
-    text = {
-    'en': u"""HTTP supports compression of responses by negotiating for
-    <code>Content-Encoding</code>. Even though RED didn't ask for a compressed
-    response, the resource provided one anyway. Doing so can break clients that
-    aren't expecting a compressed response."""
-    }
 
 class VARY_INCONSISTENT(Message):
     category = c.CONNEG
@@ -876,20 +590,6 @@ class VARY_INCONSISTENT(Message):
     summary = {
     'en': u"The resource doesn't send Vary consistently."
     }
-    text = {
-    'en': u"""HTTP requires that the <code>Vary</code> response header be sent
-    consistently for all responses if they change based upon different aspects
-    of the request.<p>
-    This resource has both compressed and uncompressed variants
-    available, negotiated by the <code>Accept-Encoding</code> request header,
-    but it sends different Vary headers for each;<p>
-    <ul>
-      <li>"<code>%(conneg_vary)s</code>" when the response is compressed, and</li>
-      <li>"<code>%(no_conneg_vary)s</code>" when it is not.</li>
-    </ul>
-    <p>This can cause problems for downstream caches, because they
-    cannot consistently determine what the cache key for a given URI is."""
-    }
 
 class ETAG_DOESNT_CHANGE(Message):
     category = c.CONNEG
@@ -897,15 +597,6 @@ class ETAG_DOESNT_CHANGE(Message):
     summary = {
     'en': u"The ETag doesn't change between representations."
     }
-    text = {
-    'en': u"""HTTP requires that the <code>ETag</code>s for two different
-    responses associated with the same URI be different as well, to help caches
-    and other receivers disambiguate them.<p>
-    This resource, however, sent the same
-    ETag for both its compressed and uncompressed versions (negotiated by
-    <code>Accept-Encoding</code>. This can cause interoperability problems,
-    especially with caches."""
-    }
 
 ### Clock
 
@@ -915,11 +606,6 @@ class DATE_CORRECT(Message):
     summary = {
     'en': u"The server's clock is correct."
     }
-    text = {
-    'en': u"""HTTP's caching model assumes reasonable synchronisation between
-    clocks on the server and client; using RED's local clock, the server's clock
-    appears to be well-synchronised."""
-    }
 
 class DATE_INCORRECT(Message):
     category = c.GENERAL
@@ -927,23 +613,6 @@ class DATE_INCORRECT(Message):
     summary = {
     'en': u"The server's clock is %(clock_skew_string)s."
     }
-    text = {
-    'en': u"""Using RED's local clock, the server's clock does not appear to 
-    be well-synchronised.<p>
-    HTTP's caching model assumes reasonable synchronisation between
-    clocks on the server and client; clock skew can cause responses that
-    should be cacheable to be considered uncacheable (especially if their freshness
-    lifetime is short).<p>
-    Ask your server administrator to synchronise the clock, e.g., using 
-    <a href="http://en.wikipedia.org/wiki/Network_Time_Protocol" 
-    title="Network Time Protocol">NTP</a>.</p>
-    Apparent clock skew can also be caused by caching the response without adjusting
-    the <code>Age</code> header; e.g., in a reverse proxy or 
-    <abbr title="Content Delivery Network">CDN</abbr>. See 
-    <a href="http://www2.research.att.com/~edith/Papers/HTML/usits01/index.html">
-    this paper</a> for more information.
-    """
-    }
 
 class AGE_PENALTY(Message):
     category = c.GENERAL
@@ -951,16 +620,6 @@ class AGE_PENALTY(Message):
     summary = {
      'en': u"It appears that the Date header has been changed by an intermediary."
     }
-    text = {
-     'en': u"""It appears that this response has been cached by a reverse proxy or 
-     <abbr title="Content Delivery Network">CDN</abbr>, because the <code>Age</code>
-     header is present, but the <code>Date</code> header is more recent than it indicates.<p>
-     Generally, reverse proxies should either omit the <code>Age</code> header (if they
-     have another means of determining how fresh the response is), or
-     leave the <code>Date</code> header alone (i.e., act as a normal HTTP cache).<p>
-     See <a href="http://www2.research.att.com/~edith/Papers/HTML/usits01/index.html">
-     this paper</a> for more information."""
-    }
 
 class DATE_CLOCKLESS(Message):
     category = c.GENERAL
@@ -968,11 +627,6 @@ class DATE_CLOCKLESS(Message):
     summary = {
      'en': u"%(response)s doesn't have a Date header."
     }
-    text = {
-     'en': u"""Although HTTP allowes a server not to send a <code>Date</code> header if it
-     doesn't have a local clock, this can make calculation of the response's age
-     inexact."""
-    }
 
 class DATE_CLOCKLESS_BAD_HDR(Message):
     category = c.CACHING
@@ -980,12 +634,6 @@ class DATE_CLOCKLESS_BAD_HDR(Message):
     summary = {
      'en': u"Responses without a Date aren't allowed to have Expires or Last-Modified values."
     }
-    text = {
-     'en': u"""Because both the <code>Expires</code> and <code>Last-Modified</code>
-     headers are date-based, it's necessary to know when the message was generated
-     for them to be useful; otherwise, clock drift, transit times between nodes as
-     well as caching could skew their application."""
-    }
 
 ### Caching
 
@@ -995,9 +643,6 @@ class METHOD_UNCACHEABLE(Message):
     summary = {
      'en': u"Responses to the %(method)s method can't be stored by caches."
     }
-    text = {
-    'en': u""""""
-    }
 
 class CC_MISCAP(Message):
     category = c.CACHING
@@ -1005,11 +650,6 @@ class CC_MISCAP(Message):
     summary = {
      'en': u"The %(cc)s Cache-Control directive appears to have incorrect capitalisation."
     }
-    text = {
-     'en': u"""Cache-Control directive names are case-sensitive, and will not
-     be recognised by most implementations if the capitalisation is wrong.<p>
-     Did you mean to use %(cc_lower)s instead of %(cc)s?"""
-    }
 
 class CC_DUP(Message):
     category = c.CACHING
@@ -1017,12 +657,6 @@ class CC_DUP(Message):
     summary = {
      'en': u"The %(cc)s Cache-Control directive appears more than once."
     }
-    text = {
-     'en': u"""The %(cc)s Cache-Control directive is only defined to appear
-     once; it is used more than once here, so implementations may use different
-     instances (e.g., the first, or the last), making their behaviour
-     unpredictable."""
-    }
 
 class NO_STORE(Message):
     category = c.CACHING
@@ -1030,10 +664,6 @@ class NO_STORE(Message):
     summary = {
      'en': u"%(response)s can't be stored by a cache."
     }
-    text = {
-    'en': u"""The <code>Cache-Control: no-store</code> directive indicates that
-    this response can't be stored by a cache."""
-    }
 
 class PRIVATE_CC(Message):
     category = c.CACHING
@@ -1041,12 +671,6 @@ class PRIVATE_CC(Message):
     summary = {
      'en': u"%(response)s only allows a private cache to store it."
     }
-    text = {
-    'en': u"""The <code>Cache-Control: private</code> directive indicates that the
-    response can only be stored by caches that are specific to a single user; for
-    example, a browser cache. Shared caches, such as those in proxies, cannot store
-    it."""
-    }
 
 class PRIVATE_AUTH(Message):
     category = c.CACHING
@@ -1054,13 +678,6 @@ class PRIVATE_AUTH(Message):
     summary = {
      'en': u"%(response)s only allows a private cache to store it."
     }
-    text = {
-    'en': u"""Because the request was authenticated and this response doesn't contain
-    a <code>Cache-Control: public</code> directive, this response can only be
-    stored by caches that are specific to a single user; for example, a browser
-    cache. Shared caches, such as those in proxies, cannot store
-    it."""
-    }
 
 class STOREABLE(Message):
     category = c.CACHING
@@ -1068,10 +685,6 @@ class STOREABLE(Message):
     summary = {
      'en': u"""%(response)s allows all caches to store it."""
     }
-    text = {
-     'en': u"""A cache can store this response; it may or may not be able to
-     use it to satisfy a particular request."""
-    }
 
 class NO_CACHE(Message):
     category = c.CACHING
@@ -1079,13 +692,6 @@ class NO_CACHE(Message):
     summary = {
      'en': u"%(response)s cannot be served from cache without validation."
     }
-    text = {
-     'en': u"""The <code>Cache-Control: no-cache</code> directive means that
-     while caches <strong>can</strong> store this response, they cannot use
-     it to satisfy a request unless it has been validated (either with an
-     <code>If-None-Match</code> or <code>If-Modified-Since</code> conditional)
-     for that request.<p>"""
-    }
 
 class NO_CACHE_NO_VALIDATOR(Message):
     category = c.CACHING
@@ -1093,15 +699,6 @@ class NO_CACHE_NO_VALIDATOR(Message):
     summary = {
      'en': u"%(response)s cannot be served from cache without validation."
     }
-    text = {
-     'en': u"""The <code>Cache-Control: no-cache</code> directive means that
-     while caches <strong>can</strong> store this response, they cannot use
-     it to satisfy a request unless it has been validated (either with an
-     <code>If-None-Match</code> or <code>If-Modified-Since</code> conditional)
-     for that request.<p>
-     %(response)s doesn't have a <code>Last-Modified</code> or
-     <code>ETag</code> header, so it effectively can't be used by a cache."""
-    }
 
 class VARY_ASTERISK(Message):
     category = c.CACHING
@@ -1109,11 +706,6 @@ class VARY_ASTERISK(Message):
     summary = {
     'en': u"Vary: * effectively makes this response uncacheable."
     }
-    text = {
-    'en': u"""<code>Vary *</code> indicates that responses for this resource vary
-    by some aspect that can't (or won't) be described by the server. This makes
-    this response effectively uncacheable."""
-    }
 
 class VARY_USER_AGENT(Message):
     category = c.CACHING
@@ -1121,14 +713,6 @@ class VARY_USER_AGENT(Message):
     summary = {
      'en': u"Vary: User-Agent can cause cache inefficiency."
     }
-    text = {
-    'en': u"""Sending <code>Vary: User-Agent</code> requires caches to store
-    a separate copy of the response for every <code>User-Agent</code> request
-    header they see.<p>
-    Since there are so many different <code>User-Agent</code>s, this can
-    "bloat" caches with many copies of the same thing, or cause them to give
-    up on storing these responses at all."""
-    }
 
 class VARY_HOST(Message):
     category = c.CACHING
@@ -1136,19 +720,6 @@ class VARY_HOST(Message):
     summary = {
      'en': u"Vary: Host is not necessary."
     }
-    text = {
-    'en': u"""Some servers (e.g., <a href="http://httpd.apache.org/">Apache</a>
-    with
-    <a href="http://httpd.apache.org/docs/2.0/mod/mod_rewrite.html">mod_rewrite</a>)
-    will send <code>Host</code> in the <code>Vary</code> header, in the belief
-    that since it affects how the server selects what to send back,
-    this is necessary.<p>
-    This is not the case; HTTP specifies that the URI is the basis of the cache
-    key, and the URI incorporates the <code>Host</code> header.<p>
-    The presence of <code>Vary: Host</code> may make some caches not store
-    an otherwise cacheable response (since some cache implementations will
-    not store anything that has a <code>Vary</code> header)."""
-    }
 
 class VARY_COMPLEX(Message):
     category = c.CACHING
@@ -1156,12 +727,6 @@ class VARY_COMPLEX(Message):
     summary = {
      'en': u"This resource varies in %(vary_count)s ways."
     }
-    text = {
-     'en': u"""The <code>Vary</code> mechanism allows a resource to describe the
-     dimensions that its responses vary, or change, over; each listed header
-     is another dimension.<p>Varying by too many dimensions makes using this
-     information impractical."""
-    }
 
 class PUBLIC(Message):
     category = c.CACHING
@@ -1169,20 +734,6 @@ class PUBLIC(Message):
     summary = {
      'en': u"Cache-Control: public is rarely necessary."
     }
-    text = {
-     'en': u"""The <code>Cache-Control: public</code> directive
-     makes a response cacheable even when the request had an
-     <code>Authorization</code> header (i.e., HTTP authentication was in use).<p>
-     Additionally, <a href="http://firefox.org/">Firefox</a>'s cache
-     will store SSL-protected responses on disk when <code>public</code> is
-     present; otherwise, they are only cached in memory.<p>
-     <p>Therefore, SSL-protected or HTTP-authenticated (NOT cookie-authenticated)
-     resources <em>may</em> have use for <code>public</code> to improve
-     cacheability, if used judiciously.<p>
-     However, other responses <strong>do not need to contain <code>public</code>
-     </strong>; it does not make the response "more cacheable", and only
-     makes the headers larger."""
-    }
 
 class CURRENT_AGE(Message):
     category = c.CACHING
@@ -1190,12 +741,6 @@ class CURRENT_AGE(Message):
     summary = {
      'en': u"%(response)s has been cached for %(age)s."
     }
-    text = {
-    'en': u"""The <code>Age</code> header indicates the age of the response;
-    i.e., how long it has been cached since it was generated. HTTP takes this
-    as well as any apparent clock skew into account in computing how old the
-    response already is."""
-    }
 
 class FRESHNESS_FRESH(Message):
     category = c.CACHING
@@ -1203,10 +748,6 @@ class FRESHNESS_FRESH(Message):
     summary = {
      'en': u"%(response)s is fresh until %(freshness_left)s from now."
     }
-    text = {
-    'en': u"""A response can be considered fresh when its age (here, %(current_age)s)
-    is less than its freshness lifetime (in this case, %(freshness_lifetime)s)."""
-    }
 
 class FRESHNESS_STALE_CACHE(Message):
     category = c.CACHING
@@ -1214,13 +755,6 @@ class FRESHNESS_STALE_CACHE(Message):
     summary = {
      'en': u"%(response)s has been served stale by a cache."
     }
-    text = {
-    'en': u"""An HTTP response is stale when its age (here, %(current_age)s)
-    is equal to or exceeds its freshness lifetime (in this case, %(freshness_lifetime)s).<p>
-    HTTP allows caches to use stale responses to satisfy requests only under exceptional 
-    circumstances; e.g., when they lose contact with the origin server. Either that has happened
-    here, or the cache has ignored the response's freshness directives."""
-    }
 
 class FRESHNESS_STALE_ALREADY(Message):
     category = c.CACHING
@@ -1228,12 +762,6 @@ class FRESHNESS_STALE_ALREADY(Message):
     summary = {
      'en': u"%(response)s is already stale."
     }
-    text = {
-    'en': u"""A cache considers a HTTP response stale when its age (here, %(current_age)s)
-    is equal to or exceeds its freshness lifetime (in this case, %(freshness_lifetime)s).<p>
-    HTTP allows caches to use stale responses to satisfy requests only under exceptional 
-    circumstances; e.g., when they lose contact with the origin server."""
-    }
 
 class FRESHNESS_HEURISTIC(Message):
     category = c.CACHING
@@ -1241,16 +769,6 @@ class FRESHNESS_HEURISTIC(Message):
     summary = {
      'en': u"%(response)s allows a cache to assign its own freshness lifetime."
     }
-    text = {
-     'en': u"""When responses with certain status codes don't have explicit freshness information (like a <code>
-     Cache-Control: max-age</code> directive, or <code>Expires</code> header), caches are
-     allowed to estimate how fresh it is using a heuristic.<p>
-     Usually, but not always, this is done using the <code>Last-Modified</code> header. For
-     example, if your response was last modified a week ago, a cache might decide to consider
-     the response fresh for a day.<p>
-     Consider adding a <code>Cache-Control</code> header; otherwise, it may be cached for longer
-     or shorter than you'd like."""
-    }
 
 class FRESHNESS_NONE(Message):
     category = c.CACHING
@@ -1258,17 +776,6 @@ class FRESHNESS_NONE(Message):
     summary = {
      'en': u"%(response)s can only be served by a cache under exceptional circumstances."
     }
-    text = {
-     'en': u"""%(response)s doesn't have explicit freshness information (like a <code>
-     Cache-Control: max-age</code> directive, or <code>Expires</code> header), and this
-     status code doesn't allow caches to calculate their own.<p>
-     Therefore, while caches may be allowed to store it, they can't use it, except in unusual 
-     cirucumstances, such a when the origin server can't be contacted.<p>
-     This behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
-     response directive.<p>
-     Note that many caches will not store the response at all, because it is not generally useful to do so.
-     """
-    }
 
 class FRESH_SERVABLE(Message):
     category = c.CACHING
@@ -1276,13 +783,6 @@ class FRESH_SERVABLE(Message):
     summary = {
      'en': u"%(response)s may still be served by a cache once it becomes stale."
     }
-    text = {
-    'en': u"""HTTP allows stale responses to be served under some circumstances;
-    for example, if the origin server can't be contacted, a stale response can
-    be used (even if it doesn't have explicit freshness information).<p>
-    This behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
-    response directive."""
-    }
 
 class STALE_SERVABLE(Message):
     category = c.CACHING
@@ -1290,13 +790,6 @@ class STALE_SERVABLE(Message):
     summary = {
      'en': u"%(response)s might be served by a cache, even though it is stale."
     }
-    text = {
-    'en': u"""HTTP allows stale responses to be served under some circumstances;
-    for example, if the origin server can't be contacted, a stale response can
-    be used (even if it doesn't have explicit freshness information).<p>This
-    behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
-    response directive."""
-    }
 
 class FRESH_MUST_REVALIDATE(Message):
     category = c.CACHING
@@ -1304,13 +797,6 @@ class FRESH_MUST_REVALIDATE(Message):
     summary = {
      'en': u"%(response)s cannot be served by a cache once it becomes stale."
     }
-    text = {
-    'en': u"""The <code>Cache-Control: must-revalidate</code> directive forbids
-    caches from using stale responses to satisfy requests.<p>For example,
-    caches often use stale responses when they cannot connect to the origin
-    server; when this directive is present, they will return an error rather
-    than a stale response."""
-    }
 
 class STALE_MUST_REVALIDATE(Message):
     category = c.CACHING
@@ -1318,13 +804,6 @@ class STALE_MUST_REVALIDATE(Message):
     summary = {
      'en': u"%(response)s cannot be served by a cache, because it is stale."
     }
-    text = {
-    'en': u"""The <code>Cache-Control: must-revalidate</code> directive forbids
-    caches from using stale responses to satisfy requests.<p>For example,
-    caches often use stale responses when they cannot connect to the origin
-    server; when this directive is present, they will return an error rather
-    than a stale response."""
-    }
 
 class FRESH_PROXY_REVALIDATE(Message):
     category = c.CACHING
@@ -1332,15 +811,6 @@ class FRESH_PROXY_REVALIDATE(Message):
     summary = {
      'en': u"%(response)s cannot be served by a shared cache once it becomes stale."
     }
-    text = {
-    'en': u"""The presence of the <code>Cache-Control: proxy-revalidate</code>
-    and/or <code>s-maxage</code> directives forbids shared caches (e.g., proxy
-    caches) from using stale responses to satisfy requests.<p>For example,
-    caches often use stale responses when they cannot connect to the origin
-    server; when this directive is present, they will return an error rather
-    than a stale response.<p>These directives do not affect private caches; for
-    example, those in browsers."""
-    }
 
 class STALE_PROXY_REVALIDATE(Message):
     category = c.CACHING
@@ -1348,15 +818,6 @@ class STALE_PROXY_REVALIDATE(Message):
     summary = {
      'en': u"%(response)s cannot be served by a shared cache, because it is stale."
     }
-    text = {
-    'en': u"""The presence of the <code>Cache-Control: proxy-revalidate</code>
-    and/or <code>s-maxage</code> directives forbids shared caches (e.g., proxy
-    caches) from using stale responses to satisfy requests.<p>For example,
-    caches often use stale responses when they cannot connect to the origin
-    server; when this directive is present, they will return an error rather
-    than a stale response.<p>These directives do not affect private caches; for
-    example, those in browsers."""
-    }
 
 class CHECK_SINGLE(Message):
     category = c.CACHING
@@ -1364,15 +825,6 @@ class CHECK_SINGLE(Message):
     summary = {
      'en': u"Only one of the pre-check and post-check Cache-Control directives is present."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     %(response)s uses only one of these directives; as a result, Internet
-     Explorer will ignore the directive, since it requires both to be present.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class CHECK_NOT_INTEGER(Message):
     category = c.CACHING
@@ -1380,15 +832,6 @@ class CHECK_NOT_INTEGER(Message):
     summary = {
      'en': u"One of the pre-check/post-check Cache-Control directives has a non-integer value."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     Their values are required to be integers, but here at least one is not. As a
-     result, Internet Explorer will ignore the directive.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class CHECK_ALL_ZERO(Message):
     category = c.CACHING
@@ -1396,17 +839,6 @@ class CHECK_ALL_ZERO(Message):
     summary = {
      'en': u"The pre-check and post-check Cache-Control directives are both '0'."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     %(response)s gives a value of "0" for both; as a result, Internet
-     Explorer will ignore the directive, since it requires both to be present.<p>
-     In other words, setting these to zero has <strong>no effect</strong> (besides
-     wasting bandwidth), and may trigger bugs in some beta versions of IE.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class CHECK_POST_BIGGER(Message):
     category = c.CACHING
@@ -1414,16 +846,6 @@ class CHECK_POST_BIGGER(Message):
     summary = {
      'en': u"The post-check Cache-control directive's value is larger than pre-check's."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     %(response)s assigns a higher value to <code>post-check</code> than to
-     <code>pre-check</code>; this means that Internet Explorer will treat
-     <code>post-check</code> as if its value is the same as <code>pre-check</code>'s.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class CHECK_POST_ZERO(Message):
     category = c.CACHING
@@ -1431,16 +853,6 @@ class CHECK_POST_ZERO(Message):
     summary = {
      'en': u"The post-check Cache-control directive's value is '0'."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     %(response)s assigns a value of "0" to <code>post-check</code>, which means
-     that Internet Explorer will reload the content as soon as it enters the
-     browser cache, effectively <strong>doubling the load on the server</strong>.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 class CHECK_POST_PRE(Message):
     category = c.CACHING
@@ -1448,18 +860,6 @@ class CHECK_POST_PRE(Message):
     summary = {
      'en': u"%(response)s may be refreshed in the background by Internet Explorer."
     }
-    text = {
-     'en': u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
-     extensions, <code>pre-check</code> and <code>post-check</code>, to give
-     more control over how its cache stores responses.<p>
-     Once it has been cached for more than %(post-check)s seconds, a new request
-     will result in the cached response being served while it is refreshed in the
-     background. However, if it has been cached for more than %(pre-check)s seconds,
-     the browser will download a fresh response before showing it to the user.<p>
-     Note that these directives do not have any effect on other clients or caches.<p>
-     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
-     """
-    }
 
 
 ### ETag Validation
@@ -1470,14 +870,6 @@ class INM_304(Message):
     summary = {
     'en': u"If-None-Match conditional requests are supported."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has an <code>ETag</code>,
-    clients should be able to use an <code>If-None-Match</code> request header
-    for validation. RED has done this and found that the resource sends a
-    <code>304 Not Modified</code> response, indicating that it supports
-    <code>ETag</code> validation."""
-    }
 
 class INM_FULL(Message):
     category = c.VALIDATION
@@ -1485,14 +877,6 @@ class INM_FULL(Message):
     summary = {
     'en': u"An If-None-Match conditional request returned the full content unchanged."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has an <code>ETag</code>,
-    clients should be able to use an <code>If-None-Match</code> request header
-    for validation. RED has done this and found that the resource sends a full
-    response even though it hadn't changed, indicating that it doesn't support
-    <code>ETag</code> validation."""
-    }
 
 class INM_UNKNOWN(Message):
     category = c.VALIDATION
@@ -1500,14 +884,6 @@ class INM_UNKNOWN(Message):
     summary = {
      'en': u"An If-None-Match conditional request returned the full content, but it had changed."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has an <code>ETag</code>,
-    clients should be able to use an <code>If-None-Match</code> request header
-    for validation. RED has done this, but the response changed between the
-    original request and the validating request, so RED can't tell whether or
-    not <code>ETag</code> validation is supported."""
-    }
 
 class INM_STATUS(Message):
     category = c.VALIDATION
@@ -1515,14 +891,6 @@ class INM_STATUS(Message):
     summary = {
     'en': u"An If-None-Match conditional request returned a %(inm_status)s status."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has an <code>ETag</code>,
-    clients should be able to use an <code>If-None-Match</code> request header
-    for validation. RED has done this, but the response had a %(enc_inm_status)s
-    status code, so RED can't tell whether or not <code>ETag</code> validation
-    is supported."""
-    }
 
 ### Last-Modified Validation
 
@@ -1532,15 +900,6 @@ class IMS_304(Message):
     summary = {
     'en': u"If-Modified-Since conditional requests are supported."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has a
-    <code>Last-Modified</code> header, clients should be able to use an
-    <code>If-Modified-Since</code> request header for validation.<p>
-    RED has done this and found that the resource sends a
-    <code>304 Not Modified</code> response, indicating that it supports
-    <code>Last-Modified</code> validation."""
-    }
 
 class IMS_FULL(Message):
     category = c.VALIDATION
@@ -1548,15 +907,6 @@ class IMS_FULL(Message):
     summary = {
     'en': u"An If-Modified-Since conditional request returned the full content unchanged."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has a
-    <code>Last-Modified</code> header, clients should be able to use an
-    <code>If-Modified-Since</code> request header for validation.<p>
-    RED has done this and found that the resource sends a full response even
-    though it hadn't changed, indicating that it doesn't support
-    <code>Last-Modified</code> validation."""
-    }
 
 class IMS_UNKNOWN(Message):
     category = c.VALIDATION
@@ -1564,15 +914,6 @@ class IMS_UNKNOWN(Message):
     summary = {
      'en': u"An If-Modified-Since conditional request returned the full content, but it had changed."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has a
-    <code>Last-Modified</code> header, clients should be able to use an
-    <code>If-Modified-Since</code> request header for validation.<p>
-    RED has done this, but the response changed between the original request and
-    the validating request, so RED can't tell whether or not
-    <code>Last-Modified</code> validation is supported."""
-    }
 
 class IMS_STATUS(Message):
     category = c.VALIDATION
@@ -1580,15 +921,6 @@ class IMS_STATUS(Message):
     summary = {
     'en': u"An If-Modified-Since conditional request returned a %(ims_status)s status."
     }
-    text = {
-    'en': u"""HTTP allows clients to make conditional requests to see if a copy
-    that they hold is still valid. Since this response has a
-    <code>Last-Modified</code> header, clients should be able to use an
-    <code>If-Modified-Since</code> request header for validation.<p>
-    RED has done this, but the response had a %(enc_ims_status)s status code, so
-    RED can't tell whether or not <code>Last-Modified</code> validation is
-    supported."""
-    }
 
 ### Status checks
 
@@ -1598,19 +930,6 @@ class UNEXPECTED_CONTINUE(Message):
     summary = {
      'en': u"A 100 Continue response was sent when it wasn't asked for."
     }
-    text = {
-     'en': u"""HTTP allows clients to ask a server if a request with a body
-     (e.g., uploading a large file) will succeed before sending it, using
-     a mechanism called "Expect/continue".<p>
-     When used, the client sends an <code>Expect: 100-continue</code>, in
-     the request headers, and if the server is willing to process it, it
-     will send a <code> 100 Continue</code> status code to indicte that the
-     request should continue.<p>
-     This response has a <code>100 Continue</code> status code, but RED
-     did not ask for it (with the <code>Expect</code> request header). Sending
-     this status code without it being requested can cause interoperability
-     problems."""
-    }
 
 class UPGRADE_NOT_REQUESTED(Message):
     category = c.GENERAL
@@ -1618,16 +937,6 @@ class UPGRADE_NOT_REQUESTED(Message):
     summary = {
      'en': u"The protocol was upgraded without being requested."
     }
-    text = {
-     'en': u"""HTTP defines the <code>Upgrade</code> header as a means
-     of negotiating a change of protocol; i.e., it allows you to switch
-     the protocol on a given connection from HTTP to something else.<p>
-     However, it must be first requested by the client; this response
-     contains an <code>Upgrade</code> header, even though RED did not
-     ask for it.<p>
-     Trying to upgrade the connection without the client's participation
-     obviously won't work."""
-    }
 
 class CREATED_SAFE_METHOD(Message):
     category = c.GENERAL
@@ -1635,16 +944,6 @@ class CREATED_SAFE_METHOD(Message):
     summary = {
      'en': u"A new resource was created in response to a safe request."
     }
-    text = {
-     'en': u"""The <code>201 Created</code> status code indicates that
-     processing the request had the side effect of creating a new resource.<p>
-     However, the request method that RED used (%(method)s) is defined as
-     a "safe" method; that is, it should not have any side effects.<p>
-     Creating resources as a side effect of a safe method can have unintended
-     consequences; for example, search engine spiders and similar automated
-     agents often follow links, and intermediaries sometimes re-try safe
-     methods when they fail."""
-    }
 
 class CREATED_WITHOUT_LOCATION(Message):
     category = c.GENERAL
@@ -1652,12 +951,6 @@ class CREATED_WITHOUT_LOCATION(Message):
     summary = {
      'en': u"A new resource was created without its location being sent."
     }
-    text = {
-     'en': u"""The <code>201 Created</code> status code indicates that
-     processing the request had the side effect of creating a new resource.<p>
-     HTTP specifies that the URL of the new resource is to be indicated in
-     the <code>Location</code> header, but it isn't present in this response."""
-    }
 
 class CONTENT_RANGE_MEANINGLESS(Message):
     category = c.RANGE
@@ -1665,13 +958,6 @@ class CONTENT_RANGE_MEANINGLESS(Message):
     summary = {
       'en': u"%(response)s shouldn't have a Content-Range header."
     }
-    text = {
-      'en': u"""HTTP only defines meaning for the <code>Content-Range</code>
-      header in responses with a <code>206 Partial Content</code> or
-      <code>416 Requested Range Not Satisfiable</code> status code.<p>
-      Putting a <code>Content-Range</code> header in this response may
-      confuse caches and clients."""
-    }
 
 class PARTIAL_WITHOUT_RANGE(Message):
     category = c.GENERAL
@@ -1679,14 +965,6 @@ class PARTIAL_WITHOUT_RANGE(Message):
     summary = {
      'en': u"%(response)s doesn't have a Content-Range header."
     }
-    text = {
-     'en': u"""The <code>206 Partial Response</code> status code indicates that
-     the response body is only partial.<p>
-     However, for a response to be partial, it needs to have a
-     <code>Content-Range</code> header to indicate what part of the full
-     response it carries. This response does not have one, and as a result
-     clients won't be able to process it."""
-    }
 
 class PARTIAL_NOT_REQUESTED(Message):
     category = c.GENERAL
@@ -1694,13 +972,6 @@ class PARTIAL_NOT_REQUESTED(Message):
     summary = {
      'en': u"A partial response was sent when it wasn't requested."
     }
-    text = {
-     'en': u"""The <code>206 Partial Response</code> status code indicates that
-     the response body is only partial.<p>
-     However, the client needs to ask for it with the <code>Range</code> header.<p>
-     RED did not request a partial response; sending one without the client
-     requesting it leads to interoperability problems."""
-    }
 
 class REDIRECT_WITHOUT_LOCATION(Message):
     category = c.GENERAL
@@ -1708,11 +979,6 @@ class REDIRECT_WITHOUT_LOCATION(Message):
     summary = {
      'en': u"Redirects need to have a Location header."
     }
-    text = {
-     'en': u"""The %(enc_status)s status code redirects users to another URI. The
-     <code>Location</code> header is used to convey this URI, but a valid one
-     isn't present in this response."""
-    }
 
 class STATUS_DEPRECATED(Message):
     category = c.GENERAL
@@ -1720,10 +986,6 @@ class STATUS_DEPRECATED(Message):
     summary = {
      'en': u"The %(status)s status code is deprecated."
     }
-    text = {
-     'en': u"""When a status code is deprecated, it should not be used,
-     because its meaning is not well-defined enough to ensure interoperability."""
-    }
 
 class STATUS_RESERVED(Message):
     category = c.GENERAL
@@ -1731,10 +993,6 @@ class STATUS_RESERVED(Message):
     summary = {
      'en': u"The %(status)s status code is reserved."
     }
-    text = {
-     'en': u"""Reserved status codes can only be used by future, standard protocol
-     extensions; they are not for private use."""
-    }
 
 class STATUS_NONSTANDARD(Message):
     category = c.GENERAL
@@ -1742,12 +1000,6 @@ class STATUS_NONSTANDARD(Message):
     summary = {
      'en': u"%(status)s is not a standard HTTP status code."
     }
-    text = {
-     'en': u"""Non-standard status codes are not well-defined and interoperable.
-     Instead of defining your own status code, you should reuse one of the more
-     generic ones; for example, 400 for a client-side problem, or 500 for a
-     server-side problem."""
-    }
 
 class STATUS_BAD_REQUEST(Message):
     category = c.GENERAL
@@ -1755,9 +1007,6 @@ class STATUS_BAD_REQUEST(Message):
     summary = {
      'en': u"The server didn't understand the request."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_FORBIDDEN(Message):
     category = c.GENERAL
@@ -1765,9 +1014,6 @@ class STATUS_FORBIDDEN(Message):
     summary = {
      'en': u"The server has forbidden this request."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_NOT_FOUND(Message):
     category = c.GENERAL
@@ -1775,10 +1021,6 @@ class STATUS_NOT_FOUND(Message):
     summary = {
      'en': u"The resource could not be found."
     }
-    text = {
-     'en': u"""The server couldn't find any resource to serve for the
-     given URI."""
-    }
 
 class STATUS_NOT_ACCEPTABLE(Message):
     category = c.GENERAL
@@ -1786,9 +1028,6 @@ class STATUS_NOT_ACCEPTABLE(Message):
     summary = {
      'en': u"The resource could not be found."
     }
-    text = {
-     'en': u""""""
-    }
 
 class STATUS_CONFLICT(Message):
     category = c.GENERAL
@@ -1796,9 +1035,6 @@ class STATUS_CONFLICT(Message):
     summary = {
      'en': u"The request conflicted with the state of the resource."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_GONE(Message):
     category = c.GENERAL
@@ -1806,10 +1042,6 @@ class STATUS_GONE(Message):
     summary = {
      'en': u"The resource is gone."
     }
-    text = {
-     'en': u"""The server previously had a resource at the given URI, but it
-     is no longer there."""
-    }
 
 class STATUS_REQUEST_ENTITY_TOO_LARGE(Message):
     category = c.GENERAL
@@ -1817,10 +1049,6 @@ class STATUS_REQUEST_ENTITY_TOO_LARGE(Message):
     summary = {
      'en': u"The request body was too large for the server."
     }
-    text = {
-     'en': u"""The server rejected the request because the request body sent
-     was too large."""
-    }
 
 class STATUS_URI_TOO_LONG(Message):
     category = c.GENERAL
@@ -1828,10 +1056,6 @@ class STATUS_URI_TOO_LONG(Message):
     summary = {
     'en': u"The server won't accept a URI this long (%(uri_len)s characters)."
     }
-    text = {
-    'en': u"""The %(enc_status)s status code means that the server can't or won't accept
-    a request-uri this long."""
-    }
 
 class STATUS_UNSUPPORTED_MEDIA_TYPE(Message):
     category = c.GENERAL
@@ -1839,9 +1063,6 @@ class STATUS_UNSUPPORTED_MEDIA_TYPE(Message):
     summary = {
      'en': u"The resource doesn't support this media type in requests."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_INTERNAL_SERVICE_ERROR(Message):
     category = c.GENERAL
@@ -1849,9 +1070,6 @@ class STATUS_INTERNAL_SERVICE_ERROR(Message):
     summary = {
      'en': u"There was a general server error."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_NOT_IMPLEMENTED(Message):
     category = c.GENERAL
@@ -1859,9 +1077,6 @@ class STATUS_NOT_IMPLEMENTED(Message):
     summary = {
      'en': u"The server doesn't implement the request method."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_BAD_GATEWAY(Message):
     category = c.GENERAL
@@ -1869,9 +1084,6 @@ class STATUS_BAD_GATEWAY(Message):
     summary = {
      'en': u"An intermediary encountered an error."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_SERVICE_UNAVAILABLE(Message):
     category = c.GENERAL
@@ -1879,9 +1091,6 @@ class STATUS_SERVICE_UNAVAILABLE(Message):
     summary = {
      'en': u"The server is temporarily unavailable."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_GATEWAY_TIMEOUT(Message):
     category = c.GENERAL
@@ -1889,9 +1098,6 @@ class STATUS_GATEWAY_TIMEOUT(Message):
     summary = {
      'en': u"An intermediary timed out."
     }
-    text = {
-     'en': u""" """
-    }
 
 class STATUS_VERSION_NOT_SUPPORTED(Message):
     category = c.GENERAL
@@ -1899,19 +1105,16 @@ class STATUS_VERSION_NOT_SUPPORTED(Message):
     summary = {
      'en': u"The request HTTP version isn't supported."
     }
-    text = {
-     'en': u""" """
-    }
 
 if __name__ == '__main__':
     # do a sanity check on all of the defined messages
     import types
     for n, v in locals().items():
-        if type(v) is types.ClassType and issubclass(v, Message) and n != "Message":
+        if type(v) is MessageType and issubclass(v, Message) and n != "Message":
             print "checking", n
             assert v.category in c.__class__.__dict__.values(), n
             assert v.level in l.__class__.__dict__.values(), n
             assert type(v.summary) is types.DictType, n
             assert v.summary != {}, n
             assert type(v.text) is types.DictType, n
-            assert v.text != {}, n
+            assert type(message_text(v, 'en')) is types.UnicodeType, n
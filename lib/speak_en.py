@@ -0,0 +1,804 @@
+"""
+The long text of RED's messages, in English.
+
+Each is named after its Message class in redbot.speak, and may contain HTML
+and %(var)s style variable interpolation; see that module for details. This
+module is only imported when a message's text is first shown.
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2009-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+URI_TOO_LONG = u"Long URIs aren't supported by some implementations, including proxies. \
+    A reasonable upper size limit is 8192 characters."
+
+URI_BAD_SYNTAX = u"""This isn't a valid URI. Look for illegal characters \
+    and other problems; see <a href='http://www.ietf.org/rfc/rfc3986.txt'>RFC3986</a>
+    for more information."""
+
+FIELD_NAME_BAD_SYNTAX = u"Header names are limited to the TOKEN production in HTTP; i.e., \
+    they can't contain parenthesis, angle brackes (&lt;&gt;), ampersands (@), \
+    commas, semicolons, colons, backslashes (\\), forward slashes (/), quotes, \
+    square brackets ([]), question marks, equals signs (=), curly brackets ({}) \
+    spaces or tabs."
+
+HEADER_BLOCK_TOO_LARGE = u"""Some implementations have limits on the total size of headers
+    that they'll accept. For example, Squid's default configuration limits
+    header blocks to 20k."""
+
+HEADER_TOO_LARGE = u"""Some implementations limit the size of any single header line."""
+
+HEADER_NAME_ENCODING = u"""HTTP header field-names can only contain ASCII characters. RED
+     has detected (and possibly removed) non-ASCII characters in this header
+     name."""
+
+HEADER_VALUE_ENCODING = u"""HTTP headers use the ISO-8859-1 character set, but in most
+     cases are pure ASCII (a subset of this encoding).<p>
+     This header has non-ASCII characters, which RED has interpreted as
+     being encoded in ISO-8859-1. If another encoding is used (e.g., UTF-8),
+     the results may be unpredictable."""
+
+HEADER_DEPRECATED = u"""This header field is no longer recommended for use, because of
+    interoperability problems and/or lack of use. See
+    <a href="%(ref)s">its documentation</a> for more information."""
+
+SINGLE_HEADER_REPEAT = u"""This header is designed to only occur once in a message. When it
+    occurs more than once, a receiver needs to choose the one to use, which
+    can lead to interoperability problems, since different implementations may
+    make different choices.<p>
+    For the purposes of its tests, RED uses the last instance of the header that
+    is present; other implementations may behave differently."""
+
+BODY_NOT_ALLOWED = u"""HTTP defines a few special situations where a response does not
+     allow a body. This includes 101, 204 and 304 responses, as well as responses
+     to the <code>HEAD</code> method.<p>
+     %(response)s had a body, despite it being disallowed. Clients receiving
+     it may treat the body as the next response in the connection, leading to
+     interoperability and security issues."""
+
+BAD_SYNTAX = u"""The value for this header doesn't conform to its specified syntax; see
+    <a href="%(ref_uri)s">its definition</a> for more information.
+    """
+
+BAD_CC_SYNTAX = u"This value must be an integer."
+
+AGE_NOT_INT = u"""The <code>Age</code> header indicates the age of the response; i.e.,
+    how long it has been cached since it was generated. The value given was not
+    an integer, so it is not a valid age."""
+
+AGE_NEGATIVE = u"""The <code>Age</code> header indicates the age of the response; i.e.,
+    how long it has been cached since it was generated. The value given was
+    negative, so it is not a valid age."""
+
+BAD_CHUNK = u"""The response indicates it uses HTTP chunked encoding, but there
+     was a problem decoding the chunking.<p>
+     A valid chunk looks something like this:<p>
+     <code>[chunk-size in hex]\\r\\n[chunk-data]\\r\\n</code><p>
+     However, the chunk sent started like this:<p>
+     <code>%(chunk_sample)s</code><p>
+     This is a serious problem, because HTTP uses chunking to delimit one
+     response from the next one; incorrect chunking can lead to interoperability
+     and security problems.<p>
+     This issue is often caused by sending an integer chunk size instead of one
+     in hex, or by sending <code>Transfer-Encoding: chunked</code> without
+     actually chunking the response body."""
+
+BAD_GZIP = u"""GZip-compressed responses have a header that contains metadata.
+    %(response)s's header wasn't valid; the error encountered was
+    "<code>%(gzip_error)s</code>"."""
+
+BAD_ZLIB = u"""Compressed responses use zlib compression to reduce the number
+    of bytes transferred on the wire. However, this response could not be decompressed;
+    the error encountered was "<code>%(zlib_error)s</code>".<p>
+    %(ok_zlib_len)s bytes were decompressed successfully before this; the erroneous
+    chunk starts with "<code>%(chunk_sample)s</code>"."""
+
+ENCODING_UNWANTED = u"""%(response)s's <code>Content-Encoding</code> header indicates it
+     has the %(encoding)s content-coding applied, but RED didn't ask for it
+     to be.<p>
+     Normally, clients ask for the encodings they want in the
+     <code>Accept-Encoding</code> request header. Using encodings that the
+     client doesn't explicitly request can lead to interoperability problems."""
+
+TRANSFER_CODING_IDENTITY = u"""HTTP defines <em>transfer-codings</em> as a hop-by-hop encoding
+    of the message body. The <code>identity</code> tranfer-coding was defined
+    as the absence of encoding; it doesn't do anything, so it's necessary.<p>
+    You can remove this token to save a few bytes."""
+
+TRANSFER_CODING_UNWANTED = u"""%(response)s's <code>Transfer-Encoding</code> header indicates it
+     has the %(encoding)s transfer-coding applied, but RED didn't ask for it
+     to be.<p>
+     Normally, clients ask for the encodings they want in the
+     <code>TE</code> request header. Using codings that the
+     client doesn't explicitly request can lead to interoperability problems."""
+
+CONN_REUSED = u"""%(response)s was sent on a connection that stayed open after an
+     earlier request was complete, rather than on a new one.<p>
+     Persistent connections avoid the latency of setting up a new TCP
+     connection (and the associated slow start) for each request, and reduce
+     load on the server."""
+
+BAD_DATE_SYNTAX = u"""HTTP dates have very specific syntax, and sending an invalid date can
+    cause a number of problems, especially around caching. Common problems include
+    sending "1 May" instead of "01 May" (the month is a fixed-width field), and
+    sending a date in a timezone other than GMT. See
+    <a href="http://www.w3.org/Protocols/rfc2616/rfc2616-sec3.html#sec3.3">the
+    HTTP specification</a> for more information."""
+
+LM_FUTURE = u"""The <code>Last-Modified</code> header indicates the last point in
+    time that the resource has changed. %(response)s's
+    <code>Last-Modified</code> time is in the future, which doesn't have any
+    defined meaning in HTTP."""
+
+LM_PRESENT = u"""The <code>Last-Modified</code> header indicates the last point in
+    time that the resource has changed. It is used in HTTP for validating cached
+    responses, and for calculating heuristic freshness in caches.<p>
+    This resource last changed %(last_modified_string)s."""
+
+MIME_VERSION = u"""<code>MIME_Version</code> is a MIME header, not a HTTP header; it's
+    only used when HTTP messages are moved over MIME-based protocols
+    (e.g., SMTP), which is uncommon."""
+
+PRAGMA_NO_CACHE = u"""<code>Pragma</code> is a very old request header that is sometimes
+    used as a response header, even though this is not specified behaviour.
+    <code>Cache-Control: no-cache</code> is more appropriate."""
+
+PRAGMA_OTHER = u"""HTTP only defines <code>Pragma: no-cache</code>; other uses of
+    this header are deprecated."""
+
+VIA_PRESENT = u"""The <code>Via</code> header indicates that one or more
+    intermediaries are present between RED and the origin server for the
+    resource.<p>
+    This may indicate that a proxy is in between RED and the server, or that
+    the server uses a "reverse proxy" or CDN in front of it.<p>
+    %(via_list)s
+    <p>
+    There field has three space-separated components; first, the HTTP version
+    of the message that the intermediary received, then the identity of the
+    intermediary (usually but not always its hostname), and then optionally a
+    product identifier or comment (usually used to identify the software being
+    used)."""
+
+LOCATION_UNDEFINED = u"""The <code>Location</code> header is used for specific purposes
+     in HTTP; mostly to indicate the URI of another resource (e.g., in
+     redirection, or when a new resource is created).<p>
+     In other status codes (such as this one) it doesn't have a defined meaning,
+     so any use of it won't be interoperable.<p>
+     Sometimes <code>Location</code> is confused with <code>Content-Location</code>,
+     which indicates a URI for the payload of the message that it appears in."""
+
+LOCATION_NOT_ABSOLUTE = u"""<code>Location</code> is specified to contain an absolute,
+     not relative, URI.<p>
+     Most (but not all) clients will work around this, but since this field isn't
+     defined to take a relative URI, they may behave differently (for example,
+     if the body contains a base URI).</p>
+     The correct value for this field is (probably):<br>
+     <code>%(full_uri)s</code>"""
+
+CONTENT_TYPE_OPTIONS = u"""Many Web browers "sniff" the media type of responses to figure out
+     whether they're HTML, RSS or another format, no matter what the
+     <code>Content-Type</code> header says.<p>
+     This header instructs Microsoft's Internet Explorer not to do this, but to
+     always respect the Content-Type header. It probably won't have any effect in
+     other clients.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2008/09/02/ie8-security-part-vi-beta-2-update.aspx">this blog entry</a>
+     for more information about this header."""
+
+CONTENT_TYPE_OPTIONS_UNKNOWN = u"""Only one value is currently defined for this header, <code>nosniff</code>.
+     Using other values here won't necessarily cause problems, but they probably
+     won't have any effect either.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2008/09/02/ie8-security-part-vi-beta-2-update.aspx">this blog entry</a> for more information about this header."""
+
+DOWNLOAD_OPTIONS = u"""When the <code>X-Download-Options</code> header is present
+     with the value <code>noopen</code>, Internet Explorer users are prevented
+     from directly opening a file download; instead, they must first save the
+     file locally. When the locally saved file is later opened, it no longer
+     executes in the security context of your site, helping to prevent script
+     injection.<p>
+     This header probably won't have any effect in other clients.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-v-comprehensive-protection.aspx">this blog article</a> for more details."""
+
+DOWNLOAD_OPTIONS_UNKNOWN = u"""Only one value is currently defined for this header, <code>noopen</code>.
+     Using other values here won't necessarily cause problems, but they probably
+     won't have any effect either.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-v-comprehensive-protection.aspx">this blog article</a> for more details."""
+
+FRAME_OPTIONS_DENY = u"""The <code>X-Frame-Options</code> response header controls how
+     IE8 handles HTML frames; the <code>DENY</code> value prevents this content
+     from being rendered within a frame, which defends against certain types of
+     attacks.<p>
+     Currently this is supported by IE8 and Safari 4.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
+     """
+
+FRAME_OPTIONS_SAMEORIGIN = u"""The <code>X-Frame-Options</code> response header controls how
+     IE8 handles HTML frames; the <code>DENY</code> value prevents this content
+     from being rendered within a frame on another site, which defends against certain types of
+     attacks.<p>
+     Currently this is supported by IE8 and Safari 4.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
+     """
+
+FRAME_OPTIONS_UNKNOWN = u"""Only two values are currently defined for this header, <code>DENY</code>
+     and <code>SAMEORIGIN</code>.
+     Using other values here won't necessarily cause problems, but they probably
+     won't have any effect either.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2009/01/27/ie8-security-part-vii-clickjacking-defenses.aspx">this blog entry</a> for more information.
+     """
+
+SMART_TAG_NO_WORK = u"""This header doesn't have any effect on Microsoft Smart Tags,
+     except in certain beta versions of IE6. To turn them off, you'll need
+     to make changes in the HTML content it"""
+
+UA_COMPATIBLE = u"""Internet Explorer 8 allows responses to explicitly set the rendering
+     mode used for a given page (known a the "compatibility mode").<p>
+     See <a href="http://msdn.microsoft.com/en-us/library/cc288325(VS.85).aspx">Microsoft's documentation</a> for more information."""
+
+UA_COMPATIBLE_REPEAT = u"""Internet Explorer 8 allows responses to explicitly set the rendering mode
+     used for a page.<p>
+     This response has more than one such directive targetted at one browser;
+     this may cause unpredictable results.<p>
+     See <a href="http://msdn.microsoft.com/en-us/library/cc288325(VS.85).aspx">this blog entry</a> for more information."""
+
+XSS_PROTECTION = u"""Internet Explorer 8 has built-in Cross-Site Scripting (XSS)
+     attack protection; it tries to automatically filter requests that
+     fit a particular profile.<p>
+     %(response)s has explicitly disabled this protection. In some scenarios,
+     this is useful to do, if the protection interferes with the application.<p>
+     This header probably won't have any effect in other clients.<p>
+     See <a href="http://blogs.msdn.com/ie/archive/2008/07/02/ie8-security-part-iv-the-xss-filter.aspx">this blog entry</a> for more information.
+     """
+
+UNKNOWN_RANGE = u"""The <code>Accept-Ranges</code> response header tells clients
+     what <code>range-unit</code>s a resource is willing to process in future
+     requests. HTTP only defines two: <code>bytes</code> and <code>none</code>.
+     <p>
+     Clients who don't know about the non-standard range-unit will not be
+     able to use it."""
+
+RANGE_CORRECT = u"""This resource advertises support for ranged requests with
+    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
+    part of it should be sent. RED has tested this by requesting part
+    of this response, which was returned correctly."""
+
+RANGE_INCORRECT = u"""This resource advertises support for ranged requests with
+    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
+    part of the response should be sent. RED has tested this by requesting part
+    of this response, but the partial response doesn't correspond with the full
+    response retrieved at the same time. This could indicate that the range
+    implementation isn't working properly.
+    <p>RED sent<br/>
+    <code>Range: %(range)s</code>
+    <p>RED expected %(range_expected_bytes)s bytes:<br/>
+    <code>%(range_expected)s</code>
+    <p>RED received %(range_received_bytes)s bytes:<br/>
+    <code>%(range_received)s</code>"""
+
+RANGE_FULL = u"""This resource advertises support for ranged requests with
+    <code>Accept-Ranges</code>; that is, it allows clients to specify that only
+    part of the response should be sent. RED has tested this by requesting part
+    of this response, but the entire response was returned. In other words,
+    although the resource advertises support for partial content, it
+    doesn't appear to actually do so."""
+
+RANGE_STATUS = u"""This resource advertises support for ranged requests; that is, it allows
+    clients to specify that only part of the response should be sent. RED has tested
+    this by requesting part of this response, but a %(enc_range_status)s
+    response code was returned, which RED was not expecting."""
+
+RANGE_NEG_MISMATCH = u"""This resource supports ranged requests and also supports negotiation for
+     gzip compression, but doesn't support compression for both full and partial responses.<p>
+     This can cause problems for clients when they compare the partial and full responses,
+     since the partial response is expressed as a byte range, and compression changes the
+     bytes."""
+
+CL_CORRECT = u"""<code>Content-Length</code> is used by HTTP to delimit messages;
+    that is, to mark the end of one message and the beginning of the next. RED
+    has checked the length of the body and found the <code>Content-Length</code>
+    to be correct."""
+
+CL_INCORRECT = u"""<code>Content-Length</code> is used by HTTP to delimit messages;
+    that is, to mark the end of one message and the beginning of the next. RED
+    has checked the length of the body and found the <code>Content-Length</code>
+    is not correct. This can cause problems not only with connection handling,
+    but also caching, since an incomplete response is considered uncacheable.<p>
+    The actual body size sent was %(body_length)s bytes."""
+
+CMD5_CORRECT = u"""<code>Content-MD5</code> is a hash of the body, and can be used to
+    ensure integrity of the response. RED has checked its value and found it to
+    be correct."""
+
+CMD5_INCORRECT = u"""<code>Content-MD5</code> is a hash of the body, and can be used to
+    ensure integrity of the response. RED has checked its value and found it to
+    be incorrect; i.e., the given <code>Content-MD5</code> does not match what
+    RED thinks it should be (%(calc_md5)s)."""
+
+CONNEG_GZIP_GOOD = u"""HTTP supports compression of responses by negotiating for
+    <code>Content-Encoding</code>. When RED asked for a compressed response,
+    the resource provided one, saving %(savings)s%% of its original size
+    (from %(orig_size)s to %(gzip_size)s bytes).<p>
+    The compressed response's headers are displayed."""
+
+CONNEG_GZIP_BAD = u"""HTTP supports compression of responses by negotiating for
+    <code>Content-Encoding</code>. When RED asked for a compressed response,
+    the resource provided one, but it was %(savings)s%% <em>larger</em> than the original
+    response; from %(orig_size)s to %(gzip_size)s bytes.<p>
+    Often, this happens when the uncompressed response is very small, or can't be compressed
+    more; since gzip compression has some overhead, it can make the response larger. Turning compression
+    <strong>off</strong> for this resource may slightly improve response times and save 
+    bandwidth.<p>
+    The compressed response's headers are displayed."""
+
+CONNEG_NO_GZIP = u"""HTTP supports compression of responses by negotiating for
+    <code>Content-Encoding</code>. When RED asked for a compressed response,
+    the resource did not provide one."""
+
+CONNEG_NO_VARY = u"""All content negotiated responses need to have a
+    <code>Vary</code> header that reflects the header(s) used to select the
+    response.<p>
+    %(response)s was negotiated for <code>gzip</code> content encoding, so
+    the <code>Vary</code> header needs to contain <code>Accept-Encoding</code>,
+    the request header used."""
+
+CONNEG_GZIP_WITHOUT_ASKING = u"""HTTP supports compression of responses by negotiating for
+    <code>Content-Encoding</code>. Even though RED didn't ask for a compressed
+    response, the resource provided one anyway. Doing so can break clients that
+    aren't expecting a compressed response."""
+
+VARY_INCONSISTENT = u"""HTTP requires that the <code>Vary</code> response header be sent
+    consistently for all responses if they change based upon different aspects
+    of the request.<p>
+    This resource has both compressed and uncompressed variants
+    available, negotiated by the <code>Accept-Encoding</code> request header,
+    but it sends different Vary headers for each;<p>
+    <ul>
+      <li>"<code>%(conneg_vary)s</code>" when the response is compressed, and</li>
+      <li>"<code>%(no_conneg_vary)s</code>" when it is not.</li>
+    </ul>
+    <p>This can cause problems for downstream caches, because they
+    cannot consistently determine what the cache key for a given URI is."""
+
+ETAG_DOESNT_CHANGE = u"""HTTP requires that the <code>ETag</code>s for two different
+    responses associated with the same URI be different as well, to help caches
+    and other receivers disambiguate them.<p>
+    This resource, however, sent the same
+    ETag for both its compressed and uncompressed versions (negotiated by
+    <code>Accept-Encoding</code>. This can cause interoperability problems,
+    especially with caches."""
+
+DATE_CORRECT = u"""HTTP's caching model assumes reasonable synchronisation between
+    clocks on the server and client; using RED's local clock, the server's clock
+    appears to be well-synchronised."""
+
+DATE_INCORRECT = u"""Using RED's local clock, the server's clock does not appear to 
+    be well-synchronised.<p>
+    HTTP's caching model assumes reasonable synchronisation between
+    clocks on the server and client; clock skew can cause responses that
+    should be cacheable to be considered uncacheable (especially if their freshness
+    lifetime is short).<p>
+    Ask your server administrator to synchronise the clock, e.g., using 
+    <a href="http://en.wikipedia.org/wiki/Network_Time_Protocol" 
+    title="Network Time Protocol">NTP</a>.</p>
+    Apparent clock skew can also be caused by caching the response without adjusting
+    the <code>Age</code> header; e.g., in a reverse proxy or 
+    <abbr title="Content Delivery Network">CDN</abbr>. See 
+    <a href="http://www2.research.att.com/~edith/Papers/HTML/usits01/index.html">
+    this paper</a> for more information.
+    """
+
+AGE_PENALTY = u"""It appears that this response has been cached by a reverse proxy or 
+     <abbr title="Content Delivery Network">CDN</abbr>, because the <code>Age</code>
+     header is present, but the <code>Date</code> header is more recent than it indicates.<p>
+     Generally, reverse proxies should either omit the <code>Age</code> header (if they
+     have another means of determining how fresh the response is), or
+     leave the <code>Date</code> header alone (i.e., act as a normal HTTP cache).<p>
+     See <a href="http://www2.research.att.com/~edith/Papers/HTML/usits01/index.html">
+     this paper</a> for more information."""
+
+DATE_CLOCKLESS = u"""Although HTTP allowes a server not to send a <code>Date</code> header if it
+     doesn't have a local clock, this can make calculation of the response's age
+     inexact."""
+
+DATE_CLOCKLESS_BAD_HDR = u"""Because both the <code>Expires</code> and <code>Last-Modified</code>
+     headers are date-based, it's necessary to know when the message was generated
+     for them to be useful; otherwise, clock drift, transit times between nodes as
+     well as caching could skew their application."""
+
+METHOD_UNCACHEABLE = u""""""
+
+CC_MISCAP = u"""Cache-Control directive names are case-sensitive, and will not
+     be recognised by most implementations if the capitalisation is wrong.<p>
+     Did you mean to use %(cc_lower)s instead of %(cc)s?"""
+
+CC_DUP = u"""The %(cc)s Cache-Control directive is only defined to appear
+     once; it is used more than once here, so implementations may use different
+     instances (e.g., the first, or the last), making their behaviour
+     unpredictable."""
+
+NO_STORE = u"""The <code>Cache-Control: no-store</code> directive indicates that
+    this response can't be stored by a cache."""
+
+PRIVATE_CC = u"""The <code>Cache-Control: private</code> directive indicates that the
+    response can only be stored by caches that are specific to a single user; for
+    example, a browser cache. Shared caches, such as those in proxies, cannot store
+    it."""
+
+PRIVATE_AUTH = u"""Because the request was authenticated and this response doesn't contain
+    a <code>Cache-Control: public</code> directive, this response can only be
+    stored by caches that are specific to a single user; for example, a browser
+    cache. Shared caches, such as those in proxies, cannot store
+    it."""
+
+STOREABLE = u"""A cache can store this response; it may or may not be able to
+     use it to satisfy a particular request."""
+
+NO_CACHE = u"""The <code>Cache-Control: no-cache</code> directive means that
+     while caches <strong>can</strong> store this response, they cannot use
+     it to satisfy a request unless it has been validated (either with an
+     <code>If-None-Match</code> or <code>If-Modified-Since</code> conditional)
+     for that request.<p>"""
+
+NO_CACHE_NO_VALIDATOR = u"""The <code>Cache-Control: no-cache</code> directive means that
+     while caches <strong>can</strong> store this response, they cannot use
+     it to satisfy a request unless it has been validated (either with an
+     <code>If-None-Match</code> or <code>If-Modified-Since</code> conditional)
+     for that request.<p>
+     %(response)s doesn't have a <code>Last-Modified</code> or
+     <code>ETag</code> header, so it effectively can't be used by a cache."""
+
+VARY_ASTERISK = u"""<code>Vary *</code> indicates that responses for this resource vary
+    by some aspect that can't (or won't) be described by the server. This makes
+    this response effectively uncacheable."""
+
+VARY_USER_AGENT = u"""Sending <code>Vary: User-Agent</code> requires caches to store
+    a separate copy of the response for every <code>User-Agent</code> request
+    header they see.<p>
+    Since there are so many different <code>User-Agent</code>s, this can
+    "bloat" caches with many copies of the same thing, or cause them to give
+    up on storing these responses at all."""
+
+VARY_HOST = u"""Some servers (e.g., <a href="http://httpd.apache.org/">Apache</a>
+    with
+    <a href="http://httpd.apache.org/docs/2.0/mod/mod_rewrite.html">mod_rewrite</a>)
+    will send <code>Host</code> in the <code>Vary</code> header, in the belief
+    that since it affects how the server selects what to send back,
+    this is necessary.<p>
+    This is not the case; HTTP specifies that the URI is the basis of the cache
+    key, and the URI incorporates the <code>Host</code> header.<p>
+    The presence of <code>Vary: Host</code> may make some caches not store
+    an otherwise cacheable response (since some cache implementations will
+    not store anything that has a <code>Vary</code> header)."""
+
+VARY_COMPLEX = u"""The <code>Vary</code> mechanism allows a resource to describe the
+     dimensions that its responses vary, or change, over; each listed header
+     is another dimension.<p>Varying by too many dimensions makes using this
+     information impractical."""
+
+PUBLIC = u"""The <code>Cache-Control: public</code> directive
+     makes a response cacheable even when the request had an
+     <code>Authorization</code> header (i.e., HTTP authentication was in use).<p>
+     Additionally, <a href="http://firefox.org/">Firefox</a>'s cache
+     will store SSL-protected responses on disk when <code>public</code> is
+     present; otherwise, they are only cached in memory.<p>
+     <p>Therefore, SSL-protected or HTTP-authenticated (NOT cookie-authenticated)
+     resources <em>may</em> have use for <code>public</code> to improve
+     cacheability, if used judiciously.<p>
+     However, other responses <strong>do not need to contain <code>public</code>
+     </strong>; it does not make the response "more cacheable", and only
+     makes the headers larger."""
+
+CURRENT_AGE = u"""The <code>Age</code> header indicates the age of the response;
+    i.e., how long it has been cached since it was generated. HTTP takes this
+    as well as any apparent clock skew into account in computing how old the
+    response already is."""
+
+FRESHNESS_FRESH = u"""A response can be considered fresh when its age (here, %(current_age)s)
+    is less than its freshness lifetime (in this case, %(freshness_lifetime)s)."""
+
+FRESHNESS_STALE_CACHE = u"""An HTTP response is stale when its age (here, %(current_age)s)
+    is equal to or exceeds its freshness lifetime (in this case, %(freshness_lifetime)s).<p>
+    HTTP allows caches to use stale responses to satisfy requests only under exceptional 
+    circumstances; e.g., when they lose contact with the origin server. Either that has happened
+    here, or the cache has ignored the response's freshness directives."""
+
+FRESHNESS_STALE_ALREADY = u"""A cache considers a HTTP response stale when its age (here, %(current_age)s)
+    is equal to or exceeds its freshness lifetime (in this case, %(freshness_lifetime)s).<p>
+    HTTP allows caches to use stale responses to satisfy requests only under exceptional 
+    circumstances; e.g., when they lose contact with the origin server."""
+
+FRESHNESS_HEURISTIC = u"""When responses with certain status codes don't have explicit freshness information (like a <code>
+     Cache-Control: max-age</code> directive, or <code>Expires</code> header), caches are
+     allowed to estimate how fresh it is using a heuristic.<p>
+     Usually, but not always, this is done using the <code>Last-Modified</code> header. For
+     example, if your response was last modified a week ago, a cache might decide to consider
+     the response fresh for a day.<p>
+     Consider adding a <code>Cache-Control</code> header; otherwise, it may be cached for longer
+     or shorter than you'd like."""
+
+FRESHNESS_NONE = u"""%(response)s doesn't have explicit freshness information (like a <code>
+     Cache-Control: max-age</code> directive, or <code>Expires</code> header), and this
+     status code doesn't allow caches to calculate their own.<p>
+     Therefore, while caches may be allowed to store it, they can't use it, except in unusual 
+     cirucumstances, such a when the origin server can't be contacted.<p>
+     This behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
+     response directive.<p>
+     Note that many caches will not store the response at all, because it is not generally useful to do so.
+     """
+
+FRESH_SERVABLE = u"""HTTP allows stale responses to be served under some circumstances;
+    for example, if the origin server can't be contacted, a stale response can
+    be used (even if it doesn't have explicit freshness information).<p>
+    This behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
+    response directive."""
+
+STALE_SERVABLE = u"""HTTP allows stale responses to be served under some circumstances;
+    for example, if the origin server can't be contacted, a stale response can
+    be used (even if it doesn't have explicit freshness information).<p>This
+    behaviour can be prevented by using the <code>Cache-Control: must-revalidate</code>
+    response directive."""
+
+FRESH_MUST_REVALIDATE = u"""The <code>Cache-Control: must-revalidate</code> directive forbids
+    caches from using stale responses to satisfy requests.<p>For example,
+    caches often use stale responses when they cannot connect to the origin
+    server; when this directive is present, they will return an error rather
+    than a stale response."""
+
+STALE_MUST_REVALIDATE = u"""The <code>Cache-Control: must-revalidate</code> directive forbids
+    caches from using stale responses to satisfy requests.<p>For example,
+    caches often use stale responses when they cannot connect to the origin
+    server; when this directive is present, they will return an error rather
+    than a stale response."""
+
+FRESH_PROXY_REVALIDATE = u"""The presence of the <code>Cache-Control: proxy-revalidate</code>
+    and/or <code>s-maxage</code> directives forbids shared caches (e.g., proxy
+    caches) from using stale responses to satisfy requests.<p>For example,
+    caches often use stale responses when they cannot connect to the origin
+    server; when this directive is present, they will return an error rather
+    than a stale response.<p>These directives do not affect private caches; for
+    example, those in browsers."""
+
+STALE_PROXY_REVALIDATE = u"""The presence of the <code>Cache-Control: proxy-revalidate</code>
+    and/or <code>s-maxage</code> directives forbids shared caches (e.g., proxy
+    caches) from using stale responses to satisfy requests.<p>For example,
+    caches often use stale responses when they cannot connect to the origin
+    server; when this directive is present, they will return an error rather
+    than a stale response.<p>These directives do not affect private caches; for
+    example, those in browsers."""
+
+CHECK_SINGLE = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     %(response)s uses only one of these directives; as a result, Internet
+     Explorer will ignore the directive, since it requires both to be present.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+CHECK_NOT_INTEGER = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     Their values are required to be integers, but here at least one is not. As a
+     result, Internet Explorer will ignore the directive.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+CHECK_ALL_ZERO = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     %(response)s gives a value of "0" for both; as a result, Internet
+     Explorer will ignore the directive, since it requires both to be present.<p>
+     In other words, setting these to zero has <strong>no effect</strong> (besides
+     wasting bandwidth), and may trigger bugs in some beta versions of IE.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+CHECK_POST_BIGGER = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     %(response)s assigns a higher value to <code>post-check</code> than to
+     <code>pre-check</code>; this means that Internet Explorer will treat
+     <code>post-check</code> as if its value is the same as <code>pre-check</code>'s.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+CHECK_POST_ZERO = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     %(response)s assigns a value of "0" to <code>post-check</code>, which means
+     that Internet Explorer will reload the content as soon as it enters the
+     browser cache, effectively <strong>doubling the load on the server</strong>.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+CHECK_POST_PRE = u"""Microsoft Internet Explorer implements two <code>Cache-Control</code>
+     extensions, <code>pre-check</code> and <code>post-check</code>, to give
+     more control over how its cache stores responses.<p>
+     Once it has been cached for more than %(post-check)s seconds, a new request
+     will result in the cached response being served while it is refreshed in the
+     background. However, if it has been cached for more than %(pre-check)s seconds,
+     the browser will download a fresh response before showing it to the user.<p>
+     Note that these directives do not have any effect on other clients or caches.<p>
+     See <a href="http://blogs.msdn.com/ieinternals/archive/2009/07/20/Using-post_2D00_check-and-pre_2D00_check-cache-directives.aspx">this blog entry</a> for more information.
+     """
+
+INM_304 = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has an <code>ETag</code>,
+    clients should be able to use an <code>If-None-Match</code> request header
+    for validation. RED has done this and found that the resource sends a
+    <code>304 Not Modified</code> response, indicating that it supports
+    <code>ETag</code> validation."""
+
+INM_FULL = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has an <code>ETag</code>,
+    clients should be able to use an <code>If-None-Match</code> request header
+    for validation. RED has done this and found that the resource sends a full
+    response even though it hadn't changed, indicating that it doesn't support
+    <code>ETag</code> validation."""
+
+INM_UNKNOWN = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has an <code>ETag</code>,
+    clients should be able to use an <code>If-None-Match</code> request header
+    for validation. RED has done this, but the response changed between the
+    original request and the validating request, so RED can't tell whether or
+    not <code>ETag</code> validation is supported."""
+
+INM_STATUS = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has an <code>ETag</code>,
+    clients should be able to use an <code>If-None-Match</code> request header
+    for validation. RED has done this, but the response had a %(enc_inm_status)s
+    status code, so RED can't tell whether or not <code>ETag</code> validation
+    is supported."""
+
+IMS_304 = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has a
+    <code>Last-Modified</code> header, clients should be able to use an
+    <code>If-Modified-Since</code> request header for validation.<p>
+    RED has done this and found that the resource sends a
+    <code>304 Not Modified</code> response, indicating that it supports
+    <code>Last-Modified</code> validation."""
+
+IMS_FULL = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has a
+    <code>Last-Modified</code> header, clients should be able to use an
+    <code>If-Modified-Since</code> request header for validation.<p>
+    RED has done this and found that the resource sends a full response even
+    though it hadn't changed, indicating that it doesn't support
+    <code>Last-Modified</code> validation."""
+
+IMS_UNKNOWN = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has a
+    <code>Last-Modified</code> header, clients should be able to use an
+    <code>If-Modified-Since</code> request header for validation.<p>
+    RED has done this, but the response changed between the original request and
+    the validating request, so RED can't tell whether or not
+    <code>Last-Modified</code> validation is supported."""
+
+IMS_STATUS = u"""HTTP allows clients to make conditional requests to see if a copy
+    that they hold is still valid. Since this response has a
+    <code>Last-Modified</code> header, clients should be able to use an
+    <code>If-Modified-Since</code> request header for validation.<p>
+    RED has done this, but the response had a %(enc_ims_status)s status code, so
+    RED can't tell whether or not <code>Last-Modified</code> validation is
+    supported."""
+
+UNEXPECTED_CONTINUE = u"""HTTP allows clients to ask a server if a request with a body
+     (e.g., uploading a large file) will succeed before sending it, using
+     a mechanism called "Expect/continue".<p>
+     When used, the client sends an <code>Expect: 100-continue</code>, in
+     the request headers, and if the server is willing to process it, it
+     will send a <code> 100 Continue</code> status code to indicte that the
+     request should continue.<p>
+     This response has a <code>100 Continue</code> status code, but RED
+     did not ask for it (with the <code>Expect</code> request header). Sending
+     this status code without it being requested can cause interoperability
+     problems."""
+
+UPGRADE_NOT_REQUESTED = u"""HTTP defines the <code>Upgrade</code> header as a means
+     of negotiating a change of protocol; i.e., it allows you to switch
+     the protocol on a given connection from HTTP to something else.<p>
+     However, it must be first requested by the client; this response
+     contains an <code>Upgrade</code> header, even though RED did not
+     ask for it.<p>
+     Trying to upgrade the connection without the client's participation
+     obviously won't work."""
+
+CREATED_SAFE_METHOD = u"""The <code>201 Created</code> status code indicates that
+     processing the request had the side effect of creating a new resource.<p>
+     However, the request method that RED used (%(method)s) is defined as
+     a "safe" method; that is, it should not have any side effects.<p>
+     Creating resources as a side effect of a safe method can have unintended
+     consequences; for example, search engine spiders and similar automated
+     agents often follow links, and intermediaries sometimes re-try safe
+     methods when they fail."""
+
+CREATED_WITHOUT_LOCATION = u"""The <code>201 Created</code> status code indicates that
+     processing the request had the side effect of creating a new resource.<p>
+     HTTP specifies that the URL of the new resource is to be indicated in
+     the <code>Location</code> header, but it isn't present in this response."""
+
+CONTENT_RANGE_MEANINGLESS = u"""HTTP only defines meaning for the <code>Content-Range</code>
+      header in responses with a <code>206 Partial Content</code> or
+      <code>416 Requested Range Not Satisfiable</code> status code.<p>
+      Putting a <code>Content-Range</code> header in this response may
+      confuse caches and clients."""
+
+PARTIAL_WITHOUT_RANGE = u"""The <code>206 Partial Response</code> status code indicates that
+     the response body is only partial.<p>
+     However, for a response to be partial, it needs to have a
+     <code>Content-Range</code> header to indicate what part of the full
+     response it carries. This response does not have one, and as a result
+     clients won't be able to process it."""
+
+PARTIAL_NOT_REQUESTED = u"""The <code>206 Partial Response</code> status code indicates that
+     the response body is only partial.<p>
+     However, the client needs to ask for it with the <code>Range</code> header.<p>
+     RED did not request a partial response; sending one without the client
+     requesting it leads to interoperability problems."""
+
+REDIRECT_WITHOUT_LOCATION = u"""The %(enc_status)s status code redirects users to another URI. The
+     <code>Location</code> header is used to convey this URI, but a valid one
+     isn't present in this response."""
+
+STATUS_DEPRECATED = u"""When a status code is deprecated, it should not be used,
+     because its meaning is not well-defined enough to ensure interoperability."""
+
+STATUS_RESERVED = u"""Reserved status codes can only be used by future, standard protocol
+     extensions; they are not for private use."""
+
+STATUS_NONSTANDARD = u"""Non-standard status codes are not well-defined and interoperable.
+     Instead of defining your own status code, you should reuse one of the more
+     generic ones; for example, 400 for a client-side problem, or 500 for a
+     server-side problem."""
+
+STATUS_BAD_REQUEST = u""" """
+
+STATUS_FORBIDDEN = u""" """
+
+STATUS_NOT_FOUND = u"""The server couldn't find any resource to serve for the
+     given URI."""
+
+STATUS_NOT_ACCEPTABLE = u""""""
+
+STATUS_CONFLICT = u""" """
+
+STATUS_GONE = u"""The server previously had a resource at the given URI, but it
+     is no longer there."""
+
+STATUS_REQUEST_ENTITY_TOO_LARGE = u"""The server rejected the request because the request body sent
+     was too large."""
+
+STATUS_URI_TOO_LONG = u"""The %(enc_status)s status code means that the server can't or won't accept
+    a request-uri this long."""
+
+STATUS_UNSUPPORTED_MEDIA_TYPE = u""" """
+
+STATUS_INTERNAL_SERVICE_ERROR = u""" """
+
+STATUS_NOT_IMPLEMENTED = u""" """
+
+STATUS_BAD_GATEWAY = u""" """
+
+STATUS_SERVICE_UNAVAILABLE = u""" """
+
+STATUS_GATEWAY_TIMEOUT = u""" """
+
+STATUS_VERSION_NOT_SUPPORTED = u""" """
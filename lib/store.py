@@ -0,0 +1,473 @@
+#!/usr/bin/env python
+
+"""
+Storing and loading RED results.
+
+A result is stored as a file of JSON lines:
+  - a header, with the format version, the URI tested and how many linked
+    REDs follow,
+  - a record for the main RED,
+  - a record for each linked RED, with the tag that linked to it.
+
+Each record holds just the fields and messages that the formatters use.
+The main RED's body sample (if any) is stored alongside, in a file with
+body_suffix appended to the name.
+
+Loading only reads the header and the main RED; linked REDs and the body
+sample are read when they're first used.
+
+ResultCache keeps recent results in the same format, so that repeated checks
+of a URI can be answered without making any requests, and ResultWriter saves
+results in the background.
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import hashlib
+import os
+import Queue
+import tempfile
+import threading
+import time
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
+import nbhttp
+import redbot.speak as rs
+
+format_name = "redbot-result"
+format_version = 1
+body_suffix = ".body"
+pending_suffix = ".pending"
+pending_poll = 0.1 # seconds between checks for pending results
+
+# RedFetcher / ResourceExpertDroid attributes that are stored as-is
+red_fields = [
+    'uri', 'method', 'req_hdrs', 'orig_req_hdrs', 'type',
+    'req_ts', 'res_ts', 'res_done_ts',
+    'res_version', 'res_status', 'res_phrase', 'res_hdrs', 'parsed_hdrs',
+    'res_hdrs_len', 'res_transfer_len', 'res_body_len', 'res_body_decode_len',
+    'res_complete', 'res_error', 'timings',
+    'age', 'freshness_lifetime', 'stale_serveable',
+    'store_shared', 'store_private',
+    'ims_support', 'inm_support', 'gzip_support', 'gzip_savings',
+    'partial_support', 'link_count', 'links',
+]
+
+
+def save(red, path):
+    "Store red (and its linked REDs, if any) at path."
+    write_snapshot(snapshot(red), path)
+
+def snapshot(red):
+    """
+    Return everything about red (and its linked REDs) that gets stored,
+    for write_snapshot().
+    """
+    link_droids = getattr(red, 'link_droids', [])
+    records = [{
+        'format': format_name,
+        'version': format_version,
+        'uri': red.uri,
+        'link_droids': len(link_droids),
+    }, _red_record(red)]
+    for droid, tag in link_droids:
+        records.append({'tag': tag, 'red': _red_record(droid)})
+    return records, getattr(red, 'body_sample', None)
+
+def write_snapshot(snap, path):
+    "Write a snapshot() to path."
+    records, body_sample = snap
+    fd = open(path, 'w')
+    try:
+        for record in records:
+            _write(fd, record)
+    finally:
+        fd.close()
+    body_path = path + body_suffix
+    if body_sample is not None:
+        fd = open(body_path, 'wb')
+        try:
+            fd.write(body_sample)
+        finally:
+            fd.close()
+    elif os.path.exists(body_path):
+        os.remove(body_path)
+
+def load(path):
+    """
+    Load the result stored at path, returning a StoredRed. Raises IOError if
+    it can't be read, and ValueError if it isn't a result we understand.
+    """
+    fd = open(path)
+    try:
+        header = json.loads(fd.readline())
+        if header.get('format', None) != format_name:
+            raise ValueError, "not a stored result"
+        if header.get('version', None) != format_version:
+            raise ValueError, "unsupported result version %s" % \
+                header.get('version', None)
+        red = StoredRed(json.loads(fd.readline()), path)
+        red.link_droids_offset = fd.tell()
+    finally:
+        fd.close()
+    return red
+
+def touch(path, times):
+    """
+    Set the access and modification times of the result at path. If it's
+    still waiting to be written by a ResultWriter, they're set again once
+    it has been.
+    """
+    try:
+        fd = open(path + pending_suffix, 'r+')
+        try:
+            fd.write("%f %f" % times)
+        finally:
+            fd.close()
+    except IOError:
+        pass # not pending
+    os.utime(path, times)
+    if os.path.exists(path + body_suffix):
+        os.utime(path + body_suffix, times)
+
+
+class ResultCache(object):
+    """
+    A cache of results in cache_dir, keyed by the URI, method, request
+    headers and whether linked resources were checked (descend).
+
+    Results are served for ttl seconds after they were checked, and no more
+    than max_entries are kept; the least recently used are removed first.
+    An entry's mtime is when it was checked, and its atime when it was last
+    used.
+    """
+    suffix = ".red"
+
+    def __init__(self, cache_dir, ttl=300, max_entries=1000):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, uri, method, req_hdrs, descend):
+        "Return a StoredRed for the check, or None if there's no fresh one."
+        path = self._path(uri, method, req_hdrs, descend)
+        now = time.time()
+        try:
+            checked = os.stat(path).st_mtime
+            if now - checked > self.ttl:
+                self._remove(path)
+                return None
+            red = load(path)
+            os.utime(path, (now, checked))
+        except (OSError, IOError, ValueError, KeyError):
+            return None
+        return red
+
+    def put(self, red, uri, method, req_hdrs, descend):
+        "Cache red as the result of the check."
+        path = self._path(uri, method, req_hdrs, descend)
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            save(red, tmp_path)
+            if os.path.exists(tmp_path + body_suffix):
+                os.rename(tmp_path + body_suffix, path + body_suffix)
+            elif os.path.exists(path + body_suffix):
+                os.remove(path + body_suffix)
+            os.rename(tmp_path, path)
+        finally:
+            self._remove(tmp_path)
+        self._evict()
+
+    def _path(self, uri, method, req_hdrs, descend):
+        hdrs = [(n.strip().lower(), v.strip()) for (n, v) in req_hdrs]
+        hdrs.sort()
+        key = json.dumps(_jsonable([uri, method, hdrs, bool(descend)]))
+        return os.path.join(self.cache_dir,
+            hashlib.sha1(key.encode('utf-8')).hexdigest() + self.suffix)
+
+    def _evict(self):
+        "Remove the least recently used entries, if there are too many."
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.suffix):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((os.stat(path).st_atime, path))
+            except OSError:
+                pass # removed by someone else
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for atime, path in entries[:len(entries) - self.max_entries]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        for name in [path, path + body_suffix]:
+            try:
+                os.remove(name)
+            except OSError:
+                pass
+
+
+def wait_pending(path, timeout, done_cb):
+    """
+    Call done_cb once the result at path has been written, if it's pending,
+    waiting no more than timeout seconds; it's passed True if the result
+    isn't pending (any more), or False if it timed out.
+
+    Waiting is done on the event loop (which needs to be running if it's
+    pending), so that other work isn't held up; if it isn't pending,
+    done_cb is called straight away.
+    """
+    deadline = time.time() + timeout
+    def check():
+        if not os.path.exists(path + pending_suffix):
+            done_cb(True)
+        elif time.time() > deadline:
+            done_cb(False)
+        else:
+            nbhttp.schedule(pending_poll, check)
+    check()
+
+
+class ResultWriter(object):
+    """
+    Writes results in a background thread, so that saving them doesn't hold
+    up the response. While a result is waiting to be written, there's a
+    marker file next to it (with pending_suffix appended to its name).
+
+    No more than max_pending results wait at once; when there are already
+    that many, save() writes the result itself.
+    """
+    def __init__(self, max_pending=10):
+        self.queue = Queue.Queue(max_pending)
+        self._thread = None
+
+    def save(self, red, path):
+        "Store red at path, in the background if possible."
+        snap = snapshot(red)
+        open(path + pending_suffix, 'w').close()
+        try:
+            self.queue.put_nowait((snap, path))
+        except Queue.Full:
+            self._write(snap, path)
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run)
+            self._thread.setDaemon(True)
+            self._thread.start()
+
+    def wait(self):
+        "Block until everything waiting has been written."
+        self.queue.join()
+
+    def close(self):
+        """
+        Block until everything waiting has been written, and stop the
+        background thread (e.g., before exiting). A later save() starts
+        it again.
+        """
+        if self._thread is None:
+            return
+        self.queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            snap, path = item
+            try:
+                try:
+                    self._write(snap, path)
+                except (OSError, IOError, ValueError, TypeError):
+                    pass # we don't cry if we can't store it.
+            finally:
+                self.queue.task_done()
+
+    @staticmethod
+    def _write(snap, path):
+        pending = path + pending_suffix
+        try:
+            write_snapshot(snap, path)
+            # apply any times set by touch() while we were waiting
+            fd = open(pending)
+            try:
+                times = fd.read().split()
+            finally:
+                fd.close()
+            if times:
+                atime, mtime = [float(t) for t in times]
+                os.utime(path, (atime, mtime))
+                if os.path.exists(path + body_suffix):
+                    os.utime(path + body_suffix, (atime, mtime))
+        finally:
+            try:
+                os.remove(pending)
+            except OSError:
+                pass
+
+
+class StoredObject(object):
+    "A plain object with the given attributes."
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+class StoredRed(object):
+    """
+    A RED loaded from a stored result. It has the same attributes as the
+    RED it was made from, as far as the formatters are concerned.
+    """
+    def __init__(self, record, path=None):
+        for name in red_fields:
+            setattr(self, name, record.get(name, None))
+        for name in ['req_hdrs', 'orig_req_hdrs', 'res_hdrs']:
+            setattr(self, name, [tuple(h) for h in getattr(self, name) or []])
+        self.links = dict([(tag, set(links)) for (tag, links) in
+                           (self.links or {}).items()])
+        link_parser = record.get('link_parser', None)
+        if link_parser is not None:
+            self.link_parser = StoredObject(**_str_keys(link_parser))
+        self.session = StoredObject(
+            total_requests=record.get('total_requests', 0),
+            pool=None
+        )
+        subreqs = [StoredObject(type=sr['type'], messages=[]) for sr in
+                   record.get('subreqs', [])]
+        for sr, sr_record in zip(subreqs, record.get('subreqs', [])):
+            sr.messages = [_load_message(m, []) for m in
+                           sr_record['messages']]
+        self.messages = [_load_message(m, subreqs) for m in
+                         record.get('messages', [])]
+        self.path = path
+        self.link_droids_offset = None
+        self._link_droids = None
+        self._body_sample = None
+
+    @property
+    def link_droids(self):
+        if self._link_droids is None:
+            self._link_droids = []
+            if self.path is not None and self.link_droids_offset is not None:
+                fd = open(self.path)
+                try:
+                    fd.seek(self.link_droids_offset)
+                    for line in fd:
+                        record = json.loads(line)
+                        self._link_droids.append(
+                            (StoredRed(record['red']), record['tag'])
+                        )
+                finally:
+                    fd.close()
+        return self._link_droids
+
+    @property
+    def body_sample(self):
+        if self._body_sample is None:
+            try:
+                fd = open(self.path + body_suffix, 'rb')
+            except (IOError, TypeError): # no sample (or no path)
+                raise AttributeError, "body_sample"
+            try:
+                self._body_sample = fd.read()
+            finally:
+                fd.close()
+        return self._body_sample
+
+
+def _write(fd, obj):
+    fd.write(json.dumps(_jsonable(obj), separators=(',', ':')))
+    fd.write("\n")
+
+def _red_record(red):
+    "Return a dictionary of the parts of red to store."
+    record = {}
+    for name in red_fields:
+        record[name] = getattr(red, name, None)
+    link_parser = getattr(red, 'link_parser', None)
+    if link_parser is not None:
+        record['link_parser'] = {
+            'base': link_parser.base,
+            'http_enc': link_parser.http_enc,
+            'doc_enc': link_parser.doc_enc,
+        }
+    record['total_requests'] = red.session.total_requests
+    subreqs = []
+    for msg in red.messages:
+        if msg.subrequest is not None and msg.subrequest not in subreqs:
+            subreqs.append(msg.subrequest)
+    record['subreqs'] = [{
+        'type': sr.type,
+        'messages': [_message_record(m, []) for m in sr.messages]
+    } for sr in subreqs]
+    record['messages'] = [_message_record(m, subreqs) for m in red.messages]
+    return record
+
+def _message_record(msg, subreqs):
+    if msg.subrequest in subreqs:
+        subreq = subreqs.index(msg.subrequest)
+    else:
+        subreq = None
+    return {
+        'class': msg.__class__.__name__,
+        'subject': msg.subject,
+        'vars': msg.vars,
+        'response_type': msg.response_type,
+        'subreq': subreq,
+    }
+
+def _load_message(record, subreqs):
+    msg_class = rs.message_classes[record['class']]
+    if record['subreq'] is not None:
+        subreq = subreqs[record['subreq']]
+    else:
+        subreq = None
+    return msg_class(record['subject'], subreq, _str_keys(record['vars']),
+                     record['response_type'])
+
+def _str_keys(dictionary):
+    "JSON gives unicode keys, which can't be used as keyword arguments."
+    return dict([(str(k), v) for (k, v) in dictionary.items()])
+
+def _jsonable(obj):
+    "Make obj safe to serialise as JSON."
+    if isinstance(obj, str):
+        return obj.decode('utf-8', 'replace')
+    if isinstance(obj, dict):
+        return dict([(_jsonable(k), _jsonable(v)) for (k, v) in obj.items()])
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(i) for i in obj]
+    if isinstance(obj, (set, frozenset)):
+        return [_jsonable(i) for i in sorted(obj)]
+    return obj
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+"""
+Tests for batch mode in the command-line interface (bin/redbot).
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import imp
+import os
+import socket
+import unittest
+
+import nbhttp
+import nbhttp.error
+
+cli = imp.load_source('redbot_cli',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 '..', 'bin', 'redbot'))
+
+# nbhttp can't fetch these, so the request fails as soon as it's made.
+failing_uri = u"https://www.example.com/"
+
+page = "<html><body><p>Hello.</p></body></html>"
+
+
+def free_port():
+    "Return a local port that nothing is listening on."
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+def handle(method, uri, req_hdrs, res_start, req_pause):
+    "Answer every request with page."
+    def req_done(err):
+        res_body, res_done = res_start("200", "OK", [
+            ("Content-Type", "text/html"),
+            ("Content-Length", str(len(page))),
+            ("Cache-Control", "max-age=60"),
+        ], nbhttp.dummy)
+        res_body(page)
+        res_done(None)
+    return nbhttp.dummy, req_done
+
+
+class BatchTest(unittest.TestCase):
+    port = None
+
+    def setUp(self):
+        if BatchTest.port is None:
+            BatchTest.port = free_port()
+            nbhttp.Server("127.0.0.1", BatchTest.port, handle)
+        self.good_uri = u"http://127.0.0.1:%s/" % BatchTest.port
+
+    def check(self, uris, concurrency=10):
+        "Check uris in batch mode; return the checker and [(uri, red)]."
+        results = []
+        checker = cli.BatchChecker(uris,
+            lambda uri, red, elapsed: results.append((uri, red)),
+            concurrency=concurrency, timeout=10)
+        checker.run()
+        return checker, results
+
+    def test_mixed(self):
+        uris = [self.good_uri + "a", failing_uri, self.good_uri + "b",
+                failing_uri + "c", self.good_uri + "d"]
+        for concurrency in [1, 10]:
+            checker, results = self.check(uris, concurrency)
+            self.assertEqual(sorted([uri for (uri, red) in results]),
+                             sorted(uris))
+            self.assertEqual(checker.checked, len(uris))
+            self.assertEqual(checker.failed, 2)
+            for uri, red in results:
+                self.assertTrue(red is not None)
+                if uri.startswith(failing_uri):
+                    self.assertEqual(cli.check_error(red),
+                                     nbhttp.error.ERR_URL["desc"])
+                else:
+                    self.assertEqual(cli.check_error(red), None)
+                    self.assertEqual(red.res_status, "200")
+
+    def test_all_failing(self):
+        uris = [failing_uri + str(i) for i in range(50)]
+        checker, results = self.check(uris)
+        self.assertEqual(len(results), len(uris))
+        self.assertEqual(checker.failed, len(uris))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+"""
+Tests for fetching (redbot.fetch).
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import unittest
+
+import redbot.speak as rs
+from redbot import droid, fetch
+
+
+class StubConn(object):
+    "Just enough of a TCP connection for the ConnectionPool."
+    tcp_connected = True
+
+    def close(self):
+        self.tcp_connected = False
+
+
+class ConnReuseTest(unittest.TestCase):
+    def setUp(self):
+        # the pool never lets these requests be sent.
+        self.session = fetch.RedSession(
+            pool=fetch.ConnectionPool(max_per_host=0))
+        self.red = droid.ResourceExpertDroid(
+            u"http://www.example.com/", session=self.session)
+        self.sub = droid.SubRequest(self.red, [], "conneg")
+        self.conn = StubConn()
+
+    def reuse_messages(self, fetcher):
+        return [m for m in fetcher.messages if isinstance(m, rs.CONN_REUSED)]
+
+    def test_subrequest_opens(self):
+        self.sub._conn_used(self.conn)
+        self.red._conn_used(self.conn)
+        self.assertTrue(self.red.conn_reused)
+        self.assertEqual(self.sub.conn_reuses, 1)
+        messages = self.reuse_messages(self.red)
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].subrequest, None)
+
+    def test_red_opens(self):
+        self.red._conn_used(self.conn)
+        self.sub._conn_used(self.conn)
+        self.assertTrue(self.sub.conn_reused)
+        messages = self.reuse_messages(self.red)
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].subrequest, self.sub)
+        self.assertEqual(messages[0].show_summary('en'),
+            u"The uncompressed response's connection was reused.")
+
+    def test_reported_once(self):
+        other = droid.SubRequest(self.red, [], "range")
+        self.red._conn_used(self.conn)
+        self.sub._conn_used(self.conn)
+        other._conn_used(self.conn)
+        self.assertEqual(len(self.reuse_messages(self.red)), 1)
+        self.assertEqual(self.session.pool.reused, 2)
+
+    def test_new_connection(self):
+        self.red._conn_used(self.conn)
+        self.sub._conn_used(StubConn())
+        self.assertFalse(self.red.conn_reused)
+        self.assertFalse(self.sub.conn_reused)
+        self.assertEqual(self.reuse_messages(self.red), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
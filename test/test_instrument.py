@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Tests for profiling (redbot.instrument).
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import unittest
+
+from redbot import instrument
+
+
+class ReportTest(unittest.TestCase):
+    def setUp(self):
+        instrument.enable()
+        instrument.reset()
+
+    def tearDown(self):
+        instrument.enable(False)
+        instrument.reset()
+
+    def test_since(self):
+        instrument.call("first", len, "a")
+        instrument.count("bytes", 10)
+        start = instrument.snapshot()
+        instrument.call("second", len, "b")
+        instrument.call("second", len, "c")
+        instrument.count("bytes", 5)
+        report = instrument.report(start)
+        self.assertEqual(sorted(report.keys()), ["bytes", "second"])
+        self.assertEqual(report["second"]["calls"], 2)
+        self.assertEqual(report["bytes"]["count"], 5)
+        report = instrument.report()
+        self.assertEqual(report["first"]["calls"], 1)
+        self.assertEqual(report["bytes"]["count"], 15)
+
+    def test_nothing_since(self):
+        instrument.call("first", len, "a")
+        self.assertEqual(instrument.report(instrument.snapshot()), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
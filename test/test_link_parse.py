@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+"""
+Tests for the link parsers.
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import unittest
+
+from redbot import link_parse
+
+
+class StubResponse(object):
+    "Just enough of a RedFetcher for the link parsers."
+    parsed_hdrs = {'content-type': ('text/html', {'charset': 'utf-8'})}
+
+
+# documents that both parsers should find the same links in
+documents = [
+    # an apostrophe in an unquoted value doesn't start a quoted one
+    """<img alt=Don't src=/a.png><img src='/b.png'><a href="/c">c</a>""",
+    """<a href="/x" title="it's > here">x</a>
+       <a href='/y' title='say "hi"'>y</a>""",
+    """<a href = "/spaced" >s</a><a href=/unquoted/ title=plain>u</a>
+       <link rel=stylesheet href="/s.css"/><a href>empty</a><a title>t</a>""",
+    """<A HREF='/upper' TITLE=" padded ">x</A>
+       <a href="/q?a=1&amp;b=2&eacute;&#233;&#x41;&bogus;#frag">e</a>""",
+    """<!-- <a href="/commented"> --><a href="/after-comment">a</a>
+       <script>document.write('<a href="/in-script">');</script >
+       <style>a > b { color: red; }</style><img src="/after-style.png">""",
+    """<html><head><META HTTP-EQUIV="Content-Type"
+       content="text/html; charset=iso-8859-1">
+       <base href="http://other.example/dir/"></head>
+       <iframe src="/f"></iframe><abbr title="x">y</abbr><a name=n>n</a>""",
+    """<img alt="unterminated src=/lost.png><a href="/lost">""",
+]
+
+
+def parse(kind, document, chunk_size):
+    "Parse document with a kind parser, chunk_size characters at a time."
+    links = []
+    parser = link_parse.parsers[kind]("http://www.example.com/",
+        lambda link, tag, title: links.append((link, tag, title)), None)
+    for i in xrange(0, len(document), chunk_size):
+        parser.feed(StubResponse(), document[i:i + chunk_size])
+    return links, parser.base, parser.doc_enc, parser.errors
+
+
+class ParityTest(unittest.TestCase):
+    "The scanner should find the same links as HTMLParser."
+
+    def test_documents(self):
+        for document in documents:
+            expected = parse('htmlparser', document, len(document))
+            for chunk_size in [len(document), 1, 7, 64]:
+                self.assertEqual(
+                    parse('scan', document, chunk_size), expected,
+                    "%r in %i character chunks" % (document, chunk_size))
+
+    def test_unquoted_apostrophe(self):
+        links = parse('scan', documents[0], len(documents[0]))[0]
+        self.assertEqual([link for (link, tag, title) in links],
+                         [u"/a.png", u"/b.png", u"/c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+"""
+Tests for the Web UI (bin/webui.py).
+"""
+
+__author__ = "Mark Nottingham <mnot@mnot.net>"
+__copyright__ = """\
+Copyright (c) 2008-2010 Mark Nottingham
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import imp
+import os
+import shutil
+import tempfile
+import unittest
+
+import nbhttp
+from redbot import droid, store
+
+webui = imp.load_source('webui',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 '..', 'bin', 'webui.py'))
+
+# nbhttp can't fetch these, so the request fails as soon as it's made.
+failing_uri = u"https://www.example.com/"
+
+
+class WebUiTest(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+        webui.save_dir = self.save_dir
+        webui.cache_dir = None
+
+    def tearDown(self):
+        webui.result_writer.wait()
+        shutil.rmtree(self.save_dir)
+
+    def run_ui(self, test_id=None, test_uri=None, done_cb=None):
+        "Run a RedWebUi; return its status, body and the RedWebUi itself."
+        status = []
+        body = self.body = []
+        ui = webui.RedWebUi(test_id, test_uri, [], "/", "html",
+            lambda code, hdrs: status.append(code), body.append,
+            done_cb=done_cb)
+        self.assertEqual(len(status), 1)
+        return status[0], "".join(body), ui
+
+    def test_immediate_failure(self):
+        status, body, ui = self.run_ui(test_uri=failing_uri)
+        self.assertEqual(status, "200 OK")
+        self.assertTrue(ui.finished)
+        self.assertTrue("can't fetch that URL" in body)
+
+    def test_immediate_failure_with_done_cb(self):
+        calls = []
+        def done():
+            calls.append(True)
+            nbhttp.stop()
+        status, body, ui = self.run_ui(test_uri=failing_uri, done_cb=done)
+        nbhttp.run()
+        self.assertEqual(calls, [True])
+        self.assertTrue("can't fetch that URL" in "".join(self.body))
+
+    def test_immediate_failure_bad_syntax(self):
+        # the RED's checks of the URI are in the result
+        test_uri = u"https://www.example.com:port/" + u"a" * droid.max_uri
+        status, body, ui = self.run_ui(test_uri=test_uri)
+        self.assertTrue("can't fetch that URL" in body)
+        webui.result_writer.wait()
+        red = store.load(os.path.join(self.save_dir, self.saved()[0]))
+        messages = [m.__class__.__name__ for m in red.messages]
+        self.assertTrue("URI_BAD_SYNTAX" in messages)
+        self.assertTrue("URI_TOO_LONG" in messages)
+
+    def test_close_result_writer(self):
+        # close() writes what's waiting and stops the writer's thread
+        self.run_ui(test_uri=failing_uri)
+        thread = webui.result_writer._thread
+        self.assertTrue(thread.isAlive())
+        webui.result_writer.close()
+        self.assertFalse(thread.isAlive())
+        self.assertEqual(len(self.saved()), 1)
+        self.run_ui(test_uri=failing_uri) # saving starts it again
+        webui.result_writer.close()
+        self.assertEqual(len(self.saved()), 2)
+
+    def test_save_cached_result(self):
+        webui.cache_dir = tempfile.mkdtemp()
+        try:
+            self.run_ui(test_uri=failing_uri)
+            self.assertTrue(os.listdir(webui.cache_dir))
+            before = set(self.saved())
+            status, body, ui = self.run_ui(test_uri=failing_uri) # cache hit
+            webui.result_writer.wait()
+            new = list(set(self.saved()) - before)
+            self.assertEqual(len(new), 1)
+            self.assertTrue(
+                os.path.getsize(os.path.join(self.save_dir, new[0])) > 0)
+            status, body, ui = self.run_ui(test_id=new[0])
+            self.assertEqual(status, "200 OK")
+            self.assertTrue("can't fetch that URL" in body)
+        finally:
+            shutil.rmtree(webui.cache_dir)
+
+    def test_pending_result(self):
+        # waiting for a result to be written doesn't hold up the loop
+        self.run_ui(test_uri=failing_uri)
+        webui.result_writer.wait()
+        test_id = self.saved()[0]
+        pending = os.path.join(self.save_dir, test_id) + store.pending_suffix
+        open(pending, 'w').close()
+        events = []
+        def written():
+            events.append("written")
+            os.remove(pending)
+        def shown():
+            events.append("shown")
+            nbhttp.stop()
+        nbhttp.schedule(0.3, written)
+        body = []
+        ui = webui.RedWebUi(test_id, None, [], "/", "html",
+            lambda code, hdrs: None, body.append, done_cb=shown)
+        self.assertFalse(ui.finished)
+        nbhttp.run()
+        self.assertEqual(events, ["written", "shown"])
+        self.assertTrue("can't fetch that URL" in "".join(body))
+
+    def saved(self):
+        "Return the ids of the results in save_dir."
+        return [name for name in os.listdir(self.save_dir)
+                if "." not in name]
+
+
+if __name__ == "__main__":
+    unittest.main()